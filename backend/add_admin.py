@@ -0,0 +1,25 @@
+import sys
+from sqlalchemy import text
+from app.database import engine
+
+# 사용법: python add_admin.py [관리자로 지정할 이메일]
+with engine.connect() as conn:
+    try:
+        # users에 is_admin 컬럼 추가 (기존 사용자는 모두 일반 사용자)
+        conn.execute(text(
+            "ALTER TABLE users ADD COLUMN is_admin INTEGER NOT NULL DEFAULT 0"
+        ))
+        conn.commit()
+        print("✅ is_admin 컬럼이 추가되었습니다!")
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ 오류: {e}")
+        print("이미 컬럼이 존재하거나 다른 문제가 있습니다.")
+
+    if len(sys.argv) > 1:
+        result = conn.execute(text("UPDATE users SET is_admin = 1 WHERE email = :email"), {"email": sys.argv[1]})
+        conn.commit()
+        if result.rowcount:
+            print(f"✅ {sys.argv[1]} 사용자가 관리자로 지정되었습니다!")
+        else:
+            print(f"❌ {sys.argv[1]} 사용자를 찾을 수 없습니다.")
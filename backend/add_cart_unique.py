@@ -0,0 +1,26 @@
+from sqlalchemy import text
+from app.database import engine
+
+with engine.connect() as conn:
+    try:
+        # 같은 사용자/상품 중복 행을 하나로 합침 (수량 합산, 가장 먼저 담은 행 유지)
+        conn.execute(text("""
+            UPDATE cart_items SET quantity = (
+                SELECT SUM(c.quantity) FROM cart_items c
+                WHERE c.user_id = cart_items.user_id AND c.product_id = cart_items.product_id
+            )
+            WHERE id IN (SELECT MIN(id) FROM cart_items GROUP BY user_id, product_id HAVING COUNT(*) > 1)
+        """))
+        conn.execute(text("""
+            DELETE FROM cart_items
+            WHERE id NOT IN (SELECT MIN(id) FROM cart_items GROUP BY user_id, product_id)
+        """))
+        # 게스트 장바구니 병합 upsert에 필요한 unique 인덱스
+        conn.execute(text(
+            "CREATE UNIQUE INDEX uq_cart_items_user_product ON cart_items (user_id, product_id)"
+        ))
+        conn.commit()
+        print("✅ cart_items (user_id, product_id) unique 인덱스가 추가되었습니다!")
+    except Exception as e:
+        print(f"❌ 오류: {e}")
+        print("이미 인덱스가 존재하거나 다른 문제가 있습니다.")
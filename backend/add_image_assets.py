@@ -0,0 +1,19 @@
+from sqlalchemy import text
+from app.database import engine
+from app.models import Base
+
+# image_assets 테이블 생성
+Base.metadata.create_all(bind=engine)
+
+with engine.connect() as conn:
+    try:
+        # product_images에 asset_id 컬럼 추가
+        # - 기존 이미지는 원본 파일이 없어 해시를 계산할 수 없으므로 NULL로 남김
+        conn.execute(text(
+            "ALTER TABLE product_images ADD COLUMN asset_id INTEGER REFERENCES image_assets(id)"
+        ))
+        conn.commit()
+        print("✅ asset_id 컬럼이 추가되었습니다!")
+    except Exception as e:
+        print(f"❌ 오류: {e}")
+        print("이미 컬럼이 존재하거나 다른 문제가 있습니다.")
@@ -0,0 +1,24 @@
+from app.database import SessionLocal, engine
+from app.models import Base, ProductImage, ProductImageVariant
+from app.images import build_variants
+
+# product_image_variants 테이블 생성
+Base.metadata.create_all(bind=engine)
+
+db = SessionLocal()
+try:
+    # 변형이 없는 기존 이미지에 썸네일/카드/상세 변형 추가
+    # - 원본 크기를 모르므로 height는 NULL (Cloudinary가 비율 유지)
+    images = db.query(ProductImage).filter(~ProductImage.variants.any()).all()
+    added = 0
+    for image in images:
+        for variant in build_variants(image.image_url):
+            db.add(ProductImageVariant(image_id=image.id, **variant))
+            added += 1
+    db.commit()
+    print(f"✅ {len(images)}개 이미지에 {added}개 변형이 추가되었습니다!")
+except Exception as e:
+    db.rollback()
+    print(f"❌ 오류: {e}")
+finally:
+    db.close()
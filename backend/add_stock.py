@@ -0,0 +1,18 @@
+from sqlalchemy import text
+from app.database import engine
+from app.models import Base
+
+# product_options 테이블 생성
+Base.metadata.create_all(bind=engine)
+
+with engine.connect() as conn:
+    for table, column in (("products", "stock INTEGER"), ("order_items", "size VARCHAR(20)")):
+        try:
+            # 기존 상품은 NULL → 재고 관리 안 함 (지금처럼 무제한 판매)
+            conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column}"))
+            conn.commit()
+            print(f"✅ {table}.{column.split()[0]} 컬럼이 추가되었습니다!")
+        except Exception as e:
+            conn.rollback()
+            print(f"❌ 오류: {e}")
+            print("이미 컬럼이 존재하거나 다른 문제가 있습니다.")
@@ -0,0 +1,14 @@
+from sqlalchemy import text
+from app.database import engine
+
+with engine.connect() as conn:
+    try:
+        # users에 token_version 컬럼 추가 (기존 사용자는 0 → 기존 토큰은 ver 클레임이 없어 DB 조회 경로로 처리)
+        conn.execute(text(
+            "ALTER TABLE users ADD COLUMN token_version INTEGER NOT NULL DEFAULT 0"
+        ))
+        conn.commit()
+        print("✅ token_version 컬럼이 추가되었습니다!")
+    except Exception as e:
+        print(f"❌ 오류: {e}")
+        print("이미 컬럼이 존재하거나 다른 문제가 있습니다.")
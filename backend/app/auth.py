@@ -1,5 +1,8 @@
+import time
+import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional, Dict, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
@@ -9,8 +12,7 @@ from .database import get_db
 from . import models
 import os
 from dotenv import load_dotenv
-from google.auth.transport import requests
-from google.oauth2 import id_token
+from . import google_certs
 
 load_dotenv()
 
@@ -25,6 +27,12 @@ if not SECRET_KEY:
 
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
+# 토큰 버전 확인 결과를 DB 재조회 없이 믿는 시간 (초)
+# - 다른 워커에서 토큰을 무효화해도 이 시간 안에는 반영됨
+TOKEN_VERSION_CACHE_SECONDS = int(os.getenv("TOKEN_VERSION_CACHE_SECONDS", "60"))
+# 리프레시 토큰 유효 기간 (일) - 이 기간 안에는 비밀번호 없이 액세스 토큰 재발급
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "14"))
+REFRESH_TOKEN_TYPE = "refresh"
 
 security = HTTPBearer()
 
@@ -56,30 +64,172 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-# 현재 사용자 가져오기 (토큰 검증)
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-):
-    credentials_exception = HTTPException(
+# 사용자 클레임을 담은 액세스 토큰 생성
+# - uid: 사용자 ID, sid: 판매자 ID (판매자가 아니면 None), ver: 토큰 버전
+def create_user_token(user: models.User, expires_delta: Optional[timedelta] = None) -> str:
+    seller = user.seller
+    remember_token_version(user.id, user.token_version or 0)
+    return create_access_token(
+        data={
+            "sub": user.email,
+            "uid": user.id,
+            "sid": seller.id if seller else None,
+            "ver": user.token_version or 0,
+        },
+        expires_delta=expires_delta or timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+
+
+# 리프레시 토큰 생성 (한 번 쓰면 폐기되고 새 토큰으로 교체)
+# - jti: 폐기 목록 키, ver: 토큰 버전 (revoke_user_tokens로 한꺼번에 무효화)
+def create_refresh_token(user: models.User) -> str:
+    return create_access_token(
+        data={
+            "sub": user.email,
+            "uid": user.id,
+            "ver": user.token_version or 0,
+            "typ": REFRESH_TOKEN_TYPE,
+            "jti": uuid.uuid4().hex,
+        },
+        expires_delta=timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    )
+
+
+def decode_refresh_token(token: str) -> Dict:
+    """리프레시 토큰 서명/만료/형식 확인 - 실패 시 401"""
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        raise _credentials_exception()
+    if payload.get("typ") != REFRESH_TOKEN_TYPE or not payload.get("jti") or "uid" not in payload:
+        raise _credentials_exception()
+    return payload
+
+
+@dataclass
+class TokenUser:
+    """토큰 클레임으로 만든 사용자 정보 (users 테이블 조회 없음)"""
+    id: int
+    email: str
+    seller_id: Optional[int]
+    token_version: int
+
+    @property
+    def is_seller(self) -> int:
+        return 1 if self.seller_id else 0
+
+    @classmethod
+    def from_user(cls, user: models.User) -> "TokenUser":
+        seller = user.seller
+        return cls(
+            id=user.id,
+            email=user.email,
+            seller_id=seller.id if seller else None,
+            token_version=user.token_version or 0,
+        )
+
+
+# user_id → (확인된 토큰 버전, 확인 시각)
+_token_versions: Dict[int, Tuple[int, float]] = {}
+
+
+def remember_token_version(user_id: int, version: int):
+    _token_versions[user_id] = (version, time.monotonic())
+
+
+def revoke_user_tokens(user: models.User):
+    """token_version을 올려 이 사용자에게 발급한 토큰을 모두 무효화 (commit은 호출한 쪽에서)"""
+    user.token_version = (user.token_version or 0) + 1
+    remember_token_version(user.id, user.token_version)
+
+
+def _credentials_exception():
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _decode_token(token: str) -> Dict:
     try:
-        token = credentials.credentials
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
-    
-    user = db.query(models.User).filter(models.User.email == email).first()
+        raise _credentials_exception()
+    # 리프레시 토큰은 API 호출에 사용할 수 없음
+    if payload.get("sub") is None or payload.get("typ") == REFRESH_TOKEN_TYPE:
+        raise _credentials_exception()
+    return payload
+
+
+def _user_from_payload(payload: Dict, db: Session) -> models.User:
+    user = db.query(models.User).filter(models.User.email == payload["sub"]).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    # 무효화된 토큰 (ver 클레임이 없는 이전 토큰은 그대로 허용)
+    if "ver" in payload and payload["ver"] != (user.token_version or 0):
+        raise _credentials_exception()
+    remember_token_version(user.id, user.token_version or 0)
     return user
 
+
+# 현재 사용자 가져오기 (토큰 검증)
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+):
+    payload = _decode_token(credentials.credentials)
+    return _user_from_payload(payload, db)
+
+
+# 토큰 클레임만으로 현재 사용자 가져오기 (읽기 전용 엔드포인트용)
+async def get_token_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: Session = Depends(get_db)
+) -> TokenUser:
+    """
+    서명이 확인된 토큰의 uid/sid/ver 클레임을 그대로 사용 - 요청마다 users 조회 없음
+    - 이 워커에서 확인한 버전과 다르거나 확인한 지 TOKEN_VERSION_CACHE_SECONDS가 지났을 때만
+      token_version 컬럼 하나를 조회해서 무효화 여부 확인
+    - 클레임이 없는 이전 토큰은 get_current_user와 같이 DB 조회
+    """
+    payload = _decode_token(credentials.credentials)
+    if "uid" not in payload or "ver" not in payload:
+        return TokenUser.from_user(_user_from_payload(payload, db))
+
+    user_id, version = payload["uid"], payload["ver"]
+    cached = _token_versions.get(user_id)
+    if cached is None or cached[0] != version or time.monotonic() - cached[1] > TOKEN_VERSION_CACHE_SECONDS:
+        current_version = db.query(models.User.token_version).filter(models.User.id == user_id).scalar()
+        if current_version is None or current_version != version:
+            raise _credentials_exception()
+        remember_token_version(user_id, current_version)
+
+    return TokenUser(
+        id=user_id,
+        email=payload["sub"],
+        seller_id=payload.get("sid"),
+        token_version=version,
+    )
+
+
+async def get_admin_user(current_user: models.User = Depends(get_current_user)) -> models.User:
+    """관리자만 허용 (users.is_admin = 1, 관리 기능용)"""
+    if not current_user.is_admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Admin privileges required")
+    return current_user
+
+
+def get_seller_id(current_user: TokenUser, db: Session) -> Optional[int]:
+    """
+    현재 사용자의 판매자 ID
+    - 토큰에 sid가 있으면 조회 없음
+    - 토큰 발급 후 판매자로 등록한 경우(sid 없음)에만 sellers 조회
+    """
+    if current_user.seller_id:
+        return current_user.seller_id
+    return db.query(models.Seller.id).filter(models.Seller.user_id == current_user.id).scalar()
+
 # 구글 OAuth 토큰 검증
 async def verify_google_token(token: str) -> Optional[Dict]:
     """구글 ID 토큰을 검증하고 사용자 정보를 반환"""
@@ -98,10 +248,8 @@ async def verify_google_token(token: str) -> Optional[Dict]:
                 # jose로 디코딩 실패 시 None 반환
                 return None
         
-        # 구글 토큰 검증
-        idinfo = id_token.verify_oauth2_token(
-            token, requests.Request(), GOOGLE_CLIENT_ID
-        )
+        # 구글 토큰 검증 (공개키는 캐시 사용, 서명 검증은 스레드에서 실행)
+        idinfo = await google_certs.verify_id_token(token, GOOGLE_CLIENT_ID)
         
         # 토큰 발급자 확인
         if idinfo.get('iss') not in ['accounts.google.com', 'https://accounts.google.com']:
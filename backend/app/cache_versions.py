@@ -0,0 +1,48 @@
+from datetime import datetime
+from typing import Dict, Iterable
+from sqlalchemy.orm import Session
+from . import models
+
+# 상품 / 판매자 정보 (가격, 이름, 상태) - 장바구니 요약과 홈 피드가 사용
+CATALOG = "catalog"
+# 새 상품 등록 - 홈 피드만 사용 (장바구니 요약에는 영향 없음)
+PRODUCTS_ADDED = "products_added"
+
+
+def cart_key(user_id: int) -> str:
+    return f"cart:{user_id}"
+
+
+def bump(db: Session, *keys: str):
+    """
+    키의 버전 +1 (commit은 호출한 쪽에서 - 데이터 변경과 같은 트랜잭션)
+    - INSERT ... ON CONFLICT (key) DO UPDATE 한 문장 (처음 쓰는 키는 1)
+    """
+    if not keys:
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    table = models.CacheVersion.__table__
+    now = datetime.utcnow()
+    statement = insert(table).values([{"key": key, "version": 1, "updated_at": now} for key in dict.fromkeys(keys)])
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.key],
+        set_={"version": table.c.version + 1, "updated_at": now},
+    )
+    db.execute(statement)
+
+
+def read(db: Session, keys: Iterable[str]) -> Dict[str, int]:
+    """키별 현재 버전 (한 번도 올리지 않은 키는 0)"""
+    keys = list(keys)
+    versions = dict.fromkeys(keys, 0)
+    rows = db.query(models.CacheVersion.key, models.CacheVersion.version).filter(
+        models.CacheVersion.key.in_(keys)
+    )
+    versions.update({key: version for key, version in rows})
+    return versions
@@ -0,0 +1,151 @@
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import BigInteger, case, cast, func
+from sqlalchemy.orm import Session
+from . import cache_versions, models
+
+# ✅ 환경변수로 요약 캐시 설정
+# - CART_SUMMARY_CACHE_SECONDS: 캐시 최대 유지 시간 (초)
+#   (장바구니 / 상품이 바뀌면 cache_versions 버전이 올라가서 모든 워커에서 바로 다시 계산)
+# - CART_SUMMARY_CACHE_MAX_USERS: 워커가 캐시하는 최대 사용자 수 (넘으면 오래 안 쓴 사용자부터 삭제)
+CART_SUMMARY_CACHE_SECONDS = int(os.getenv("CART_SUMMARY_CACHE_SECONDS", "60"))
+CART_SUMMARY_CACHE_MAX_USERS = int(os.getenv("CART_SUMMARY_CACHE_MAX_USERS", "10000"))
+
+# 가격 문자열에서 제거할 문자 (SQLite / PostgreSQL 같은 규칙, SQLite는 database에서 regexp_replace 등록)
+PRICE_NON_DIGITS = "[^0-9]"
+# 가격 숫자 최대 자릿수 (999억 원 미만 - BIGINT로 변환해도 수량을 곱한 합계가 넘치지 않음)
+PRICE_MAX_DIGITS = 11
+
+# user_id → (계산 시각, 계산할 때의 버전 (장바구니, 상품), 요약) - 최근 사용 순
+_cache: "OrderedDict[int, Tuple[float, Tuple[int, int], Dict]]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def price_amount():
+    """
+    "25,000원" → 25000 - 문자열 가격을 SQL 안에서 정수로 변환 (숫자 외 모두 제거)
+    - 숫자가 없거나 PRICE_MAX_DIGITS보다 길면 NULL (parse_price 이전에 저장된 값)
+    """
+    digits = func.regexp_replace(models.Product.price, PRICE_NON_DIGITS, "", "g")
+    return case(
+        (func.length(digits).between(1, PRICE_MAX_DIGITS), cast(digits, BigInteger)),
+        else_=None,
+    )
+
+
+def parse_price(value: str) -> str:
+    """
+    상품 등록/수정 시 가격 확인 - 원 단위 정수만 허용 ("25,000원", "₩25000" 가능 / "19.99", "무료" 불가)
+    - 저장은 입력한 문자열 그대로, 합계는 price_amount()로 숫자만 추출
+    """
+    digits = re.sub(PRICE_NON_DIGITS, "", value)
+    if "." in value or not digits:
+        raise HTTPException(status_code=400, detail="가격은 원 단위 정수로 입력해주세요")
+    if len(digits.lstrip("0")) > PRICE_MAX_DIGITS:
+        raise HTTPException(status_code=400, detail="가격이 너무 큽니다")
+    return value
+
+
+def compute_cart_summary(db: Session, user_id: int) -> Dict:
+    """
+    장바구니 요약을 쿼리 한 번으로 계산
+    - 행마다 상품 합계, 윈도우 함수로 판매자별 소계 / 상품 수 / 수량을 함께 조회
+    """
+    unit_price = func.coalesce(price_amount(), 0)
+    line_total = unit_price * models.CartItem.quantity
+    by_seller = {"partition_by": models.Product.seller_id}
+
+    rows = db.query(
+        models.CartItem.id,
+        models.CartItem.product_id,
+        models.CartItem.quantity,
+        models.Product.name,
+        models.Product.price,
+        models.Product.image_url,
+        models.Product.seller_id,
+        models.Seller.name.label("seller_name"),
+        unit_price.label("unit_price"),
+        line_total.label("line_total"),
+        func.sum(line_total).over(**by_seller).label("seller_subtotal"),
+        func.sum(models.CartItem.quantity).over(**by_seller).label("seller_quantity"),
+        func.count(models.CartItem.id).over(**by_seller).label("seller_item_count"),
+    ).join(
+        models.Product, models.CartItem.product_id == models.Product.id
+    ).join(
+        models.Seller, models.Product.seller_id == models.Seller.id
+    ).filter(
+        models.CartItem.user_id == user_id
+    ).order_by(models.Product.seller_id, models.CartItem.id).all()
+
+    sellers = {}
+    for row in rows:
+        seller = sellers.get(row.seller_id)
+        if seller is None:
+            seller = sellers[row.seller_id] = {
+                "seller_id": row.seller_id,
+                "seller_name": row.seller_name,
+                "item_count": row.seller_item_count,
+                "quantity": row.seller_quantity,
+                "subtotal": row.seller_subtotal,
+                "items": [],
+            }
+        seller["items"].append({
+            "cart_item_id": row.id,
+            "product_id": row.product_id,
+            "name": row.name,
+            "price": row.price,
+            "image_url": row.image_url,
+            "unit_price": row.unit_price,
+            "quantity": row.quantity,
+            "line_total": row.line_total,
+        })
+
+    return {
+        "sellers": list(sellers.values()),
+        "item_count": len(rows),
+        "quantity": sum(seller["quantity"] for seller in sellers.values()),
+        "total": sum(seller["subtotal"] for seller in sellers.values()),
+    }
+
+
+def get_cart_summary(db: Session, user_id: int) -> Dict:
+    """
+    캐시된 요약 - 장바구니 / 상품 버전이 계산할 때와 같으면 그대로 (버전 확인은 기본 키 조회 한 번)
+    - 버전이 바뀌었거나 CART_SUMMARY_CACHE_SECONDS가 지났으면 다시 계산
+    """
+    key = cache_versions.cart_key(user_id)
+    current = cache_versions.read(db, [key, cache_versions.CATALOG])
+    versions = (current[key], current[cache_versions.CATALOG])
+
+    cached = _cache.get(user_id)
+    if cached and cached[1] == versions and time.monotonic() - cached[0] < CART_SUMMARY_CACHE_SECONDS:
+        with _lock:
+            if user_id in _cache:
+                _cache.move_to_end(user_id)
+        return cached[2]
+
+    summary = compute_cart_summary(db, user_id)
+    with _lock:
+        _cache[user_id] = (time.monotonic(), versions, summary)
+        _cache.move_to_end(user_id)
+        while len(_cache) > CART_SUMMARY_CACHE_MAX_USERS:
+            _cache.popitem(last=False)
+    return summary
+
+
+def invalidate_cart_summary(db: Session, user_id: Optional[int] = None):
+    """
+    장바구니 변경 시 해당 사용자 버전 +1 (None이면 상품 버전 - 가격/이름/상태 변경 시, 모든 사용자)
+    - 변경과 같은 트랜잭션에서 호출 (commit 전), 다른 워커는 다음 조회 때 버전을 비교해서 다시 계산
+    """
+    cache_versions.bump(db, cache_versions.CATALOG if user_id is None else cache_versions.cart_key(user_id))
+    with _lock:
+        if user_id is None:
+            _cache.clear()
+        else:
+            _cache.pop(user_id, None)
@@ -0,0 +1,212 @@
+import os
+import zlib
+from typing import Dict, Optional
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # brotli 미설치 환경에서는 gzip만 사용
+    brotli = None
+
+# ✅ 환경변수로 압축 설정 값 가져오기
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "500"))  # 바이트, 이보다 작으면 압축 안 함
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))  # 동적 응답용 (11은 CPU 비용이 너무 큼)
+
+# 이미 압축된 포맷 - 다시 압축해도 용량이 거의 줄지 않고 CPU만 사용
+SKIP_CONTENT_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/pdf",
+    "application/octet-stream",
+)
+
+
+def parse_accept_encoding(accept_encoding: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더 → {인코딩: q값}"""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Accept-Encoding 헤더에서 사용할 인코딩 선택 (br > gzip)"""
+    accepted = parse_accept_encoding(accept_encoding)
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+class Encoder:
+    """gzip / brotli 스트리밍 압축기 공통 인터페이스"""
+
+    def __init__(self, encoding: str, gzip_level: int = GZIP_LEVEL, brotli_quality: int = BROTLI_QUALITY):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            # wbits=16+MAX_WBITS → gzip 헤더/트레일러 포함
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data)
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        if self.encoding == "br":
+            return self._compressor.finish()
+        return self._compressor.flush()
+
+
+class CompressionMiddleware:
+    """
+    응답 압축 미들웨어
+    - 클라이언트가 지원하면 brotli, 아니면 gzip
+    - minimum_size 미만 응답, 이미 압축된 컨텐츠(이미지 등)는 그대로 전달
+    - route_rules: 경로 prefix별 최소 크기 재정의 (None이면 해당 경로 압축 안 함)
+      예) {"/uploads": None, "/api/products": 256}
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MIN_SIZE,
+        route_rules: Optional[Dict[str, Optional[int]]] = None,
+        gzip_level: int = GZIP_LEVEL,
+        brotli_quality: int = BROTLI_QUALITY,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        # 가장 긴 prefix가 먼저 매칭되도록 정렬
+        self.route_rules = sorted((route_rules or {}).items(), key=lambda rule: len(rule[0]), reverse=True)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    def minimum_size_for(self, path: str) -> Optional[int]:
+        for prefix, minimum_size in self.route_rules:
+            if path.startswith(prefix):
+                return minimum_size
+        return self.minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        minimum_size = self.minimum_size_for(scope["path"])
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if minimum_size is None or encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            self.app, encoding, minimum_size, self.gzip_level, self.brotli_quality
+        )
+        await responder(scope, receive, send)
+
+
+class _CompressionResponder:
+    def __init__(self, app: ASGIApp, encoding: str, minimum_size: int, gzip_level: int, brotli_quality: int):
+        self.app = app
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.send: Send = None
+        self.start_message: Optional[Message] = None
+        self.started = False
+        self.passthrough = False
+        self.encoder: Optional[Encoder] = None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    def is_compressible(self, headers: MutableHeaders) -> bool:
+        if self.start_message["status"] in (204, 206, 304):
+            return False
+        if "content-encoding" in headers or "content-range" in headers:
+            return False
+        if "no-transform" in headers.get("cache-control", ""):
+            return False
+        content_type = headers.get("content-type", "").lower()
+        return not content_type.startswith(SKIP_CONTENT_TYPES)
+
+    async def send_with_compression(self, message: Message):
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # 첫 body를 보고 압축 여부를 결정하므로 start 메시지는 잠시 보관
+            self.start_message = message
+            return
+
+        if message_type != "http.response.body":
+            # http.response.pathsend 등 - 압축하지 않고 그대로 전달
+            if not self.started:
+                self.started = True
+                self.passthrough = True
+                await self.send(self.start_message)
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            self.started = True
+            headers = MutableHeaders(raw=self.start_message["headers"])
+            too_small = not more_body and len(body) < self.minimum_size
+            if too_small or not self.is_compressible(headers):
+                self.passthrough = True
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+
+            self.encoder = Encoder(self.encoding, self.gzip_level, self.brotli_quality)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                # 압축본은 원본과 바이트가 다르므로 weak ETag로 변경
+                etag = headers["etag"]
+                if not etag.startswith("W/"):
+                    headers["ETag"] = f"W/{etag}"
+
+            if not more_body:
+                compressed = self.encoder.compress(body) + self.encoder.flush()
+                headers["Content-Length"] = str(len(compressed))
+                await self.send(self.start_message)
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            # 스트리밍 응답 - 전체 길이를 알 수 없으므로 Content-Length 제거
+            del headers["Content-Length"]
+            await self.send(self.start_message)
+
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        chunk = self.encoder.compress(body)
+        if not more_body:
+            chunk += self.encoder.flush()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -1,12 +1,24 @@
 import os
 from dotenv import load_dotenv
-import cloudinary
 
 load_dotenv()
 
-# Cloudinary 설정
-cloudinary.config(
-    cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
-    api_key=os.getenv("CLOUDINARY_API_KEY"),
-    api_secret=os.getenv("CLOUDINARY_API_SECRET")
-)
\ No newline at end of file
+_cloudinary_configured = False
+
+
+def configure_cloudinary():
+    """
+    Cloudinary 설정 - 처음 업로드/삭제할 때 한 번만
+    (cloudinary 패키지 import 비용을 서버 시작 시간에서 제외)
+    """
+    global _cloudinary_configured
+    if _cloudinary_configured:
+        return
+    import cloudinary
+
+    cloudinary.config(
+        cloud_name=os.getenv("CLOUDINARY_CLOUD_NAME"),
+        api_key=os.getenv("CLOUDINARY_API_KEY"),
+        api_secret=os.getenv("CLOUDINARY_API_SECRET")
+    )
+    _cloudinary_configured = True
@@ -1,26 +1,52 @@
 import os
-from sqlalchemy import create_engine
+import re
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
+from .slow_queries import install_slow_query_log
 
 # 환경변수에서 DATABASE_URL 가져오기
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-if DATABASE_URL is None:
-    # 로컬 개발 환경
-    DATABASE_URL = "sqlite:///./tshirts.db"
-    engine = create_engine(
-        DATABASE_URL, connect_args={"check_same_thread": False}
-    )
-else:
+# ✅ 환경변수로 서버 시작 시 테이블 생성 여부 설정
+# - CREATE_TABLES_ON_STARTUP=0: 스키마는 마이그레이션 스크립트(add_*.py)로만 관리
+#   (콜드 스타트 때 테이블 확인용 DB 왕복 생략)
+CREATE_TABLES_ON_STARTUP = os.getenv("CREATE_TABLES_ON_STARTUP", "1") == "1"
+
+# ✅ 환경변수로 읽기 전용 복제본(read replica) 설정
+# - DATABASE_REPLICA_URLS: 쉼표로 구분한 복제본 주소 (없으면 모든 조회가 기본 DB로)
+DATABASE_REPLICA_URLS = [url.strip() for url in os.getenv("DATABASE_REPLICA_URLS", "").split(",") if url.strip()]
+
+
+def _regexp_replace(value, pattern, replacement, flags):
+    if value is None:
+        return None
+    return re.sub(pattern, replacement, value, count=0 if "g" in (flags or "") else 1)
+
+
+def _register_sqlite_functions(dbapi_connection, connection_record):
+    # PostgreSQL의 regexp_replace와 같은 함수 - 가격 문자열을 두 DB에서 같은 규칙으로 변환 (cart_summary.price_amount)
+    dbapi_connection.create_function("regexp_replace", 4, _regexp_replace, deterministic=True)
+
+
+def make_engine(url: str):
+    if url.startswith("sqlite"):
+        # SQLite는 연결 비용이 거의 없으므로 풀을 쓰지 않음
+        # - async 엔드포인트가 동시에 많이 열려 있을 때 풀(기본 15개)이 바닥나
+        #   이벤트 루프가 연결 반환을 기다리며 멈추는 문제 방지
+        sqlite_engine = create_engine(
+            url, connect_args={"check_same_thread": False}, poolclass=NullPool
+        )
+        event.listen(sqlite_engine, "connect", _register_sqlite_functions)
+        return sqlite_engine
     # 프로덕션 환경 (PostgreSQL)
-    if DATABASE_URL.startswith("postgres://"):
-        DATABASE_URL = DATABASE_URL.replace("postgres://", "postgresql://", 1)
+    if url.startswith("postgres://"):
+        url = url.replace("postgres://", "postgresql://", 1)
     #engine = create_engine(DATABASE_URL)
     # ✅ Neon에 최적화된 설정
-    engine = create_engine(
-        DATABASE_URL,
+    return create_engine(
+        url,
         poolclass=NullPool,  # Serverless에 적합
         connect_args={
             "connect_timeout": 30,  # 연결 타임아웃 30초
@@ -28,12 +54,39 @@ else:
     )
 
 
+if DATABASE_URL is None:
+    # 로컬 개발 환경
+    DATABASE_URL = "sqlite:///./tshirts.db"
+
+engine = make_engine(DATABASE_URL)
+replica_engines = [make_engine(url) for url in DATABASE_REPLICA_URLS]
+
+# 느린 쿼리 기록 (SLOW_QUERY_MS 이상 걸린 SQL의 fingerprint / 실행 계획)
+install_slow_query_log(engine)
+for replica_engine in replica_engines:
+    install_slow_query_log(replica_engine)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 복제본 세션 - bind는 세션을 만들 때 지정 (db_routing.get_read_db)
+ReplicaSessionLocal = sessionmaker(autocommit=False, autoflush=False)
 Base = declarative_base()
 
+
+@event.listens_for(ReplicaSessionLocal, "before_flush")
+def _reject_replica_writes(session, flush_context, instances):
+    # 복제본에는 쓰지 않음 - 쓰기가 필요한 엔드포인트는 get_db 사용
+    raise RuntimeError("Replica sessions are read-only; use get_db for writes")
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+def create_tables():
+    """모델의 테이블 생성 (이미 있는 테이블은 그대로)"""
+    from . import models  # noqa: F401 - 모델을 Base.metadata에 등록
+    Base.metadata.create_all(bind=engine)
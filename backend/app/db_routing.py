@@ -0,0 +1,165 @@
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from fastapi import Request
+from jose import JWTError, jwt
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from .auth import ALGORITHM, SECRET_KEY
+from .database import SessionLocal, ReplicaSessionLocal, replica_engines
+from .guest_cart import GUEST_CART_COOKIE_SAMESITE, GUEST_CART_COOKIE_SECURE
+from .readiness import readiness
+
+# ✅ 환경변수로 복제본 라우팅 설정
+# - REPLICA_STICKY_SECONDS: 쓰기 요청 후 이 시간(초) 동안 같은 클라이언트의 조회는 기본 DB로
+#   (복제 지연 때문에 방금 만든 주문/상품이 안 보이는 문제 방지, 복제 지연보다 길게)
+# - REPLICA_STICKY_MAX_CLIENTS: 워커가 기억하는 최근 쓰기 클라이언트 수 (넘으면 오래된 것부터 삭제)
+REPLICA_STICKY_SECONDS = float(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+REPLICA_STICKY_MAX_CLIENTS = int(os.getenv("REPLICA_STICKY_MAX_CLIENTS", "100000"))
+
+# 다른 워커에서도 기본 DB를 쓰도록 알려주는 쿠키 (값: 기본 DB를 쓸 마지막 시각, epoch 초)
+READ_PRIMARY_COOKIE = "read_primary_until"
+# 로그인 응답에서 새로 로그인한 사용자 ID를 미들웨어에 전달 (request.state)
+WRITER_STATE = "read_your_writes_user_id"
+
+SAFE_METHODS = {"GET", "HEAD", "OPTIONS"}
+
+
+def token_user_id(authorization: Optional[str]) -> Optional[int]:
+    """Authorization 헤더의 access token에서 사용자 ID (uid 클레임) - 서명이 맞지 않거나 없으면 None"""
+    scheme, _, token = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return None
+    user_id = payload.get("uid")
+    return user_id if isinstance(user_id, int) else None
+
+
+def client_key(headers, client, user_id: Optional[int] = None) -> str:
+    """
+    같은 클라이언트 판별 - 로그인 사용자는 사용자 ID, 아니면 IP
+    - 로그인 응답처럼 토큰이 아직 없는 요청은 user_id로 직접 지정 (이후 토큰을 보내는 조회와 같은 키)
+    """
+    if user_id is None:
+        user_id = token_user_id(headers.get("authorization"))
+    if user_id is not None:
+        return f"user:{user_id}"
+    return "ip:" + (client[0] if client else "unknown")
+
+
+def mark_writer(request: Request, user_id: int):
+    """로그인/회원가입 응답 - 이 요청의 쓰기를 IP 대신 새로 로그인한 사용자 키로 기록"""
+    setattr(request.state, WRITER_STATE, user_id)
+
+
+class RecentWriters:
+    """최근에 쓰기 요청을 보낸 클라이언트 (워커별 메모리) - 키마다 기본 DB를 쓸 마지막 시각만 저장"""
+
+    def __init__(self, sticky_seconds: float = REPLICA_STICKY_SECONDS, max_clients: int = REPLICA_STICKY_MAX_CLIENTS):
+        self.sticky_seconds = sticky_seconds
+        self.max_clients = max_clients
+        self.until: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def mark(self, key: str):
+        with self._lock:
+            self.until.pop(key, None)
+            self.until[key] = time.monotonic() + self.sticky_seconds
+            if len(self.until) > self.max_clients:
+                self.until.popitem(last=False)
+
+    def is_recent(self, key: str) -> bool:
+        until = self.until.get(key)
+        return until is not None and time.monotonic() < until
+
+
+recent_writers = RecentWriters()
+
+
+class ReplicaRouter:
+    """
+    조회용 복제본 선택 - 건강한 복제본을 돌아가며 사용 (readiness 검사에서 실패한 복제본은 제외)
+    - 사용할 복제본이 없으면 None (기본 DB 사용)
+    """
+
+    def __init__(self, engines=replica_engines):
+        self.engines = list(engines)
+        self.names = [f"replica_{index + 1}" for index in range(len(self.engines))]
+        self._next = 0
+
+    def pick(self):
+        for _ in range(len(self.engines)):
+            index = self._next % len(self.engines)
+            self._next += 1
+            if readiness.is_healthy(self.names[index]):
+                return self.engines[index]
+        return None
+
+
+replica_router = ReplicaRouter()
+
+
+def reads_from_primary(request: Request) -> bool:
+    """쓰기 직후의 조회 (read-your-writes) - 이 워커의 기록 또는 쿠키로 확인"""
+    if recent_writers.is_recent(client_key(request.headers, request.client)):
+        return True
+    cookie = request.cookies.get(READ_PRIMARY_COOKIE)
+    try:
+        return cookie is not None and float(cookie) > time.time()
+    except ValueError:
+        return False
+
+
+def get_read_db(request: Request):
+    """
+    조회 전용 엔드포인트의 DB 세션 (get_db 대신 사용)
+    - 복제본이 설정되어 있으면 복제본, 쓰기 직후의 같은 클라이언트는 기본 DB
+    - 복제본 세션에서 flush하면 RuntimeError (쓰기는 get_db로)
+    """
+    replica = None if reads_from_primary(request) else replica_router.pick()
+    db = SessionLocal() if replica is None else ReplicaSessionLocal(bind=replica)
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 요청(POST/PUT/PATCH/DELETE)이 성공하면 같은 클라이언트를 REPLICA_STICKY_SECONDS 동안 기본 DB로 보냄
+    - 이 워커: 메모리에 기록 (사용자 ID 또는 IP) / 다른 워커: read_primary_until 쿠키
+      (프론트엔드는 모든 요청에 credentials: 'include' - 쿠키를 받고 다시 보냄)
+    - 복제본이 없으면 아무것도 하지 않음
+    """
+
+    def __init__(self, app: ASGIApp, writers: RecentWriters = recent_writers):
+        self.app = app
+        self.writers = writers
+        self.enabled = bool(replica_engines)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if not self.enabled or scope["type"] != "http" or scope["method"] in SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message):
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                user_id = scope.get("state", {}).get(WRITER_STATE)
+                self.writers.mark(client_key(Headers(scope=scope), scope.get("client"), user_id))
+                seconds = math.ceil(self.writers.sticky_seconds)
+                cookie = (
+                    f"{READ_PRIMARY_COOKIE}={math.ceil(time.time()) + seconds}; "
+                    f"Max-Age={seconds}; Path=/; HttpOnly; SameSite={GUEST_CART_COOKIE_SAMESITE}"
+                )
+                if GUEST_CART_COOKIE_SECURE:
+                    cookie += "; Secure"
+                MutableHeaders(scope=message).append("set-cookie", cookie)
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,105 @@
+import asyncio
+import json
+import os
+import re
+import time
+import urllib.request
+from typing import Dict, Optional, Tuple
+from jose import jwt as jose_jwt
+
+# 구글 ID 토큰 서명 공개키 (x509 인증서) 주소
+# - 오프라인 테스트/벤치마크에서는 로컬 대체 서버 주소로 바꿔서 사용 (benchmarks/google_stub.py)
+GOOGLE_CERTS_URL = os.getenv("GOOGLE_CERTS_URL", "https://www.googleapis.com/oauth2/v1/certs")
+
+# Cache-Control이 없을 때 사용할 캐시 시간 (초)
+DEFAULT_MAX_AGE = 3600
+# 만료 이 시간(초) 전부터는 기존 키로 응답하면서 백그라운드에서 갱신
+REFRESH_MARGIN = 300
+# 모르는 kid가 들어왔을 때 강제 갱신 최소 간격 (위조 토큰으로 구글을 계속 호출하지 않도록)
+UNKNOWN_KID_REFRESH_INTERVAL = 60
+
+MAX_AGE_PATTERN = re.compile(r"max-age=(\d+)")
+
+
+def fetch_certs(url: str = GOOGLE_CERTS_URL) -> Tuple[Dict[str, str], int]:
+    """공개키 목록과 Cache-Control max-age(초) 조회 - 블로킹 호출이므로 스레드에서 실행"""
+    with urllib.request.urlopen(url, timeout=10) as response:
+        certs = json.loads(response.read().decode("utf-8"))
+        match = MAX_AGE_PATTERN.search(response.headers.get("Cache-Control", ""))
+    max_age = int(match.group(1)) if match else DEFAULT_MAX_AGE
+    return certs, max_age
+
+
+class GoogleCertCache:
+    """
+    구글 공개키 캐시
+    - Cache-Control max-age 동안 재사용 (요청마다 구글 호출 없음)
+    - 만료가 가까워지면 기존 키로 응답하면서 백그라운드에서 갱신
+    - 동시에 여러 요청이 와도 갱신은 한 번만 실행
+    """
+
+    def __init__(self, url: str = GOOGLE_CERTS_URL):
+        self.url = url
+        self.certs: Optional[Dict[str, str]] = None
+        self.expires_at = 0.0
+        self.last_refresh = 0.0
+        self._lock = asyncio.Lock()
+        self._background: Optional[asyncio.Task] = None
+
+    async def refresh(self):
+        certs, max_age = await asyncio.to_thread(fetch_certs, self.url)
+        self.certs = certs
+        self.last_refresh = time.monotonic()
+        self.expires_at = self.last_refresh + max_age
+
+    async def _refresh_locked(self, force: bool = False):
+        async with self._lock:
+            # 기다리는 동안 다른 요청이 이미 갱신했으면 생략
+            if not force and self.certs and time.monotonic() < self.expires_at:
+                return
+            await self.refresh()
+
+    async def _refresh_in_background(self):
+        try:
+            await self._refresh_locked(force=True)
+        except Exception as e:
+            print(f"Google certs background refresh failed: {e}")
+
+    async def get(self) -> Dict[str, str]:
+        now = time.monotonic()
+        if self.certs and now < self.expires_at:
+            if now >= self.expires_at - REFRESH_MARGIN and (self._background is None or self._background.done()):
+                self._background = asyncio.create_task(self._refresh_in_background())
+            return self.certs
+
+        await self._refresh_locked()
+        return self.certs
+
+    async def get_for_kid(self, kid: Optional[str]) -> Dict[str, str]:
+        """토큰의 kid에 맞는 키가 없으면 (구글 키 교체 직후) 한 번 강제 갱신"""
+        certs = await self.get()
+        if kid and kid not in certs and time.monotonic() - self.last_refresh > UNKNOWN_KID_REFRESH_INTERVAL:
+            await self._refresh_locked(force=True)
+            certs = self.certs
+        return certs
+
+
+_cert_cache = GoogleCertCache()
+
+
+async def verify_id_token(token: str, audience: str, cache: GoogleCertCache = _cert_cache) -> Dict:
+    """
+    구글 ID 토큰 검증 (google.oauth2.id_token.verify_oauth2_token 과 같은 검사)
+    - 공개키는 캐시 사용, RSA 서명 검증은 이벤트 루프를 막지 않도록 스레드에서 실행
+    - 검증 실패 시 ValueError
+    """
+    try:
+        kid = jose_jwt.get_unverified_header(token).get("kid")
+    except Exception as e:
+        raise ValueError(f"Invalid token header: {e}")
+
+    # google-auth는 첫 구글 로그인 때 import (서버 시작 시간 단축)
+    from google.auth import jwt as google_jwt
+
+    certs = await cache.get_for_kid(kid)
+    return await asyncio.to_thread(google_jwt.decode, token, certs=certs, audience=audience)
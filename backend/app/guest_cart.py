@@ -0,0 +1,149 @@
+import os
+import secrets
+from datetime import datetime, timedelta
+from typing import Dict, Optional
+from fastapi import HTTPException, Request, Response
+from sqlalchemy.orm import Session
+from . import models
+from .cart_summary import invalidate_cart_summary
+
+# ✅ 환경변수로 게스트 장바구니 쿠키 설정
+# - 프론트엔드와 API 도메인이 다르면 GUEST_CART_COOKIE_SAMESITE=none, GUEST_CART_COOKIE_SECURE=1
+GUEST_CART_COOKIE = "guest_cart"
+GUEST_CART_MAX_AGE_DAYS = int(os.getenv("GUEST_CART_MAX_AGE_DAYS", "30"))
+GUEST_CART_COOKIE_SAMESITE = os.getenv("GUEST_CART_COOKIE_SAMESITE", "lax")
+GUEST_CART_COOKIE_SECURE = os.getenv("GUEST_CART_COOKIE_SECURE", "0") == "1"
+
+# 게스트 장바구니 한도 (저장 크기 제한)
+MAX_GUEST_CART_ITEMS = 50
+MAX_GUEST_CART_QUANTITY = 99
+
+
+def decode_items(items: str) -> Dict[int, int]:
+    """ "3:1,7:2" → {3: 1, 7: 2} """
+    result = {}
+    for pair in filter(None, items.split(",")):
+        product_id, quantity = pair.split(":")
+        result[int(product_id)] = int(quantity)
+    return result
+
+
+def encode_items(items: Dict[int, int]) -> str:
+    """ {3: 1, 7: 2} → "3:1,7:2" (수량 0 이하는 제외) """
+    return ",".join(f"{product_id}:{quantity}" for product_id, quantity in items.items() if quantity > 0)
+
+
+def get_guest_cart(db: Session, request: Request) -> Optional[models.GuestCart]:
+    token = request.cookies.get(GUEST_CART_COOKIE)
+    if not token:
+        return None
+    return db.query(models.GuestCart).filter(models.GuestCart.token == token).first()
+
+
+def get_or_create_guest_cart(db: Session, request: Request, response: Response) -> models.GuestCart:
+    """쿠키의 게스트 장바구니, 없으면 새로 만들고 쿠키 설정 (commit은 호출한 쪽에서)"""
+    cart = get_guest_cart(db, request)
+    if cart is None:
+        cart = models.GuestCart(token=secrets.token_urlsafe(32), items="")
+        db.add(cart)
+    set_guest_cart_cookie(response, cart.token)
+    return cart
+
+
+def set_guest_cart_cookie(response: Response, token: str):
+    response.set_cookie(
+        GUEST_CART_COOKIE,
+        token,
+        max_age=GUEST_CART_MAX_AGE_DAYS * 24 * 3600,
+        httponly=True,
+        samesite=GUEST_CART_COOKIE_SAMESITE,
+        secure=GUEST_CART_COOKIE_SECURE,
+    )
+
+
+def set_guest_item(cart: models.GuestCart, product_id: int, quantity: int):
+    """상품 수량 설정 (0 이하면 삭제)"""
+    items = decode_items(cart.items)
+    if product_id not in items and len(items) >= MAX_GUEST_CART_ITEMS:
+        raise HTTPException(status_code=400, detail=f"장바구니에는 최대 {MAX_GUEST_CART_ITEMS}개 상품까지 담을 수 있습니다")
+    items[product_id] = min(quantity, MAX_GUEST_CART_QUANTITY)
+    cart.items = encode_items(items)
+
+
+def upsert_cart_items(db: Session, user_id: int, items: Dict[int, int]):
+    """
+    cart_items에 한 번에 upsert (이미 담긴 상품은 수량 합산)
+    - INSERT ... ON CONFLICT (user_id, product_id) DO UPDATE 한 문장으로 실행
+    """
+    if not items:
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+
+    table = models.CartItem.__table__
+    now = datetime.utcnow()
+    statement = insert(table).values([
+        {"user_id": user_id, "product_id": product_id, "quantity": quantity, "created_at": now}
+        for product_id, quantity in items.items()
+    ])
+    statement = statement.on_conflict_do_update(
+        index_elements=[table.c.user_id, table.c.product_id],
+        set_={"quantity": table.c.quantity + statement.excluded.quantity},
+    )
+    db.execute(statement)
+
+
+def merge_guest_cart(db: Session, request: Request, response: Response, user_id: int) -> int:
+    """
+    로그인/회원가입 시 게스트 장바구니를 사용자 장바구니로 병합 후 삭제 (commit 포함)
+    - 삭제된 상품(없거나 is_active = 0)은 제외, 병합한 상품 수 반환
+    """
+    cart = get_guest_cart(db, request)
+    if cart is None:
+        return 0
+
+    items = decode_items(cart.items)
+    if items:
+        existing = {
+            product_id for (product_id,) in db.query(models.Product.id).filter(
+                models.Product.id.in_(items),
+                models.Product.is_active == 1
+            )
+        }
+        items = {product_id: quantity for product_id, quantity in items.items() if product_id in existing}
+        upsert_cart_items(db, user_id, items)
+
+    db.delete(cart)
+    invalidate_cart_summary(db, user_id)
+    db.commit()
+    response.delete_cookie(
+        GUEST_CART_COOKIE,
+        httponly=True,
+        samesite=GUEST_CART_COOKIE_SAMESITE,
+        secure=GUEST_CART_COOKIE_SECURE,
+    )
+    return len(items)
+
+
+def purge_expired_guest_carts(db: Session) -> int:
+    """쿠키 만료 기간이 지난 게스트 장바구니 삭제, 삭제한 수 반환"""
+    cutoff = datetime.utcnow() - timedelta(days=GUEST_CART_MAX_AGE_DAYS)
+    deleted = db.query(models.GuestCart).filter(
+        models.GuestCart.updated_at < cutoff
+    ).delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"✅ 만료된 게스트 장바구니 {purge_expired_guest_carts(db)}개가 삭제되었습니다!")
+    finally:
+        db.close()
@@ -0,0 +1,343 @@
+import asyncio
+import hashlib
+import json
+import os
+import threading
+import time
+import zlib
+from bisect import insort
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from fastapi import Request, Response
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from . import cache_versions, models
+from .compression import brotli, choose_encoding
+from .database import SessionLocal
+
+# ✅ 환경변수로 홈 피드 설정
+# - HOME_FEED_PRODUCTS_PER_CATEGORY: 카테고리(대분류)별 최신 상품 수 (전체 최신 목록도 같은 수)
+# - HOME_FEED_FEATURED_SELLERS: 대표 판매자 수 (최근 주문 수 → 판매 중인 상품 수 순)
+# - HOME_FEED_REFRESH_SECONDS: 전체 재계산 간격 (초) - 대표 판매자의 주문 수 순위는 이 시간 안에 반영
+# - HOME_FEED_VERSION_CHECK_SECONDS: 다른 워커의 상품 / 판매자 변경 확인 간격 (초)
+#   (cache_versions 버전 조회 한 번, 바뀌었으면 전체 재계산 - 다른 워커의 변경은 이 시간 + 재계산 시간 안에 반영)
+HOME_FEED_PRODUCTS_PER_CATEGORY = int(os.getenv("HOME_FEED_PRODUCTS_PER_CATEGORY", "12"))
+HOME_FEED_FEATURED_SELLERS = int(os.getenv("HOME_FEED_FEATURED_SELLERS", "8"))
+HOME_FEED_REFRESH_SECONDS = int(os.getenv("HOME_FEED_REFRESH_SECONDS", "300"))
+HOME_FEED_VERSION_CHECK_SECONDS = float(os.getenv("HOME_FEED_VERSION_CHECK_SECONDS", "1"))
+
+# 대표 판매자 순위에 사용하는 최근 주문 기간 (일)
+FEATURED_SELLER_ORDER_DAYS = 30
+# 미리 압축해 두므로 최고 압축률 사용 (요청마다 압축하지 않음)
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+# 홈 피드 내용이 바뀌는 변경의 버전 키
+WATCHED_VERSIONS = (cache_versions.CATALOG, cache_versions.PRODUCTS_ADDED)
+# 재계산이 실패했을 때 다시 시도하기까지 기다리는 시간 (초)
+FAILURE_RETRY_SECONDS = 30
+
+# (created_at, id) 내림차순 정렬용 키 + 카드 응답
+Entry = Tuple[Tuple[float, int], Dict]
+
+
+def _encode(value) -> bytes:
+    # JSONResponse와 같은 형식 (한글 그대로, 공백 없음)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _entry(row) -> Entry:
+    """조회 행 → (정렬 키, 카드) - 카드 형식은 GET /api/products?view=card 와 같음"""
+    card = {
+        "id": row.id,
+        "name": row.name,
+        "price": row.price,
+        "image_url": row.image_url,
+        "category_main": row.category_main,
+        "category_sub": row.category_sub,
+        "seller_name": row.seller_name,
+    }
+    created = row.created_at.timestamp() if row.created_at else 0.0
+    return (-created, -row.id), card
+
+
+def _card_query(db: Session, *columns):
+    return db.query(
+        models.Product.id,
+        models.Product.name,
+        models.Product.price,
+        models.Product.image_url,
+        models.Product.category_main,
+        models.Product.category_sub,
+        models.Product.created_at,
+        models.Seller.name.label("seller_name"),
+        *columns,
+    ).join(models.Seller, models.Product.seller_id == models.Seller.id)
+
+
+def load_categories(db: Session, limit: int, category: Optional[str] = None) -> Dict[str, List[Entry]]:
+    """카테고리별 최신 활성 상품 limit개 (윈도우 함수로 쿼리 한 번)"""
+    rank = func.row_number().over(
+        partition_by=models.Product.category_main,
+        order_by=(models.Product.created_at.desc(), models.Product.id.desc()),
+    ).label("rank")
+    query = _card_query(db, rank).filter(models.Product.is_active == 1)
+    if category is not None:
+        query = query.filter(models.Product.category_main == category)
+    ranked = query.subquery()
+    rows = db.query(ranked).filter(ranked.c.rank <= limit).order_by(ranked.c.category_main, ranked.c.rank).all()
+
+    categories: Dict[str, List[Entry]] = {}
+    for row in rows:
+        categories.setdefault(row.category_main, []).append(_entry(row))
+    return categories
+
+
+def load_featured_sellers(db: Session, limit: int) -> List[Dict]:
+    """판매 중인 상품이 있는 판매자 - 최근 주문 수, 판매 중인 상품 수, 최근 등록 순"""
+    since = datetime.utcnow() - timedelta(days=FEATURED_SELLER_ORDER_DAYS)
+    orders = db.query(
+        models.Order.seller_id, func.count(models.Order.id).label("orders")
+    ).filter(
+        models.Order.created_at >= since,
+        models.Order.status != models.OrderStatus.CANCELLED,
+    ).group_by(models.Order.seller_id).subquery()
+    products = db.query(
+        models.Product.seller_id,
+        func.count(models.Product.id).label("products"),
+        func.max(models.Product.created_at).label("latest"),
+    ).filter(models.Product.is_active == 1).group_by(models.Product.seller_id).subquery()
+
+    recent_orders = func.coalesce(orders.c.orders, 0)
+    rows = db.query(
+        models.Seller.id, models.Seller.name
+    ).join(
+        products, products.c.seller_id == models.Seller.id
+    ).outerjoin(
+        orders, orders.c.seller_id == models.Seller.id
+    ).order_by(
+        recent_orders.desc(), products.c.products.desc(), products.c.latest.desc(), models.Seller.id
+    ).limit(limit).all()
+    # 순위에만 사용하고 수는 내보내지 않음 (상품 변경은 바로 반영되지만 판매자 순위는 주기적으로만 갱신)
+    return [{"id": row.id, "name": row.name} for row in rows]
+
+
+class FeedSnapshot:
+    """
+    공개된 응답 하나 (본문 / 압축본 / ETag) - 만든 뒤에는 바꾸지 않고 통째로 교체
+    (재계산 스레드가 바꾸는 중에 요청이 새 ETag와 이전 본문을 섞어 읽지 않도록)
+    """
+
+    __slots__ = ("content", "body", "encoded", "etag")
+
+    def __init__(self, content: bytes = b"", body: bytes = b"", encoded: Optional[Dict[str, bytes]] = None,
+                 etag: str = ""):
+        self.content = content
+        self.body = body
+        self.encoded = encoded or {}
+        self.etag = etag
+
+
+class HomeFeed:
+    """
+    홈 화면용 피드 (카테고리별 최신 상품 / 전체 최신 상품 / 대표 판매자) - 워커별 메모리
+    - 응답 본문은 미리 JSON으로 만들어 두고 gzip / brotli 압축본도 함께 보관 → 요청 처리에 DB 조회 없음
+    - 상품이 등록/수정/삭제되면 해당 상품만 반영 (product_changed), 빠진 자리는 그 카테고리만 다시 조회
+    - 다른 워커의 상품 / 판매자 변경은 cache_versions 버전을 주기적으로 확인해서 전체 재계산
+    - 주문 수(대표 판매자 순위)는 HOME_FEED_REFRESH_SECONDS마다 전체 재계산으로 반영
+    - 섹션(카테고리)별 JSON을 따로 보관해서 바뀐 섹션만 다시 인코딩
+    """
+
+    def __init__(self, per_category: int = HOME_FEED_PRODUCTS_PER_CATEGORY,
+                 featured_sellers: int = HOME_FEED_FEATURED_SELLERS, refresh_seconds: int = HOME_FEED_REFRESH_SECONDS,
+                 version_check_seconds: float = HOME_FEED_VERSION_CHECK_SECONDS):
+        self.per_category = per_category
+        self.featured_sellers = featured_sellers
+        self.refresh_seconds = refresh_seconds
+        self.version_check_seconds = version_check_seconds
+        # 마지막 전체 계산에 반영된 버전 (cache_versions)
+        self.versions: Dict[str, int] = {}
+        self.categories: Optional[Dict[str, List[Entry]]] = None
+        self.sellers: List[Dict] = []
+        self.sections: Dict[str, bytes] = {}
+        self.sellers_section = b"[]"
+        self.snapshot = FeedSnapshot()
+        self.built_at = 0.0
+        self.version = 0
+        self.dirty = False
+        self._lock = threading.Lock()
+        self._build_lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+
+    # --- 계산 ---
+
+    def rebuild(self):
+        """전체 재계산 (블로킹 - 스레드에서 호출)"""
+        version = self.version
+        db = SessionLocal()
+        try:
+            # 버전을 먼저 읽음 - 조회 중에 바뀐 변경은 다음 확인에서 다시 계산
+            versions = cache_versions.read(db, WATCHED_VERSIONS)
+            categories = load_categories(db, self.per_category)
+            sellers = load_featured_sellers(db, self.featured_sellers)
+        finally:
+            db.close()
+
+        with self._lock:
+            self.categories = categories
+            self.sellers = sellers
+            self.sections = {name: _encode([card for _, card in entries]) for name, entries in categories.items()}
+            self.sellers_section = _encode(sellers)
+            self._publish()
+            self.built_at = time.monotonic()
+            self.versions = versions
+            # 계산 중에 반영된 상품 변경은 이번 결과에 빠졌을 수 있음 → 한 번 더 계산
+            self.dirty = self.version != version
+
+    def _newest(self) -> List[Dict]:
+        # 전체 최신 N개는 항상 카테고리별 최신 N개 안에 있음
+        entries = sorted(entry for entries in self.categories.values() for entry in entries)
+        return [card for _, card in entries[:self.per_category]]
+
+    def _publish(self):
+        """섹션을 이어 붙여 새 스냅샷 생성 후 한 번에 교체 (내용이 같으면 그대로)"""
+        categories = b",".join(
+            _encode(name) + b":" + self.sections[name] for name in sorted(self.categories)
+        )
+        content = (
+            b'"newest":' + _encode(self._newest())
+            + b',"categories":{' + categories + b"}"
+            + b',"featured_sellers":' + self.sellers_section
+        )
+        if content == self.snapshot.content:
+            return
+        updated_at = _encode(datetime.utcnow().isoformat())
+        body = b'{"updated_at":' + updated_at + b"," + content + b"}"
+        etag = 'W/"' + hashlib.blake2b(content, digest_size=12).hexdigest() + '"'
+
+        compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        encoded = {"gzip": compressor.compress(body) + compressor.flush()}
+        if brotli is not None:
+            encoded["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+        self.snapshot = FeedSnapshot(content, body, encoded, etag)
+
+    def product_changed(self, db: Session, product_id: int):
+        """
+        상품 등록/수정/삭제(비활성화) 후 호출 (commit 이후) - 해당 상품만 반영
+        - 이미 commit된 요청이 500이 되지 않도록 실패하면 전체 재계산으로 대신함
+        """
+        self.version += 1
+        if self.categories is None:
+            return  # 아직 계산 전 - 처음 계산할 때 포함됨
+        try:
+            self._apply_product_change(db, product_id)
+        except Exception as e:
+            print(f"Home feed update failed (product {product_id}): {e}")
+            db.rollback()
+            self.invalidate()
+
+    def _apply_product_change(self, db: Session, product_id: int):
+        row = _card_query(db, models.Product.is_active).filter(models.Product.id == product_id).first()
+        with self._lock:
+            touched = set()
+            refill = []
+            for name, entries in self.categories.items():
+                for index, (_, card) in enumerate(entries):
+                    if card["id"] == product_id:
+                        # 목록이 가득 차 있었다면 빠진 자리를 채울 상품이 더 있을 수 있음
+                        if len(entries) == self.per_category:
+                            refill.append(name)
+                        del entries[index]
+                        touched.add(name)
+                        break
+            if row is not None and row.is_active == 1:
+                entries = self.categories.setdefault(row.category_main, [])
+                insort(entries, _entry(row), key=lambda entry: entry[0])
+                del entries[self.per_category:]
+                touched.add(row.category_main)
+                if row.category_main in refill and len(entries) == self.per_category:
+                    refill.remove(row.category_main)
+
+        for name in refill:
+            loaded = load_categories(db, self.per_category, category=name).get(name, [])
+            with self._lock:
+                self.categories[name] = loaded
+
+        with self._lock:
+            for name in touched:
+                if self.categories.get(name):
+                    self.sections[name] = _encode([card for _, card in self.categories[name]])
+                else:
+                    self.categories.pop(name, None)
+                    self.sections.pop(name, None)
+            self._publish()
+
+    def invalidate(self):
+        """다음 주기에 전체 재계산 (판매자 이름 변경 등 여러 상품에 걸친 변경)"""
+        self.version += 1
+        self.dirty = True
+
+    # --- 응답 ---
+
+    async def ensure_built(self):
+        if self.categories is not None:
+            return
+        async with self._build_lock:
+            if self.categories is None:
+                await asyncio.to_thread(self.rebuild)
+
+    async def response(self, request: Request) -> Response:
+        """미리 만든 본문으로 응답 - If-None-Match가 같으면 304, Accept-Encoding에 맞는 압축본"""
+        await self.ensure_built()
+        snapshot = self.snapshot  # 이 요청은 같은 스냅샷만 사용
+        headers = {"ETag": snapshot.etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+        if request.headers.get("if-none-match") == snapshot.etag:
+            return Response(status_code=304, headers=headers)
+        encoding = choose_encoding(request.headers.get("accept-encoding", ""))
+        body = snapshot.encoded.get(encoding) if encoding else None
+        if body is None:
+            return Response(snapshot.body, media_type="application/json", headers=headers)
+        headers["Content-Encoding"] = encoding
+        return Response(body, media_type="application/json", headers=headers)
+
+    # --- 백그라운드 재계산 ---
+
+    def changed_elsewhere(self) -> bool:
+        """다른 워커에서 상품 / 판매자가 바뀌었는지 (블로킹 - 스레드에서 호출)"""
+        db = SessionLocal()
+        try:
+            return cache_versions.read(db, WATCHED_VERSIONS) != self.versions
+        finally:
+            db.close()
+
+    async def _loop(self):
+        checked_at = time.monotonic()
+        while True:
+            delay = min(1.0, self.version_check_seconds)
+            try:
+                rebuild = self.categories is None or self.dirty or time.monotonic() - self.built_at > self.refresh_seconds
+                if not rebuild and time.monotonic() - checked_at >= self.version_check_seconds:
+                    checked_at = time.monotonic()
+                    rebuild = await asyncio.to_thread(self.changed_elsewhere)
+                if rebuild:
+                    async with self._build_lock:
+                        await asyncio.to_thread(self.rebuild)
+            except Exception as e:
+                print(f"Home feed rebuild failed: {e}")
+                delay = FAILURE_RETRY_SECONDS
+            await asyncio.sleep(delay)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+home_feed = HomeFeed()
@@ -0,0 +1,201 @@
+import hashlib
+import os
+from datetime import datetime, timedelta
+from typing import Optional
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from starlette.datastructures import UploadFile
+from . import models
+from .auth import get_current_user
+from .database import get_db
+from .image_assets import hash_file
+
+# ✅ 환경변수로 Idempotency-Key 보관 시간 설정 (시간)
+# - 이 시간 안에 같은 키로 다시 보내면 처리하지 않고 저장된 응답 반환
+IDEMPOTENCY_KEY_TTL_HOURS = int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24"))
+# 처리 중 상태로 둘 최대 시간 (초) - 워커가 죽어 응답이 저장되지 않은 키는 이 시간 뒤 다시 처리
+IDEMPOTENCY_LOCK_SECONDS = int(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "60"))
+
+IDEMPOTENCY_HEADER = "Idempotency-Key"
+MAX_IDEMPOTENCY_KEY_LENGTH = 255
+
+
+class IdempotentReplay(Exception):
+    """이미 처리된 요청 - 엔드포인트를 실행하지 않고 저장된 응답 반환 (main에서 핸들러 등록)"""
+
+    def __init__(self, response: Response):
+        self.response = response
+
+
+async def replay_handler(request: Request, exc: IdempotentReplay) -> Response:
+    return exc.response
+
+
+async def request_hash(request: Request) -> str:
+    """
+    요청 본문 SHA-256 - 같은 키로 다른 내용을 보냈는지 확인용
+    - multipart는 필드 이름/값과 파일 내용 해시로 계산 (Starlette가 파싱한 폼을 재사용)
+    """
+    digest = hashlib.sha256()
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        for name, value in sorted(form.multi_items(), key=lambda item: item[0]):
+            if isinstance(value, UploadFile):
+                value = f"{value.filename}:{hash_file(value.file)}"
+            digest.update(f"{name}={value}\0".encode())
+    else:
+        digest.update(await request.body())
+    return digest.hexdigest()
+
+
+class IdempotencyClaim:
+    """
+    엔드포인트가 받는 처리 권한 - 성공 응답을 store()로 저장
+    - 헤더 없이 온 요청이면 record가 None이고 store()는 아무것도 하지 않음
+    """
+
+    def __init__(self, record: Optional[models.IdempotencyKey] = None):
+        self.record = record
+
+    def store(self, db: Session, schema, obj, status_code: int = 200):
+        """
+        응답을 저장 (commit은 호출한 쪽에서)
+        - 주문/상품과 같은 트랜잭션에 저장되므로 둘 중 하나만 남는 경우가 없음
+        """
+        if self.record is None:
+            return
+        db.flush()  # ID, 기본값 생성
+        db.expire_all()  # 조건부 UPDATE로 바뀐 재고 등을 DB에서 다시 읽어 직렬화
+        self.record.status_code = status_code
+        self.record.expires_at = datetime.utcnow() + timedelta(hours=IDEMPOTENCY_KEY_TTL_HOURS)
+        self.record.response_body = schema.model_validate(obj).model_dump_json()
+
+
+def claim_key(db: Session, user_id: int, scope: str, key: str, digest: str) -> models.IdempotencyKey:
+    """
+    키를 "처리 중"으로 먼저 저장하고 commit (동시에 온 같은 요청은 unique 인덱스 충돌)
+    - 이미 처리된 키면 IdempotentReplay, 처리 중이면 409, 다른 요청이면 422
+    """
+    for _ in range(3):
+        record = models.IdempotencyKey(
+            user_id=user_id,
+            scope=scope,
+            key=key,
+            request_hash=digest,
+            expires_at=datetime.utcnow() + timedelta(seconds=IDEMPOTENCY_LOCK_SECONDS),
+        )
+        db.add(record)
+        try:
+            db.commit()
+            return record
+        except IntegrityError:
+            db.rollback()
+
+        # 엔티티 대신 컬럼만 조회 (삭제 후 같은 id로 다시 저장할 때 identity map 충돌 방지)
+        existing = db.query(
+            models.IdempotencyKey.id,
+            models.IdempotencyKey.request_hash,
+            models.IdempotencyKey.status_code,
+            models.IdempotencyKey.response_body,
+            models.IdempotencyKey.expires_at,
+        ).filter(
+            models.IdempotencyKey.user_id == user_id,
+            models.IdempotencyKey.scope == scope,
+            models.IdempotencyKey.key == key,
+        ).first()
+        if existing is None:
+            # 실패해서 방금 풀린 키 - 다시 시도
+            continue
+        if existing.expires_at <= datetime.utcnow():
+            # 만료된 키 (또는 처리 중에 워커가 죽은 키) - 삭제하고 다시 시도
+            # (expires_at까지 비교하므로 동시에 삭제해도 새로 잡힌 키는 지우지 않음)
+            db.query(models.IdempotencyKey).filter(
+                models.IdempotencyKey.id == existing.id,
+                models.IdempotencyKey.expires_at == existing.expires_at,
+            ).delete(synchronize_session=False)
+            db.commit()
+            continue
+
+        if existing.request_hash != digest:
+            raise HTTPException(status_code=422, detail="Idempotency-Key was already used with a different request")
+        if existing.status_code is None:
+            raise HTTPException(
+                status_code=409,
+                detail="A request with this Idempotency-Key is still being processed",
+                headers={"Retry-After": "1"},
+            )
+        raise IdempotentReplay(Response(
+            content=existing.response_body,
+            status_code=existing.status_code,
+            media_type="application/json",
+            headers={"Idempotent-Replayed": "true"},
+        ))
+
+    raise HTTPException(status_code=409, detail="A request with this Idempotency-Key is still being processed")
+
+
+def release_key(db: Session, record_id: int):
+    """처리에 실패한 키 삭제 - 같은 키로 다시 시도할 수 있게"""
+    db.rollback()
+    db.query(models.IdempotencyKey).filter(
+        models.IdempotencyKey.id == record_id,
+        models.IdempotencyKey.status_code.is_(None),
+    ).delete(synchronize_session=False)
+    db.commit()
+
+
+class Idempotency:
+    """
+    Idempotency-Key 헤더 처리 의존성
+    - 처음 온 키: 엔드포인트 실행, 성공 응답은 claim.store()로 저장 / 실패하면 키 삭제
+    - 다시 온 키: 엔드포인트 실행 없이 저장된 응답 (Idempotent-Replayed: true 헤더)
+    - 키는 사용자별로 구분 (scope: 엔드포인트 이름)
+    """
+
+    def __init__(self, scope: str):
+        self.scope = scope
+
+    async def __call__(
+        self,
+        request: Request,
+        current_user: models.User = Depends(get_current_user),
+        db: Session = Depends(get_db),
+    ):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            yield IdempotencyClaim()
+            return
+        if len(key) > MAX_IDEMPOTENCY_KEY_LENGTH:
+            raise HTTPException(status_code=400, detail=f"Idempotency-Key must be at most {MAX_IDEMPOTENCY_KEY_LENGTH} characters")
+
+        record = claim_key(db, current_user.id, self.scope, key, await request_hash(request))
+        record_id = record.id
+        try:
+            yield IdempotencyClaim(record)
+        except Exception:
+            release_key(db, record_id)
+            raise
+
+
+def purge_expired_keys(db: Session) -> int:
+    """보관 시간이 지난 키 삭제, 삭제한 수 반환"""
+    deleted = db.query(models.IdempotencyKey).filter(
+        models.IdempotencyKey.expires_at < datetime.utcnow()
+    ).delete(synchronize_session=False)
+    db.commit()
+    return deleted
+
+
+order_idempotency = Idempotency("orders")
+product_idempotency = Idempotency("products")
+
+
+if __name__ == "__main__":
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"✅ 만료된 Idempotency-Key {purge_expired_keys(db)}개가 삭제되었습니다!")
+    finally:
+        db.close()
@@ -0,0 +1,115 @@
+import hashlib
+from datetime import datetime, timedelta
+from typing import BinaryIO
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from . import models
+from .images import IMAGE_VARIANTS
+from .storage import get_storage, storage_for_url
+
+HASH_CHUNK_SIZE = 64 * 1024
+
+# 중복 제거된 이미지는 여러 판매자가 함께 쓰므로 특정 판매자 폴더가 아닌 공용 폴더에 내용 해시 이름으로 저장
+ASSET_FOLDER = "tshirts/products/shared"
+
+# 업로드 / 재사용 후 이 시간 안의 asset은 참조가 없어도 삭제하지 않음 (acquire 전인 요청 보호)
+CLEANUP_GRACE_PERIOD = timedelta(hours=1)
+
+
+def hash_file(file: BinaryIO) -> str:
+    """파일을 조금씩 읽으며 SHA-256 계산 (전체를 메모리에 올리지 않음), 읽은 뒤 처음으로 되돌림"""
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+
+def get_or_upload(db: Session, file: BinaryIO) -> models.ImageAsset:
+    """
+    같은 내용의 이미지가 이미 있으면 재사용, 없으면 공용 폴더에 업로드 후 ImageAsset 생성
+    - 반환된 asset은 아직 참조되지 않은 상태이므로 acquire()로 참조 수를 올려야 함
+    """
+    digest = hash_file(file)
+    asset = db.query(models.ImageAsset).filter(models.ImageAsset.sha256 == digest).first()
+    if asset:
+        if asset.ref_count <= 0:
+            # 참조가 없는 asset을 재사용 - 정리 대기 시간을 다시 시작 (acquire 전에 삭제되지 않게)
+            asset.created_at = datetime.utcnow()
+        return asset
+
+    result = get_storage().upload(
+        file,
+        folder=ASSET_FOLDER,
+        public_id=digest,
+        widths=IMAGE_VARIANTS.values()
+    )
+
+    asset = models.ImageAsset(
+        sha256=digest,
+        image_url=result['secure_url'],
+        public_id=result.get('public_id'),
+        width=result.get('width'),
+        height=result.get('height'),
+        size=result.get('bytes'),
+        ref_count=0
+    )
+    try:
+        with db.begin_nested():
+            db.add(asset)
+    except IntegrityError:
+        # 동시에 같은 이미지를 올린 요청이 먼저 저장한 경우 - 그쪽 asset 사용
+        # (public_id가 내용 해시라 같은 파일을 덮어썼을 뿐이므로 삭제하지 않음)
+        asset = db.query(models.ImageAsset).filter(models.ImageAsset.sha256 == digest).first()
+    return asset
+
+
+def acquire(db: Session, asset_id: int):
+    """참조 수 +1 (UPDATE ... SET ref_count = ref_count + 1 - 동시 요청에도 안전)"""
+    db.query(models.ImageAsset).filter(models.ImageAsset.id == asset_id).update(
+        {models.ImageAsset.ref_count: models.ImageAsset.ref_count + 1}
+    )
+
+
+def release(db: Session, asset_id: int):
+    """참조 수 -1 - 0이 된 asset은 cleanup_unreferenced()에서 삭제"""
+    db.query(models.ImageAsset).filter(models.ImageAsset.id == asset_id).update(
+        {models.ImageAsset.ref_count: models.ImageAsset.ref_count - 1}
+    )
+
+
+def cleanup_unreferenced(db: Session) -> int:
+    """
+    참조가 없는 asset을 저장소와 DB에서 삭제, 삭제한 개수 반환
+    - 업로드 / 재사용 후 CLEANUP_GRACE_PERIOD가 지나지 않은 asset은 제외 (get_or_upload 후 acquire 전)
+      python -m app.image_assets
+    """
+    cutoff = datetime.utcnow() - CLEANUP_GRACE_PERIOD
+    assets = db.query(models.ImageAsset).filter(
+        models.ImageAsset.ref_count <= 0,
+        models.ImageAsset.created_at < cutoff
+    ).all()
+    removed = 0
+    for asset in assets:
+        try:
+            if asset.public_id:
+                storage_for_url(asset.image_url).delete(asset.public_id)
+        except Exception as e:
+            print(f"Image asset cleanup failed ({asset.public_id}): {e}")
+            continue
+        db.delete(asset)
+        removed += 1
+    db.commit()
+    return removed
+
+
+if __name__ == "__main__":
+    from . import config  # .env 로드 (Cloudinary 설정은 삭제할 때)
+    from .database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        print(f"✅ 참조 없는 이미지 {cleanup_unreferenced(db)}개가 삭제되었습니다!")
+    finally:
+        db.close()
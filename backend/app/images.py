@@ -0,0 +1,55 @@
+from typing import Dict, List, Optional
+from .storage import local_storage
+
+# 반응형 이미지 변형 (이름 → 최대 너비 px)
+# - thumbnail: 장바구니/주문 목록, card: 상품 그리드, detail: 상품 상세
+IMAGE_VARIANTS = {
+    "thumbnail": 200,
+    "card": 480,
+    "detail": 1080,
+}
+
+CLOUDINARY_UPLOAD_SEGMENT = "/image/upload/"
+
+
+def cloudinary_variant_url(image_url: str, width: int) -> Optional[str]:
+    """
+    Cloudinary URL에 변환 파라미터를 넣은 URL 반환 (Cloudinary URL이 아니면 None)
+    - c_limit: 원본보다 크게 늘리지 않음
+    - f_auto/q_auto: 브라우저에 맞는 포맷(webp/avif)과 화질 자동 선택
+    """
+    if "res.cloudinary.com" not in image_url or CLOUDINARY_UPLOAD_SEGMENT not in image_url:
+        return None
+    prefix, rest = image_url.split(CLOUDINARY_UPLOAD_SEGMENT, 1)
+    return f"{prefix}{CLOUDINARY_UPLOAD_SEGMENT}w_{width},c_limit,f_auto,q_auto/{rest}"
+
+
+def variant_url(image_url: str, width: int) -> Optional[str]:
+    """저장소에 맞는 변형 URL (Cloudinary: URL 변환, 로컬: Pillow로 만든 리사이즈 파일)"""
+    return cloudinary_variant_url(image_url, width) or local_storage().variant_url(image_url, width)
+
+
+def build_variants(image_url: str, width: Optional[int] = None, height: Optional[int] = None) -> List[Dict]:
+    """
+    이미지 URL과 원본 크기로 변형 목록 생성
+    - width/height: 업로드 결과의 원본 크기 (모르면 None → 변형 height도 None)
+    """
+    variants = []
+    for name, variant_width in IMAGE_VARIANTS.items():
+        url = variant_url(image_url, variant_width)
+        if url is None:
+            continue
+
+        out_width, out_height = variant_width, None
+        if width and height:
+            # 원본보다 크게 늘리지 않음
+            out_width = min(variant_width, width)
+            out_height = round(height * out_width / width)
+
+        variants.append({
+            "name": name,
+            "width": out_width,
+            "height": out_height,
+            "image_url": url,
+        })
+    return variants
@@ -0,0 +1,130 @@
+import json
+from typing import Dict, Iterable, Optional, Tuple
+from fastapi import HTTPException
+from sqlalchemy import or_, update
+from sqlalchemy.orm import Session
+from . import models
+
+# 재고 규칙
+# - stock이 NULL이면 재고를 관리하지 않음 (무제한, 기존 상품 호환)
+# - 사이즈 옵션이 있으면 옵션 재고와 상품 전체 재고를 모두 차감
+# - 차감은 UPDATE ... SET stock = stock - q WHERE stock >= q 한 문장으로 실행 (읽고 쓰는 사이에 끼어들 수 없음)
+
+
+def _decrement(db: Session, model, criteria, quantity: int) -> bool:
+    """조건부 차감 - 재고가 부족하면 0행이 갱신되어 False"""
+    result = db.execute(
+        update(model)
+        .where(*criteria, or_(model.stock.is_(None), model.stock >= quantity))
+        .values(stock=model.stock - quantity)  # NULL - q = NULL (무제한 유지)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def _increment(db: Session, model, criteria, quantity: int):
+    db.execute(
+        update(model)
+        .where(*criteria)
+        .values(stock=model.stock + quantity)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def _fail(db: Session, status_code: int, detail: str):
+    """
+    트랜잭션을 바로 롤백하고 에러 - 세션 정리(get_db)까지 기다리면
+    그동안 차감한 행의 잠금이 남아 같은 상품을 주문하는 다른 요청이 멈춤
+    """
+    db.rollback()
+    raise HTTPException(status_code=status_code, detail=detail)
+
+
+def has_options(db: Session, product_id: int) -> bool:
+    """사이즈 옵션이 있는 상품인지 (있으면 사이즈 없이 주문 불가)"""
+    return db.query(models.ProductOption.id).filter(
+        models.ProductOption.product_id == product_id
+    ).first() is not None
+
+
+def option_exists(db: Session, product_id: int, size: str) -> bool:
+    return db.query(models.ProductOption.id).filter(
+        models.ProductOption.product_id == product_id,
+        models.ProductOption.size == size
+    ).first() is not None
+
+
+def reserve_stock(db: Session, items: Iterable[Tuple[int, Optional[str], int]]):
+    """
+    주문 상품 재고 차감 (commit은 호출한 쪽에서, 실패 시 트랜잭션 전체 롤백 후 400/409)
+    - items: (상품 ID, 사이즈 또는 None, 수량)
+    - 여러 주문이 같은 행을 다른 순서로 잠그지 않도록 (상품 ID, 사이즈) 순서로 차감
+    - 사이즈 옵션이 있는 상품은 사이즈 필수 (없이 주문하면 사이즈별 재고를 건너뜀)
+    """
+    for product_id, size, quantity in sorted(items, key=lambda item: (item[0], item[1] or "")):
+        if size:
+            reserved = _decrement(db, models.ProductOption, (
+                models.ProductOption.product_id == product_id,
+                models.ProductOption.size == size,
+            ), quantity)
+            if not reserved:
+                if not option_exists(db, product_id, size):
+                    _fail(db, 400, f"상품 {product_id}에 {size} 사이즈가 없습니다")
+                _fail(db, 409, f"상품 {product_id} ({size}) 재고가 부족합니다")
+        elif has_options(db, product_id):
+            _fail(db, 400, "사이즈를 선택해주세요")
+
+        if not _decrement(db, models.Product, (models.Product.id == product_id,), quantity):
+            _fail(db, 409, f"상품 {product_id} 재고가 부족합니다")
+
+
+def release_stock(db: Session, order: models.Order):
+    """주문 취소 시 차감했던 재고 복구 (commit은 호출한 쪽에서)"""
+    for item in order.order_items:
+        if item.size:
+            _increment(db, models.ProductOption, (
+                models.ProductOption.product_id == item.product_id,
+                models.ProductOption.size == item.size,
+            ), item.quantity)
+        _increment(db, models.Product, (models.Product.id == item.product_id,), item.quantity)
+
+
+def parse_stock(value: Optional[str]) -> Optional[int]:
+    """폼 값 → 재고 ("" 이면 무제한 NULL)"""
+    if value is None or value.strip() == "":
+        return None
+    try:
+        stock = int(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="재고는 숫자여야 합니다")
+    if stock < 0:
+        raise HTTPException(status_code=400, detail="재고는 0 이상이어야 합니다")
+    return stock
+
+
+def parse_size_stock(value: str) -> Dict[str, Optional[int]]:
+    """폼 값 '{"S": 10, "M": 5, "L": null}' → 사이즈별 재고"""
+    try:
+        sizes = json.loads(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="사이즈 재고 형식이 올바르지 않습니다")
+    if not isinstance(sizes, dict):
+        raise HTTPException(status_code=400, detail="사이즈 재고 형식이 올바르지 않습니다")
+    return {
+        str(size).strip(): parse_stock(None if stock is None else str(stock))
+        for size, stock in sizes.items()
+        if str(size).strip()
+    }
+
+
+def set_product_options(db: Session, product: models.Product, sizes: Dict[str, Optional[int]]):
+    """사이즈 옵션을 주어진 목록으로 맞춤 (기존 행은 재고만 변경, 없는 사이즈는 삭제)"""
+    existing = {option.size: option for option in product.options}
+    for size, option in existing.items():
+        if size not in sizes:
+            db.delete(option)
+    for size, stock in sizes.items():
+        if size in existing:
+            existing[size].stock = stock
+        else:
+            product.options.append(models.ProductOption(size=size, stock=stock))
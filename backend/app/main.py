@@ -1,23 +1,81 @@
-from fastapi import FastAPI
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, PlainTextResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from pathlib import Path
-from .database import engine, Base
-from .routers import auth, products, cart, orders, sellers
+from .database import engine, replica_engines, create_tables, CREATE_TABLES_ON_STARTUP
+from .routers import auth, products, cart, orders, sellers, admin
 from datetime import datetime
 from . import config
+from .compression import CompressionMiddleware
+from .static_files import CachedStaticFiles, STATIC_DIR
+from .storage import LOCAL_MEDIA_ROOT, LOCAL_MEDIA_DIR
+from .upload_limits import UploadLimitMiddleware, configure_spooling
+from .idempotency import IdempotentReplay, replay_handler
+from .metrics import MetricsMiddleware, check_metrics_access, install_sql_hooks, registry
+from .profiler import ProfileMiddleware
+from .rate_limit import RATE_LIMIT_REDIS_URL, get_store
+from .readiness import ping_database, readiness
+from .db_routing import ReadYourWritesMiddleware, replica_router
+from .home_feed import home_feed
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+# 요청별 SQL 실행 횟수 / 시간 측정
+install_sql_hooks(engine)
+for replica_engine in replica_engines:
+    install_sql_hooks(replica_engine)
 
-app = FastAPI(title="T-Shirts API")
+# readiness 검사 대상 (백그라운드에서 주기적으로 확인, 프로브는 결과만 읽음)
+readiness.watch_engine(engine)
+if RATE_LIMIT_REDIS_URL:
+    readiness.add_check("rate_limit_store", lambda: get_store().ping())
+# 복제본은 실패해도 기본 DB로 조회하므로 readiness에는 영향 없음 (실패한 복제본은 라우팅에서 제외)
+for name, replica_engine in zip(replica_router.names, replica_router.engines):
+    readiness.add_check(name, lambda replica_engine=replica_engine: ping_database(replica_engine), critical=False)
 
-# 업로드 폴더 생성
-upload_dir = Path("uploads")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 데이터베이스 테이블 생성 - import 시점이 아니라 서버 시작 시
+    # (app을 import만 하는 스크립트 / 벤치마크는 DB에 접속하지 않음)
+    if CREATE_TABLES_ON_STARTUP:
+        create_tables()
+    # 첫 검사가 끝날 때까지 /ready는 503 (starting) - 시작을 DB 응답까지 기다리지 않음
+    readiness.start()
+    # 홈 피드는 백그라운드에서 계산 (첫 요청이 먼저 오면 그 요청에서 계산)
+    home_feed.start()
+    yield
+    await home_feed.stop()
+    await readiness.stop()
+
+
+app = FastAPI(title="T-Shirts API", lifespan=lifespan)
+
+# Idempotency-Key로 재시도한 요청은 엔드포인트 대신 저장된 응답으로 처리
+app.add_exception_handler(IdempotentReplay, replay_handler)
+
+# 업로드 폴더 생성 (MEDIA_STORAGE=local 일 때 이미지 저장 위치)
+upload_dir = LOCAL_MEDIA_ROOT
 upload_dir.mkdir(exist_ok=True)
 
-# 정적 파일 서빙 (업로드된 이미지)
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# 정적 파일 서빙 (업로드된 이미지, QR 코드 등)
+# - 해시 파일명 URL은 immutable 캐시, 나머지는 ETag 재검증
+app.mount(
+    "/uploads",
+    CachedStaticFiles(directory=upload_dir, immutable_prefixes=(f"{LOCAL_MEDIA_DIR}/",)),
+    name="uploads"
+)
+app.mount("/static", CachedStaticFiles(directory=STATIC_DIR), name="static")
+
+# 업로드 크기 제한 (파일별 / 요청 전체, 초과 시 413)
+# - 큰 파일은 메모리 대신 임시 파일에 저장되도록 spool 기준 설정
+configure_spooling()
+app.add_middleware(UploadLimitMiddleware, paths=("/api/products", "/api/sellers"))
+
+# 응답 압축 (gzip / brotli)
+# - 이미지 경로는 이미 압축된 포맷이므로 제외
+app.add_middleware(
+    CompressionMiddleware,
+    route_rules={"/uploads": None, "/static": None, "/health": None, "/ready": None},
+)
 
 # CORS 설정 (프론트엔드와 통신 허용)
 app.add_middleware(
@@ -28,12 +86,23 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 쓰기 요청 직후 같은 클라이언트의 조회는 복제본 대신 기본 DB로 (복제본이 설정된 경우만)
+app.add_middleware(ReadYourWritesMiddleware)
+
+# 관리자 프로파일러가 특정 경로 요청만 샘플링할 때 처리 중인 요청 표시 (세션이 없으면 바로 통과)
+app.add_middleware(ProfileMiddleware)
+
+# 요청 계측 (가장 바깥 - 압축/CORS까지 포함한 시간)
+# - 라우트별 지연 시간 히스토그램 → GET /metrics, 요청별 app/db 시간 → Server-Timing 헤더
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(auth.router)
 app.include_router(products.router)
 app.include_router(cart.router)
 app.include_router(orders.router)
 app.include_router(sellers.router)
+app.include_router(admin.router)
 
 @app.get("/")
 async def root():
@@ -46,4 +115,24 @@ async def health_check():
         "status": "ok",
         "timestamp": datetime.utcnow().isoformat(),
         "service": "T-Shirts API"
-    }
\ No newline at end of file
+    }
+
+# 로드밸런서 / 오케스트레이터 readiness 프로브 - 준비되지 않은 워커는 503
+# - 백그라운드 검사 결과만 읽으므로 프로브마다 DB 연결을 열지 않음
+@app.api_route("/ready", methods=["GET", "HEAD"], include_in_schema=False)
+async def ready():
+    summary = readiness.summary()
+    return JSONResponse(summary, status_code=200 if summary["status"] == "ready" else 503)
+
+@app.get("/health/deep", include_in_schema=False)
+async def deep_health(request: Request):
+    """readiness 상세 (검사별 결과 / 연결 풀 / 캐시 상태) - /metrics와 같은 접근 제한 (오류 메시지에 DB 주소 등이 포함될 수 있음)"""
+    check_metrics_access(request)
+    details = readiness.details()
+    return JSONResponse(details, status_code=200 if details["status"] == "ready" else 503)
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus 메트릭 (이 워커의 누적 값) - METRICS_TOKEN 또는 METRICS_PUBLIC=1 필요"""
+    check_metrics_access(request)
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
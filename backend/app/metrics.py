@@ -0,0 +1,230 @@
+import os
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Dict, Optional, Tuple
+from fastapi import HTTPException, Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# ✅ 환경변수로 계측 설정
+# - SERVER_TIMING_ENABLED=0 이면 응답에 Server-Timing 헤더를 붙이지 않음 (메트릭은 계속 수집)
+# - METRICS_TOKEN을 설정하면 /metrics 조회에 "Authorization: Bearer <토큰>" 필요
+#   (설정하지 않으면 /metrics는 404 - 라우트별 지연 시간 / SQL 횟수가 공개 주소에 노출되지 않도록)
+# - METRICS_PUBLIC=1 이면 토큰 없이 공개 (로컬 개발 / 내부망 전용 배포)
+SERVER_TIMING_ENABLED = os.getenv("SERVER_TIMING_ENABLED", "1") == "1"
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+METRICS_PUBLIC = os.getenv("METRICS_PUBLIC", "0") == "1"
+
+# 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 라우트를 못 찾은 요청(404 등)은 경로 대신 이 이름으로 집계 (경로별로 시계열이 늘어나지 않게)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class RequestStats:
+    """요청 하나의 SQL 실행 횟수 / 시간 (엔진 이벤트에서 누적)"""
+
+    __slots__ = ("statements", "db_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.db_seconds = 0.0
+
+
+# 현재 요청의 통계 - 스레드풀에서 실행되는 코드에도 컨텍스트가 복사되어 같은 객체를 가리킴
+_current: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def current_stats() -> Optional[RequestStats]:
+    return _current.get()
+
+
+def check_metrics_access(request: Request):
+    """
+    운영용 엔드포인트 접근 확인 - 토큰이 없으면 닫힘
+    - METRICS_TOKEN 설정: Bearer 토큰이 다르면 401
+    - 미설정: METRICS_PUBLIC=1 이 아니면 404 (엔드포인트가 있는지도 알리지 않음)
+    """
+    if METRICS_TOKEN:
+        if request.headers.get("authorization") != f"Bearer {METRICS_TOKEN}":
+            raise HTTPException(status_code=401, detail="Invalid metrics token")
+    elif not METRICS_PUBLIC:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+class RouteMetrics:
+    """라우트 하나의 누적 값 (Prometheus histogram + counter)"""
+
+    __slots__ = ("buckets", "count", "seconds", "statements", "db_seconds", "statuses")
+
+    def __init__(self):
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.seconds = 0.0
+        self.statements = 0
+        self.db_seconds = 0.0
+        self.statuses: Dict[int, int] = {}
+
+    def observe(self, seconds: float, status: int, stats: RequestStats):
+        index = bisect_left(LATENCY_BUCKETS, seconds)
+        if index < len(self.buckets):
+            self.buckets[index] += 1
+        self.count += 1
+        self.seconds += seconds
+        self.statements += stats.statements
+        self.db_seconds += stats.db_seconds
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+
+
+class MetricsRegistry:
+    """
+    (method, route) 별 지연 시간 / SQL 통계
+    - 워커 프로세스마다 따로 집계 (여러 워커면 Prometheus에서 합산)
+    """
+
+    def __init__(self):
+        self.routes: Dict[Tuple[str, str], RouteMetrics] = {}
+
+    def observe(self, method: str, route: str, seconds: float, status: int, stats: RequestStats):
+        key = (method, route)
+        metrics = self.routes.get(key)
+        if metrics is None:
+            metrics = self.routes[key] = RouteMetrics()
+        metrics.observe(seconds, status, stats)
+
+    def reset(self):
+        self.routes.clear()
+
+    def render(self) -> str:
+        """Prometheus text format (0.0.4)"""
+        lines = [
+            "# HELP http_request_duration_seconds Request latency by route",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        routes = sorted(self.routes.items())
+        for (method, route), metrics in routes:
+            labels = f'method="{method}",route="{_escape(route)}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS, metrics.buckets):
+                cumulative += count
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {metrics.count}')
+            lines.append(f"http_request_duration_seconds_sum{{{labels}}} {metrics.seconds:.6f}")
+            lines.append(f"http_request_duration_seconds_count{{{labels}}} {metrics.count}")
+
+        lines += [
+            "# HELP http_requests_total Requests by route and status code",
+            "# TYPE http_requests_total counter",
+        ]
+        for (method, route), metrics in routes:
+            for status, count in sorted(metrics.statuses.items()):
+                lines.append(
+                    f'http_requests_total{{method="{method}",route="{_escape(route)}",status="{status}"}} {count}'
+                )
+
+        lines += [
+            "# HELP db_statements_total SQL statements executed while handling requests",
+            "# TYPE db_statements_total counter",
+        ]
+        for (method, route), metrics in routes:
+            lines.append(f'db_statements_total{{method="{method}",route="{_escape(route)}"}} {metrics.statements}')
+
+        lines += [
+            "# HELP db_duration_seconds_total Time spent in SQL statements while handling requests",
+            "# TYPE db_duration_seconds_total counter",
+        ]
+        for (method, route), metrics in routes:
+            lines.append(
+                f'db_duration_seconds_total{{method="{method}",route="{_escape(route)}"}} {metrics.db_seconds:.6f}'
+            )
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+registry = MetricsRegistry()
+
+
+def install_sql_hooks(engine: Engine):
+    """엔진 이벤트로 SQL 실행 시간 측정 - 요청 처리 중(컨텍스트에 통계가 있을 때)만 누적"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_start"].pop()
+        stats = _current.get()
+        if stats is not None:
+            stats.statements += 1
+            stats.db_seconds += time.perf_counter() - started
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        # 실패한 문장은 after_cursor_execute가 호출되지 않으므로 시작 시각만 정리
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("query_start"):
+            connection.info["query_start"].pop()
+
+
+def route_name(scope: Scope) -> str:
+    """라우터가 찾은 경로 템플릿 (예: /api/orders/{order_id}), mount는 prefix"""
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None):
+        return route.path
+    return scope.get("root_path") or UNMATCHED_ROUTE
+
+
+def server_timing(total_seconds: float, stats: RequestStats) -> str:
+    """Server-Timing 헤더 값 (브라우저 개발자 도구 Network → Timing 탭에 표시)"""
+    return (
+        f"app;dur={total_seconds * 1000:.1f}, "
+        f'db;dur={stats.db_seconds * 1000:.1f};desc="{stats.statements} queries"'
+    )
+
+
+class MetricsMiddleware:
+    """
+    요청 계측 미들웨어
+    - 라우트별 지연 시간 히스토그램, 상태 코드, SQL 실행 횟수 / 시간 집계 (GET /metrics)
+    - 응답 헤더에 Server-Timing: app(응답 시작까지 전체) / db(SQL 시간, 횟수)
+    """
+
+    def __init__(self, app: ASGIApp, registry: MetricsRegistry = registry, server_timing: bool = SERVER_TIMING_ENABLED):
+        self.app = app
+        self.registry = registry
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", server_timing(time.perf_counter() - started, stats))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            self.registry.observe(
+                scope["method"], route_name(scope), time.perf_counter() - started, status, stats
+            )
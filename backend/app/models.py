@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from .database import Base
@@ -13,6 +13,8 @@ class User(Base):
     hashed_password = Column(String, nullable=True)  # 구글 로그인 사용자는 비밀번호 없음
     google_id = Column(String, nullable=True, unique=True, index=True)  # 구글 사용자 ID
     is_seller = Column(Integer, default=0)  # 0: 일반 사용자, 1: 판매자
+    is_admin = Column(Integer, default=0, nullable=False)  # 1: 관리자 (프로파일러 등 운영 기능)
+    token_version = Column(Integer, default=0, nullable=False)  # 올리면 이전에 발급한 토큰 모두 무효
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 관계 설정
@@ -20,6 +22,16 @@ class User(Base):
     orders = relationship("Order", back_populates="user")
     seller = relationship("Seller", back_populates="user", uselist=False)
 
+class RevokedToken(Base):
+    """폐기된(사용했거나 로그아웃한) 리프레시 토큰 - 만료 후에는 정리해도 됨"""
+    __tablename__ = "revoked_tokens"
+
+    id = Column(Integer, primary_key=True, index=True)
+    jti = Column(String(64), unique=True, index=True, nullable=False)  # 토큰 고유 ID
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)  # 원래 토큰 만료 시각
+    created_at = Column(DateTime, default=datetime.utcnow)
+
 class Seller(Base):
     __tablename__ = "sellers"
 
@@ -41,10 +53,46 @@ class ProductImage(Base):
     product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
     image_url = Column(String, nullable=False)
     display_order = Column(Integer, default=0, nullable=False)
+    asset_id = Column(Integer, ForeignKey("image_assets.id"), nullable=True)  # 기존 데이터는 NULL
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 관계
     product = relationship("Product", back_populates="images")
+    asset = relationship("ImageAsset")
+    # 목록 응답에서 이미지마다 추가 쿼리가 나가지 않도록 selectin 로딩
+    variants = relationship("ProductImageVariant", back_populates="image", cascade="all, delete-orphan", lazy="selectin", order_by="ProductImageVariant.width")
+
+    @property
+    def srcset(self):
+        """<img srcset> 속성 값 (예: "https://...w_200... 200w, https://...w_480... 480w")"""
+        return ", ".join(f"{v.image_url} {v.width}w" for v in self.variants)
+
+class ImageAsset(Base):
+    """업로드된 이미지 원본 (내용 해시 기준으로 한 번만 업로드)"""
+    __tablename__ = "image_assets"
+
+    id = Column(Integer, primary_key=True, index=True)
+    sha256 = Column(String(64), unique=True, index=True, nullable=False)
+    image_url = Column(String, nullable=False)
+    public_id = Column(String, nullable=True)  # 저장소 삭제용 ID
+    width = Column(Integer, nullable=True)
+    height = Column(Integer, nullable=True)
+    size = Column(Integer, nullable=True)  # 바이트
+    ref_count = Column(Integer, default=0, nullable=False)  # 참조하는 ProductImage 수
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+class ProductImageVariant(Base):
+    __tablename__ = "product_image_variants"
+
+    id = Column(Integer, primary_key=True, index=True)
+    image_id = Column(Integer, ForeignKey("product_images.id", ondelete="CASCADE"), nullable=False, index=True)
+    name = Column(String, nullable=False)  # thumbnail / card / detail
+    width = Column(Integer, nullable=False)
+    height = Column(Integer, nullable=True)  # 원본 크기를 모르는 기존 이미지는 NULL
+    image_url = Column(String, nullable=False)
+
+    # 관계
+    image = relationship("ProductImage", back_populates="variants")
 
 class Product(Base):
     __tablename__ = "products"
@@ -61,6 +109,7 @@ class Product(Base):
     # - API 레벨에서는 필수로 받되, 기존 데이터 호환을 위해 DB에서는 nullable 허용
     external_store_url = Column(String, nullable=True)
     is_active = Column(Integer, default=1)  # 추가: 1=활성, 0=비활성
+    stock = Column(Integer, nullable=True)  # 전체 재고 (NULL: 재고 관리 안 함)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # 관계 설정
@@ -68,9 +117,28 @@ class Product(Base):
     cart_items = relationship("CartItem", back_populates="product")
     order_items = relationship("OrderItem", back_populates="product")
     images = relationship("ProductImage", back_populates="product", cascade="all, delete-orphan", order_by="ProductImage.display_order")
+    options = relationship("ProductOption", back_populates="product", cascade="all, delete-orphan", lazy="selectin", order_by="ProductOption.id")
+
+class ProductOption(Base):
+    """사이즈별 재고 (S / M / L ...)"""
+    __tablename__ = "product_options"
+    __table_args__ = (
+        Index("uq_product_options_product_size", "product_id", "size", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    product_id = Column(Integer, ForeignKey("products.id", ondelete="CASCADE"), nullable=False)
+    size = Column(String(20), nullable=False)
+    stock = Column(Integer, nullable=True)  # NULL: 재고 관리 안 함
+
+    product = relationship("Product", back_populates="options")
 
 class CartItem(Base):
     __tablename__ = "cart_items"
+    # 사용자당 상품 1행 - 게스트 장바구니 병합 시 ON CONFLICT upsert 대상
+    __table_args__ = (
+        Index("uq_cart_items_user_product", "user_id", "product_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -82,6 +150,50 @@ class CartItem(Base):
     user = relationship("User", back_populates="cart_items")
     product = relationship("Product", back_populates="cart_items")
 
+class GuestCart(Base):
+    """
+    비로그인 장바구니 (쿠키의 랜덤 토큰으로 식별)
+    - 상품별 행 대신 "상품ID:수량,상품ID:수량" 문자열 한 칸에 저장
+    - 로그인/회원가입 시 cart_items로 병합하고 삭제
+    """
+    __tablename__ = "guest_carts"
+
+    token = Column(String(64), primary_key=True)
+    items = Column(Text, nullable=False, default="")
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, index=True)
+
+class CacheVersion(Base):
+    """
+    워커별 메모리 캐시의 버전 (키마다 정수 하나) - 데이터를 바꾸는 트랜잭션에서 올리고,
+    캐시를 읽을 때 비교해서 다른 워커에서 바뀐 내용도 반영 (app.cache_versions)
+    """
+    __tablename__ = "cache_versions"
+
+    key = Column(String(64), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class IdempotencyKey(Base):
+    """
+    Idempotency-Key 헤더로 보낸 요청의 처리 결과 (재시도 시 저장된 응답을 그대로 반환)
+    - status_code가 NULL이면 아직 처리 중
+    - 요청 본문은 SHA-256 해시만, 응답은 공백 없는 JSON으로 저장
+    - expires_at이 지나면 같은 키로 새 요청 가능 (처리 중에는 짧게, 응답 저장 후 보관 시간만큼)
+    """
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        Index("uq_idempotency_keys_user_scope_key", "user_id", "scope", "key", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    scope = Column(String(20), nullable=False)  # "orders", "products" 등 엔드포인트 구분
+    key = Column(String(255), nullable=False)
+    request_hash = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    response_body = Column(Text, nullable=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
 class OrderStatus(str, enum.Enum):
     CANCELLED = "cancelled"  # 주문취소
     REFUND_REQUESTED = "refund_requested"  # 환불요청
@@ -125,6 +237,7 @@ class OrderItem(Base):
     order_id = Column(Integer, ForeignKey("orders.id"), nullable=False)
     product_id = Column(Integer, ForeignKey("products.id"), nullable=False)
     quantity = Column(Integer, nullable=False)
+    size = Column(String(20), nullable=True)  # 사이즈 옵션 (없으면 NULL)
     price_at_order = Column(String, nullable=False)  # 주문 당시 가격
     
     # 관계 설정
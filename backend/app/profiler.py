@@ -0,0 +1,164 @@
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# ✅ 환경변수로 프로파일러 사용 여부 설정
+# - PROFILING_ENABLED=1 일 때만 /api/admin/profile 사용 가능 (관리자 전용)
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "0") == "1"
+PROFILE_MAX_SECONDS = int(os.getenv("PROFILE_MAX_SECONDS", "60"))
+
+# 샘플링 간격 범위 (밀리초)
+MIN_INTERVAL_MS = 1
+MAX_INTERVAL_MS = 100
+
+# 스택 맨 위가 이 함수면 대기 중인 스레드 (스레드풀 대기, 이벤트 루프 select 등)
+IDLE_FRAMES = {
+    ("threading.py", "wait"),
+    ("threading.py", "Condition.wait"),
+    ("threading.py", "Event.wait"),
+    ("queue.py", "get"),
+    ("queue.py", "Queue.get"),
+    ("selectors.py", "select"),
+    ("selectors.py", "EpollSelector.select"),
+    ("selectors.py", "KqueueSelector.select"),
+    ("selectors.py", "PollSelector.select"),
+    ("selectors.py", "SelectSelector.select"),
+}
+
+
+# 프레임 파일 경로에서 잘라낼 앞부분 (site-packages/, 표준 라이브러리 경로, app/ 앞 디렉토리)
+_PATH_PREFIX = re.compile(r".*(?:site-packages/|/lib/python\d+\.\d+/|/(?=app/))")
+
+
+def frame_label(code) -> str:
+    """스택 프레임 이름 "파일:함수" (collapsed 형식 구분자인 ';'와 공백은 사용하지 않음)"""
+    filename = _PATH_PREFIX.sub("", code.co_filename, count=1)
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{filename}:{name}".replace(";", ":").replace(" ", "_")
+
+
+def _is_idle(frame) -> bool:
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), getattr(code, "co_qualname", code.co_name)) in IDLE_FRAMES
+
+
+class ProfileSession:
+    """
+    샘플링 한 번 (N초 동안, 또는 path로 시작하는 요청 N개가 끝날 때까지)
+    - path가 있으면 해당 요청이 처리 중일 때만 샘플링
+      (동시에 처리 중인 다른 요청의 스택도 섞일 수 있음)
+    """
+
+    def __init__(self, seconds: float, interval: float, path: Optional[str] = None,
+                 requests: int = 0, include_idle: bool = False):
+        self.deadline = time.monotonic() + seconds
+        self.interval = interval
+        self.path = path
+        self.remaining = requests
+        self.include_idle = include_idle
+        self.in_flight = 0
+        self.matched = 0
+        self.samples = 0
+        self.stacks: Counter = Counter()
+        self.started = time.monotonic()
+        self.finished = threading.Event()
+        self._lock = threading.Lock()
+
+    def request_started(self, path: str) -> bool:
+        if self.path is None or not path.startswith(self.path):
+            return False
+        with self._lock:
+            if self.remaining <= 0:
+                return False
+            self.remaining -= 1
+            self.in_flight += 1
+            self.matched += 1
+        return True
+
+    def request_finished(self):
+        with self._lock:
+            self.in_flight -= 1
+            if self.remaining <= 0 and self.in_flight == 0:
+                self.finished.set()
+
+    def should_sample(self) -> bool:
+        return self.path is None or self.in_flight > 0
+
+    def sample(self, own_thread: int):
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own_thread:
+                continue
+            if not self.include_idle and _is_idle(frame):
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(frame_label(frame.f_code))
+                frame = frame.f_back
+            stack.append(names.get(thread_id, str(thread_id)).replace(" ", "_").replace(";", ":"))
+            self.stacks[";".join(reversed(stack))] += 1
+        self.samples += 1
+
+    def run(self):
+        """샘플링 스레드 - 끝나면 finished 설정"""
+        own_thread = threading.get_ident()
+        while not self.finished.is_set() and time.monotonic() < self.deadline:
+            if self.should_sample():
+                self.sample(own_thread)
+            time.sleep(self.interval)
+        self.finished.set()
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope에서 읽는 collapsed stacks ("a;b;c 개수" 한 줄씩)"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class Profiler:
+    """
+    워커 프로세스당 프로파일러 하나 (동시에 한 세션만)
+    - 세션이 없을 때 미들웨어는 속성 하나만 확인하고 통과 (대기 중 비용 없음)
+    """
+
+    def __init__(self):
+        self.session: Optional[ProfileSession] = None
+        self._lock = threading.Lock()
+
+    def start(self, session: ProfileSession) -> bool:
+        with self._lock:
+            if self.session is not None:
+                return False
+            self.session = session
+        threading.Thread(target=session.run, name="profiler", daemon=True).start()
+        return True
+
+    def finish(self, session: ProfileSession):
+        session.finished.set()
+        with self._lock:
+            if self.session is session:
+                self.session = None
+
+
+profiler = Profiler()
+
+
+class ProfileMiddleware:
+    """path를 지정한 프로파일 세션에서 대상 요청이 처리 중인지 표시"""
+
+    def __init__(self, app: ASGIApp, profiler: Profiler = profiler):
+        self.app = app
+        self.profiler = profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        session = self.profiler.session
+        if session is None or scope["type"] != "http" or not session.request_started(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            session.request_finished()
@@ -0,0 +1,172 @@
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Optional, Tuple
+from fastapi import HTTPException, Request, status
+
+# ✅ 환경변수로 제한 값 설정 ("버킷 크기/초" 형식, 예: "10/60" → 최대 10번 연속, 60초에 10개 충전)
+LOGIN_RATE_LIMIT_IP = os.getenv("LOGIN_RATE_LIMIT_IP", "20/60")
+LOGIN_RATE_LIMIT_EMAIL = os.getenv("LOGIN_RATE_LIMIT_EMAIL", "5/60")
+SIGNUP_RATE_LIMIT_IP = os.getenv("SIGNUP_RATE_LIMIT_IP", "10/600")
+# 여러 워커/서버가 버킷을 공유할 때 Redis 주소 (없으면 워커별 메모리)
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL")
+# 메모리 저장소가 기억하는 최대 키 수 (넘으면 오래 안 쓴 키부터 삭제)
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+# 프록시(Render 등) 뒤에서 X-Forwarded-For 첫 번째 주소를 클라이언트 IP로 사용
+TRUST_PROXY_HEADERS = os.getenv("TRUST_PROXY_HEADERS", "0") == "1"
+
+
+def parse_rate(rate: str) -> Tuple[int, float]:
+    """ "10/60" → (버킷 크기 10, 초당 충전량 10/60) """
+    capacity, seconds = rate.split("/")
+    return int(capacity), int(capacity) / float(seconds)
+
+
+class RateLimitStore(ABC):
+    """
+    토큰 버킷 저장소 인터페이스
+    - take(): 토큰 1개 사용, (허용 여부, 다음 토큰까지 남은 초) 반환 - 요청 처리 중 호출되므로 이벤트 루프를 막지 않아야 함
+    """
+
+    @abstractmethod
+    async def take(self, key: str, capacity: int, refill_rate: float) -> Tuple[bool, float]:
+        ...
+
+    def ping(self):
+        """저장소 연결 확인 (readiness 검사) - 실패 시 예외, 메모리 저장소는 확인할 것 없음"""
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    """워커별 메모리 저장소 - 키마다 (남은 토큰, 마지막 갱신 시각)만 저장"""
+
+    def __init__(self, max_keys: int = RATE_LIMIT_MAX_KEYS):
+        self.max_keys = max_keys
+        self.buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def take(self, key: str, capacity: int, refill_rate: float) -> Tuple[bool, float]:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self.buckets.pop(key, (capacity, now))
+            tokens = min(capacity, tokens + (now - updated_at) * refill_rate)
+            if tokens >= 1:
+                tokens -= 1
+                retry_after = 0.0
+            else:
+                retry_after = (1 - tokens) / refill_rate
+
+            self.buckets[key] = (tokens, now)
+            if len(self.buckets) > self.max_keys:
+                self.buckets.popitem(last=False)
+        return retry_after == 0.0, retry_after
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """
+    Redis 공유 저장소 - 계산은 Lua 스크립트로 Redis 안에서 원자적으로 실행
+    - 버킷은 가득 찰 때까지 걸리는 시간 뒤에 자동 삭제
+    """
+
+    SCRIPT = """
+    local capacity = tonumber(ARGV[1])
+    local rate = tonumber(ARGV[2])
+    local now = tonumber(ARGV[3])
+    local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+    local tokens = tonumber(bucket[1]) or capacity
+    local ts = tonumber(bucket[2]) or now
+    tokens = math.min(capacity, tokens + (now - ts) * rate)
+    local retry_after = 0
+    if tokens >= 1 then
+        tokens = tokens - 1
+    else
+        retry_after = (1 - tokens) / rate
+    end
+    redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+    redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+    return tostring(retry_after)
+    """
+
+    def __init__(self, url: str):
+        import redis
+        import redis.asyncio
+
+        # 요청 처리용 비동기 클라이언트 (Redis 왕복 동안 이벤트 루프를 막지 않음)
+        self.client = redis.asyncio.Redis.from_url(url)
+        self.script = self.client.register_script(self.SCRIPT)
+        # readiness 검사용 동기 클라이언트 (검사는 스레드에서 실행)
+        self.sync_client = redis.Redis.from_url(url)
+
+    async def take(self, key: str, capacity: int, refill_rate: float) -> Tuple[bool, float]:
+        retry_after = float(await self.script(keys=[f"ratelimit:{key}"], args=[capacity, refill_rate, time.time()]))
+        return retry_after == 0.0, retry_after
+
+    def ping(self):
+        self.sync_client.ping()
+
+
+_store: Optional[RateLimitStore] = None
+
+
+def get_store() -> RateLimitStore:
+    global _store
+    if _store is None:
+        _store = RedisRateLimitStore(RATE_LIMIT_REDIS_URL) if RATE_LIMIT_REDIS_URL else MemoryRateLimitStore()
+    return _store
+
+
+def set_store(store: RateLimitStore):
+    """저장소 교체 (공유 저장소 직접 구현 / 테스트용)"""
+    global _store
+    _store = store
+
+
+def client_ip(request: Request) -> str:
+    if TRUST_PROXY_HEADERS:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+class RateLimit:
+    """
+    토큰 버킷 제한 의존성 - 초과하면 429 + Retry-After
+    - ip_rate: IP별 제한, email_rate: 요청 본문 email별 제한 (None이면 사용 안 함)
+    - 비밀번호 해싱 전에 실행되므로 거절된 요청은 CPU를 거의 쓰지 않음
+    """
+
+    def __init__(self, name: str, ip_rate: Optional[str] = None, email_rate: Optional[str] = None):
+        self.name = name
+        self.ip_rate = parse_rate(ip_rate) if ip_rate else None
+        self.email_rate = parse_rate(email_rate) if email_rate else None
+
+    async def __call__(self, request: Request):
+        store = get_store()
+        if self.ip_rate:
+            await self.check(store, f"{self.name}:ip:{client_ip(request)}", self.ip_rate)
+
+        if self.email_rate:
+            try:
+                # 본문은 Starlette가 캐시하므로 엔드포인트에서 다시 읽지 않음
+                email = (await request.json()).get("email")
+            except Exception:
+                email = None
+            if isinstance(email, str) and email:
+                await self.check(store, f"{self.name}:email:{email.strip().lower()}", self.email_rate)
+
+    @staticmethod
+    async def check(store: RateLimitStore, key: str, rate: Tuple[int, float]):
+        allowed, retry_after = await store.take(key, *rate)
+        if not allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요",
+                headers={"Retry-After": str(math.ceil(retry_after))},
+            )
+
+
+login_rate_limit = RateLimit("login", ip_rate=LOGIN_RATE_LIMIT_IP, email_rate=LOGIN_RATE_LIMIT_EMAIL)
+signup_rate_limit = RateLimit("signup", ip_rate=SIGNUP_RATE_LIMIT_IP)
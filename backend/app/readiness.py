@@ -0,0 +1,218 @@
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+# ✅ 환경변수로 readiness 검사 설정
+# - READINESS_CHECK_INTERVAL: 백그라운드 검사 간격 (초) - 프로브는 마지막 결과만 읽음 (DB 연결 없음)
+# - READINESS_CHECK_TIMEOUT: 검사 하나의 제한 시간 (초)
+# - READINESS_FAILURE_THRESHOLD: 연속으로 이 횟수만큼 실패하면 degraded (일시적인 실패로 트래픽이 끊기지 않게)
+READINESS_CHECK_INTERVAL = float(os.getenv("READINESS_CHECK_INTERVAL", "10"))
+READINESS_CHECK_TIMEOUT = float(os.getenv("READINESS_CHECK_TIMEOUT", "5"))
+READINESS_FAILURE_THRESHOLD = int(os.getenv("READINESS_FAILURE_THRESHOLD", "2"))
+
+# 오류 메시지 최대 길이
+MAX_ERROR_LENGTH = 200
+
+
+def ping_database(engine: Engine):
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
+def pool_state(engine: Engine) -> Dict:
+    """연결 풀 상태 (QueuePool이면 크기 / 사용 중 / 초과 연결 수)"""
+    pool = engine.pool
+    state = {"class": type(pool).__name__, "status": pool.status()}
+    for name in ("size", "checkedin", "checkedout", "overflow"):
+        method = getattr(pool, name, None)
+        if callable(method):
+            state[name] = method()
+    return state
+
+
+def cache_state() -> Dict:
+    """워커 메모리 캐시 상태 (readiness에는 영향 없음, 확인용)"""
+    from .auth import _token_versions
+    from .google_certs import _cert_cache
+    from .rate_limit import get_store
+    from .token_revocation import revocation_store
+
+    now = time.monotonic()
+    return {
+        "google_certs": {
+            "loaded": _cert_cache.certs is not None,
+            "keys": len(_cert_cache.certs or {}),
+            "expires_in_seconds": round(_cert_cache.expires_at - now) if _cert_cache.certs else None,
+        },
+        "token_versions": {"entries": len(_token_versions)},
+        "revoked_tokens": {
+            "loaded": revocation_store.loaded,
+            "entries": len(revocation_store.revoked),
+            "bloom_capacity": revocation_store.bloom.capacity,
+        },
+        "rate_limit_store": type(get_store()).__name__,
+    }
+
+
+class CheckResult:
+    """검사 하나의 최근 결과 (연속 실패 횟수 포함)"""
+
+    __slots__ = ("ok", "latency_ms", "error", "failures", "checked_at")
+
+    def __init__(self):
+        self.ok: Optional[bool] = None
+        self.latency_ms: Optional[float] = None
+        self.error: Optional[str] = None
+        self.failures = 0
+        self.checked_at: Optional[datetime] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "ok": self.ok,
+            "latency_ms": self.latency_ms,
+            "error": self.error,
+            "consecutive_failures": self.failures,
+            "checked_at": self.checked_at.isoformat() if self.checked_at else None,
+        }
+
+
+class ReadinessChecker:
+    """
+    워커당 하나 - 백그라운드 작업이 주기적으로 DB 등 의존성을 확인하고 결과를 저장
+    - /ready, /health/deep 은 저장된 결과만 읽음 (프로브마다 DB 연결을 열지 않음)
+    - 블로킹 검사는 스레드에서 실행, 제한 시간을 넘기면 실패로 기록하고
+      끝나지 않은 검사가 있으면 다음 주기에 새로 시작하지 않음 (스레드가 쌓이지 않게)
+    """
+
+    def __init__(self, interval: float = READINESS_CHECK_INTERVAL, timeout: float = READINESS_CHECK_TIMEOUT,
+                 failure_threshold: int = READINESS_FAILURE_THRESHOLD):
+        self.interval = interval
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.checks: Dict[str, Callable[[], None]] = {}
+        self.results: Dict[str, CheckResult] = {}
+        self.critical: Dict[str, bool] = {}
+        self.pool: Dict = {}
+        self.caches: Dict = {}
+        self.last_run: Optional[float] = None
+        self.stopping = False
+        self._engine: Optional[Engine] = None
+        self._pending: Dict[str, Tuple[asyncio.Future, float]] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def add_check(self, name: str, check: Callable[[], None], critical: bool = True):
+        """
+        실패하면 예외를 던지는 동기 함수 등록
+        - critical=False: 결과만 기록하고 readiness에는 영향 없음 (대체 경로가 있는 의존성, 예: 복제본)
+        """
+        self.checks[name] = check
+        self.results[name] = CheckResult()
+        self.critical[name] = critical
+
+    def is_healthy(self, name: str) -> bool:
+        """마지막 검사에서 실패하지 않았는지 (아직 검사 전이면 True)"""
+        result = self.results.get(name)
+        return result is None or result.failures == 0
+
+    def watch_engine(self, engine: Engine):
+        self._engine = engine
+        self.add_check("database", lambda: ping_database(engine))
+
+    async def _run_check(self, name: str, check: Callable[[], None]):
+        result = self.results[name]
+        pending = self._pending.get(name)
+        if pending is None or pending[0].done():
+            pending = self._pending[name] = (asyncio.ensure_future(asyncio.to_thread(check)), time.perf_counter())
+        future, started = pending
+        try:
+            await asyncio.wait_for(asyncio.shield(future), self.timeout)
+            elapsed = time.perf_counter() - started
+            if elapsed > self.timeout:
+                # 이전 주기에 시작한 검사가 늦게 끝남 - 응답은 했지만 제한 시간 초과
+                raise TimeoutError(f"took {elapsed:.1f}s")
+        except asyncio.TimeoutError:
+            result.ok, result.error = False, f"timed out after {self.timeout:g}s"
+            result.failures += 1
+        except Exception as e:
+            result.ok, result.error = False, f"{type(e).__name__}: {e}"[:MAX_ERROR_LENGTH]
+            result.failures += 1
+        else:
+            result.ok, result.error, result.failures = True, None, 0
+        result.latency_ms = round((time.perf_counter() - started) * 1000, 2)
+        result.checked_at = datetime.utcnow()
+
+    async def run_once(self):
+        await asyncio.gather(*(self._run_check(name, check) for name, check in self.checks.items()))
+        if self._engine is not None:
+            self.pool = pool_state(self._engine)
+        self.caches = cache_state()
+        self.last_run = time.monotonic()
+
+    async def _loop(self):
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                print(f"Readiness check failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        self.stopping = False
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self):
+        """종료 시작 - 이후 /ready는 503 (로드밸런서가 새 요청을 보내지 않도록)"""
+        self.stopping = True
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def is_stale(self) -> bool:
+        """
+        마지막 검사가 너무 오래됨 - 검사 작업이 멈춘 것으로 보고 degraded
+        (이벤트 루프가 막혀 있거나 스레드풀이 가득 찬 워커)
+        """
+        return self.last_run is not None and time.monotonic() - self.last_run > self.interval * 3 + self.timeout
+
+    def failing(self):
+        failing = [
+            name for name, result in self.results.items()
+            if self.critical[name] and result.failures >= self.failure_threshold
+        ]
+        if self.is_stale():
+            failing.append("checker")
+        return failing
+
+    def summary(self) -> Dict:
+        """상태 (starting / ready / degraded / stopping)와 실패 중인 검사 이름"""
+        failing = self.failing()
+        if self.stopping:
+            status = "stopping"
+        elif self.last_run is None:
+            status = "starting"
+        else:
+            status = "degraded" if failing else "ready"
+        return {"status": status, "failing": failing}
+
+    def details(self) -> Dict:
+        return {
+            **self.summary(),
+            "last_check_age_seconds": round(time.monotonic() - self.last_run, 1) if self.last_run else None,
+            "checks": {
+                name: {**result.to_dict(), "critical": self.critical[name]} for name, result in self.results.items()
+            },
+            "pool": self.pool,
+            "caches": self.caches,
+        }
+
+
+readiness = ReadinessChecker()
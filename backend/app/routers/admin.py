@@ -0,0 +1,68 @@
+import asyncio
+import time
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from .. import models
+from ..auth import get_admin_user
+from ..slow_queries import slow_query_log
+from ..profiler import (
+    MAX_INTERVAL_MS, MIN_INTERVAL_MS, PROFILE_MAX_SECONDS, PROFILING_ENABLED, ProfileSession, profiler
+)
+
+router = APIRouter(prefix="/api/admin", tags=["admin"])
+
+@router.post("/profile", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(5, gt=0, description=f"샘플링 시간 (path 지정 시 최대 대기 시간, 최대 {PROFILE_MAX_SECONDS}초)"),
+    interval_ms: int = Query(5, ge=MIN_INTERVAL_MS, le=MAX_INTERVAL_MS, description="샘플링 간격 (밀리초)"),
+    path: Optional[str] = Query(None, description="이 경로로 시작하는 요청을 처리하는 동안만 샘플링 (예: /api/products)"),
+    requests: int = Query(10, ge=1, le=1000, description="path 지정 시 샘플링할 요청 수"),
+    idle: bool = Query(False, description="대기 중인 스레드 스택도 포함"),
+    current_user: models.User = Depends(get_admin_user)
+):
+    """
+    이 워커의 스택 샘플링 결과를 collapsed stacks 형식으로 반환 (관리자 전용, PROFILING_ENABLED=1 필요)
+    - flamegraph.pl, speedscope 등에 그대로 넣으면 플레임그래프로 볼 수 있음
+    - path 없이: seconds 동안 전체 스레드 샘플링
+    - path 지정: 해당 요청 requests개가 끝날 때까지 (또는 seconds가 지날 때까지) 처리 중에만 샘플링
+    """
+    if not PROFILING_ENABLED:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    seconds = min(seconds, PROFILE_MAX_SECONDS)
+    session = ProfileSession(
+        seconds=seconds,
+        interval=interval_ms / 1000,
+        path=path,
+        requests=requests if path else 0,
+        include_idle=idle,
+    )
+    if not profiler.start(session):
+        raise HTTPException(status_code=409, detail="이미 프로파일링 중입니다")
+
+    try:
+        # 이벤트 루프는 막지 않고 샘플링이 끝나기를 기다림
+        await asyncio.to_thread(session.finished.wait, seconds)
+    finally:
+        profiler.finish(session)
+
+    return PlainTextResponse(session.collapsed(), headers={
+        "X-Profile-Samples": str(session.samples),
+        "X-Profile-Requests": str(session.matched),
+        "X-Profile-Seconds": f"{time.monotonic() - session.started:.3f}",
+    })
+
+@router.get("/slow-queries")
+async def get_slow_queries(
+    limit: int = Query(20, ge=1, le=500),
+    current_user: models.User = Depends(get_admin_user)
+):
+    """
+    이 워커에서 기록된 느린 쿼리 (fingerprint별 총 실행 시간 순, 관리자 전용)
+    - 여러 워커 / 재시작 이후까지 집계하려면 SLOW_QUERY_LOG 파일을 python -m app.slow_queries로 확인
+    """
+    return {
+        "threshold_ms": slow_query_log.threshold_ms,
+        "queries": slow_query_log.report(limit),
+    }
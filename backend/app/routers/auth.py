@@ -1,14 +1,18 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
-from datetime import timedelta
+from datetime import datetime, timedelta
 from .. import models, schemas
 from ..database import get_db
-from ..auth import hash_password, verify_password, create_access_token, get_current_user, ACCESS_TOKEN_EXPIRE_MINUTES, verify_google_token
+from ..auth import hash_password, verify_password, create_user_token, create_refresh_token, decode_refresh_token, revoke_user_tokens, get_current_user, ACCESS_TOKEN_EXPIRE_MINUTES, verify_google_token
+from ..token_revocation import revocation_store
+from ..rate_limit import login_rate_limit, signup_rate_limit
+from ..guest_cart import merge_guest_cart
+from ..db_routing import mark_writer
 
 router = APIRouter(prefix="/api/auth", tags=["auth"])
 
-@router.post("/signup", response_model=schemas.Token)
-async def signup(user: schemas.UserSignup, db: Session = Depends(get_db)):
+@router.post("/signup", response_model=schemas.Token, dependencies=[Depends(signup_rate_limit)])
+async def signup(user: schemas.UserSignup, request: Request, response: Response, db: Session = Depends(get_db)):
     # 이메일 중복 확인
     db_user = db.query(models.User).filter(models.User.email == user.email).first()
     if db_user:
@@ -29,20 +33,24 @@ async def signup(user: schemas.UserSignup, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(new_user)
     
-    # JWT 토큰 생성
+    # 비로그인 장바구니 병합
+    merge_guest_cart(db, request, response, new_user.id)
+    # 이후 조회(토큰의 사용자 ID)도 기본 DB로
+    mark_writer(request, new_user.id)
+    
+    # JWT 토큰 생성 (사용자 ID / 판매자 ID / 토큰 버전 클레임 포함)
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": new_user.email}, expires_delta=access_token_expires
-    )
+    access_token = create_user_token(new_user, expires_delta=access_token_expires)
     
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "user": schemas.UserResponse(name=new_user.name, email=new_user.email)
+        "user": schemas.UserResponse(name=new_user.name, email=new_user.email),
+        "refresh_token": create_refresh_token(new_user)
     }
 
-@router.post("/login", response_model=schemas.Token)
-async def login(user: schemas.UserLogin, db: Session = Depends(get_db)):
+@router.post("/login", response_model=schemas.Token, dependencies=[Depends(login_rate_limit)])
+async def login(user: schemas.UserLogin, request: Request, response: Response, db: Session = Depends(get_db)):
     # 사용자 찾기
     db_user = db.query(models.User).filter(models.User.email == user.email).first()
     if not db_user:
@@ -65,20 +73,24 @@ async def login(user: schemas.UserLogin, db: Session = Depends(get_db)):
             detail="Incorrect email or password"
         )
     
-    # JWT 토큰 생성
+    # 비로그인 장바구니 병합
+    merge_guest_cart(db, request, response, db_user.id)
+    # 이후 조회(토큰의 사용자 ID)도 기본 DB로
+    mark_writer(request, db_user.id)
+    
+    # JWT 토큰 생성 (사용자 ID / 판매자 ID / 토큰 버전 클레임 포함)
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": db_user.email}, expires_delta=access_token_expires
-    )
+    access_token = create_user_token(db_user, expires_delta=access_token_expires)
     
     return {
         "access_token": access_token,
         "token_type": "bearer",
-        "user": schemas.UserResponse(name=db_user.name, email=db_user.email, is_seller=db_user.is_seller)
+        "user": schemas.UserResponse(name=db_user.name, email=db_user.email, is_seller=db_user.is_seller),
+        "refresh_token": create_refresh_token(db_user)
     }
 
 @router.post("/google", response_model=schemas.Token)
-async def google_login(google_token: schemas.GoogleToken, db: Session = Depends(get_db)):
+async def google_login(google_token: schemas.GoogleToken, request: Request, response: Response, db: Session = Depends(get_db)):
     """구글 OAuth 토큰으로 로그인/회원가입"""
     try:
         # 구글 토큰 검증 및 사용자 정보 추출
@@ -126,16 +138,20 @@ async def google_login(google_token: schemas.GoogleToken, db: Session = Depends(
             db.commit()
             db.refresh(db_user)
         
-        # JWT 토큰 생성
+        # 비로그인 장바구니 병합
+        merge_guest_cart(db, request, response, db_user.id)
+        # 이후 조회(토큰의 사용자 ID)도 기본 DB로
+        mark_writer(request, db_user.id)
+        
+        # JWT 토큰 생성 (사용자 ID / 판매자 ID / 토큰 버전 클레임 포함)
         access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-        access_token = create_access_token(
-            data={"sub": db_user.email}, expires_delta=access_token_expires
-        )
+        access_token = create_user_token(db_user, expires_delta=access_token_expires)
         
         return {
             "access_token": access_token,
             "token_type": "bearer",
-            "user": schemas.UserResponse(name=db_user.name, email=db_user.email, is_seller=db_user.is_seller)
+            "user": schemas.UserResponse(name=db_user.name, email=db_user.email, is_seller=db_user.is_seller),
+            "refresh_token": create_refresh_token(db_user)
         }
     except HTTPException:
         raise
@@ -148,3 +164,47 @@ async def google_login(google_token: schemas.GoogleToken, db: Session = Depends(
 @router.get("/me", response_model=schemas.UserResponse)
 async def get_me(current_user: models.User = Depends(get_current_user)):
     return schemas.UserResponse(name=current_user.name, email=current_user.email, is_seller=current_user.is_seller)
+
+@router.post("/refresh", response_model=schemas.Token)
+async def refresh(request: schemas.RefreshTokenRequest, db: Session = Depends(get_db)):
+    """
+    리프레시 토큰으로 액세스 토큰 재발급 (비밀번호 해싱 없음)
+    - 사용한 리프레시 토큰은 폐기하고 새 리프레시 토큰 발급 (rotation)
+    - 이미 폐기된 토큰이 다시 오면 탈취로 보고 이 사용자의 모든 토큰 무효화
+    """
+    payload = decode_refresh_token(request.refresh_token)
+    invalid_token = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+    db_user = db.query(models.User).filter(models.User.id == payload["uid"]).first()
+    if not db_user or payload.get("ver") != (db_user.token_version or 0):
+        raise invalid_token
+
+    expires_at = datetime.utcfromtimestamp(payload["exp"])
+    if (
+        revocation_store.is_revoked(db, payload["jti"])
+        or not revocation_store.revoke(db, payload["jti"], db_user.id, expires_at)
+    ):
+        revoke_user_tokens(db_user)
+        db.commit()
+        raise invalid_token
+
+    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    access_token = create_user_token(db_user, expires_delta=access_token_expires)
+
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "user": schemas.UserResponse(name=db_user.name, email=db_user.email, is_seller=db_user.is_seller),
+        "refresh_token": create_refresh_token(db_user)
+    }
+
+@router.post("/logout")
+async def logout(request: schemas.RefreshTokenRequest, db: Session = Depends(get_db)):
+    """리프레시 토큰 폐기 (액세스 토큰은 만료 시간까지 유효)"""
+    payload = decode_refresh_token(request.refresh_token)
+    revocation_store.revoke(db, payload["jti"], payload["uid"], datetime.utcfromtimestamp(payload["exp"]))
+    return {"message": "Logged out"}
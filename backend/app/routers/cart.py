@@ -1,27 +1,104 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from typing import List
 from .. import models, schemas
 from ..database import get_db
-from ..auth import get_current_user
+from ..auth import get_current_user, get_token_user, TokenUser
+from ..guest_cart import decode_items, get_guest_cart, get_or_create_guest_cart, set_guest_item
+from ..cart_summary import get_cart_summary, invalidate_cart_summary
 
 router = APIRouter(prefix="/api/cart", tags=["cart"])
 
 @router.get("/", response_model=List[schemas.CartItemResponse])
 async def get_cart(
-    current_user: models.User = Depends(get_current_user),
+    current_user: TokenUser = Depends(get_token_user),
     db: Session = Depends(get_db)
 ):
     """현재 사용자의 장바구니 조회"""
     cart_items = db.query(models.CartItem).filter(
         models.CartItem.user_id == current_user.id
     ).all()
+    return cart_items
+
+@router.get("/summary", response_model=schemas.CartSummaryResponse)
+async def get_cart_summary_view(
+    current_user: TokenUser = Depends(get_token_user),
+    db: Session = Depends(get_db)
+):
+    """장바구니 요약 - 상품별 합계, 판매자별 소계/상품 수, 전체 합계 (장바구니가 바뀔 때까지 캐시)"""
+    return get_cart_summary(db, current_user.id)
 
-    print(current_user.is_seller)
-    print(current_user.id)
+def _guest_cart_items(db: Session, cart):
+    """게스트 장바구니 응답 - 상품은 한 번의 IN 쿼리로 조회, 삭제된 상품은 제외"""
+    items = decode_items(cart.items) if cart else {}
+    if not items:
+        return []
 
+    products = {
+        product.id: product
+        for product in db.query(models.Product).filter(models.Product.id.in_(items))
+    }
+    return [
+        {"product_id": product_id, "quantity": quantity, "product": products[product_id]}
+        for product_id, quantity in items.items()
+        if product_id in products
+    ]
 
-    return cart_items
+@router.get("/guest", response_model=List[schemas.GuestCartItemResponse])
+async def get_guest_cart_items(request: Request, db: Session = Depends(get_db)):
+    """비로그인 장바구니 조회 (guest_cart 쿠키)"""
+    return _guest_cart_items(db, get_guest_cart(db, request))
+
+@router.post("/guest", response_model=List[schemas.GuestCartItemResponse])
+async def add_to_guest_cart(
+    item: schemas.CartItemCreate,
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_db)
+):
+    """비로그인 장바구니에 상품 추가 - 로그인하면 내 장바구니로 합쳐짐"""
+    product = db.query(models.Product).filter(
+        models.Product.id == item.product_id
+    ).first()
+    if not product:
+        raise HTTPException(status_code=404, detail="Product not found")
+    if item.quantity <= 0:
+        raise HTTPException(status_code=400, detail="Quantity must be greater than 0")
+
+    cart = get_or_create_guest_cart(db, request, response)
+    items = decode_items(cart.items)
+    set_guest_item(cart, item.product_id, items.get(item.product_id, 0) + item.quantity)
+    db.commit()
+    return _guest_cart_items(db, cart)
+
+@router.put("/guest/{product_id}", response_model=List[schemas.GuestCartItemResponse])
+async def update_guest_cart_quantity(
+    product_id: int,
+    quantity: int,
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """비로그인 장바구니 수량 변경 (0이면 삭제)"""
+    cart = get_guest_cart(db, request)
+    if not cart or product_id not in decode_items(cart.items):
+        raise HTTPException(status_code=404, detail="Cart item not found")
+    if quantity < 0:
+        raise HTTPException(status_code=400, detail="Quantity must be greater than 0")
+
+    set_guest_item(cart, product_id, quantity)
+    db.commit()
+    return _guest_cart_items(db, cart)
+
+@router.delete("/guest/{product_id}")
+async def remove_from_guest_cart(product_id: int, request: Request, db: Session = Depends(get_db)):
+    """비로그인 장바구니에서 상품 제거"""
+    cart = get_guest_cart(db, request)
+    if not cart or product_id not in decode_items(cart.items):
+        raise HTTPException(status_code=404, detail="Cart item not found")
+
+    set_guest_item(cart, product_id, 0)
+    db.commit()
+    return {"message": "Item removed from cart"}
 
 @router.post("/", response_model=schemas.CartItemResponse)
 async def add_to_cart(
@@ -46,6 +123,7 @@ async def add_to_cart(
     if existing_item:
         # 이미 있으면 수량만 증가
         existing_item.quantity += item.quantity
+        invalidate_cart_summary(db, current_user.id)
         db.commit()
         db.refresh(existing_item)
         return existing_item
@@ -57,6 +135,7 @@ async def add_to_cart(
         quantity=item.quantity
     )
     db.add(new_item)
+    invalidate_cart_summary(db, current_user.id)
     db.commit()
     db.refresh(new_item)
     return new_item
@@ -77,6 +156,7 @@ async def remove_from_cart(
         raise HTTPException(status_code=404, detail="Cart item not found")
     
     db.delete(cart_item)
+    invalidate_cart_summary(db, current_user.id)
     db.commit()
     return {"message": "Item removed from cart"}
 
@@ -100,6 +180,7 @@ async def update_cart_quantity(
         raise HTTPException(status_code=400, detail="Quantity must be greater than 0")
     
     cart_item.quantity = quantity
+    invalidate_cart_summary(db, current_user.id)
     db.commit()
     db.refresh(cart_item)
     return cart_item
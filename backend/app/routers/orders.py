@@ -3,7 +3,10 @@ from sqlalchemy.orm import Session
 from typing import List
 from .. import models, schemas
 from ..database import get_db
-from ..auth import get_current_user
+from ..db_routing import get_read_db
+from ..auth import get_current_user, get_token_user, TokenUser
+from ..inventory import reserve_stock
+from ..idempotency import IdempotencyClaim, order_idempotency
 
 router = APIRouter(prefix="/api/orders", tags=["orders"])
 
@@ -11,9 +14,13 @@ router = APIRouter(prefix="/api/orders", tags=["orders"])
 async def create_order(
     order: schemas.OrderCreate,
     current_user: models.User = Depends(get_current_user),
+    idempotency: IdempotencyClaim = Depends(order_idempotency),
     db: Session = Depends(get_db)
 ):
-    """주문 생성"""
+    """
+    주문 생성 - 재고가 있는 상품은 주문 수량만큼 차감 (부족하면 409, 주문 생성 안 함)
+    - Idempotency-Key 헤더로 재시도하면 주문을 다시 만들지 않고 처음 응답 반환
+    """
     # 판매자 확인
     seller = db.query(models.Seller).filter(models.Seller.id == order.seller_id).first()
     if not seller:
@@ -39,14 +46,22 @@ async def create_order(
         if not product:
             raise HTTPException(status_code=404, detail=f"Product {item.product_id} not found")
         
+        if item.quantity <= 0:
+            raise HTTPException(status_code=400, detail="Quantity must be greater than 0")
+        
         order_item = models.OrderItem(
             order_id=new_order.id,
             product_id=item.product_id,
             quantity=item.quantity,
+            size=item.size,
             price_at_order=product.price
         )
         db.add(order_item)
     
+    # 재고 차감 (조건부 UPDATE - 동시에 주문해도 재고보다 많이 팔리지 않음)
+    reserve_stock(db, [(item.product_id, item.size, item.quantity) for item in order.items])
+    
+    idempotency.store(db, schemas.OrderResponse, new_order)
     db.commit()
     db.refresh(new_order)
     
@@ -54,8 +69,8 @@ async def create_order(
 
 @router.get("/", response_model=List[schemas.OrderResponse])
 async def get_my_orders(
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Session = Depends(get_read_db)
 ):
     """내 주문 목록 조회"""
     orders = db.query(models.Order).filter(
@@ -66,8 +81,8 @@ async def get_my_orders(
 @router.get("/{order_id}", response_model=schemas.OrderResponse)
 async def get_order(
     order_id: int,
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Session = Depends(get_read_db)
 ):
     """주문 상세 조회"""
     order = db.query(models.Order).filter(
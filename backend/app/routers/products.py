@@ -1,15 +1,81 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Request
+from fastapi.responses import JSONResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import datetime
-import cloudinary.uploader
 import json
 from .. import models, schemas
 from ..database import get_db
-from ..auth import get_current_user
+from ..db_routing import get_read_db
+from ..auth import get_current_user, get_token_user, get_seller_id, TokenUser
+from ..images import build_variants
+from .. import cache_versions, image_assets
+from ..cart_summary import invalidate_cart_summary, parse_price
+from ..inventory import parse_size_stock, parse_stock, set_product_options
+from ..idempotency import IdempotencyClaim, product_idempotency
+from ..home_feed import home_feed
 
 router = APIRouter(prefix="/api/products", tags=["products"])
 
+# 목록 projection(view=card / fields=)에서 선택 가능한 컬럼
+# - 카드 그리드에 필요한 컬럼만 SQL에서 골라오기 위해 사용
+CARD_COLUMNS = {
+    "id": models.Product.id,
+    "name": models.Product.name,
+    "price": models.Product.price,
+    "image_url": models.Product.image_url,
+    "category_main": models.Product.category_main,
+    "category_sub": models.Product.category_sub,
+    "seller_name": models.Seller.name.label("seller_name"),
+}
+
+# 목록 응답 문서 - 응답 형식은 view/fields로 정해지므로 response_model 대신 responses로만 표시
+PRODUCT_LIST_RESPONSES = {
+    200: {
+        "model": schemas.ProductListResponse,
+        "description": "view=full(기본): 전체 상품 / view=card 또는 fields=: 선택한 필드만 담은 카드",
+    },
+}
+
+def _selected_fields(view: Optional[str], fields: Optional[str]) -> Optional[List[str]]:
+    """view/fields 쿼리 파라미터를 선택 컬럼 목록으로 변환 (None이면 전체 응답)"""
+    if fields:
+        selected = [f.strip() for f in fields.split(",") if f.strip()]
+        invalid = [f for f in selected if f not in CARD_COLUMNS]
+        if invalid:
+            raise HTTPException(status_code=400, detail=f"지원하지 않는 필드입니다: {', '.join(invalid)}")
+        # 클라이언트 캐시 키로 쓰이는 id는 항상 포함
+        if "id" not in selected:
+            selected.insert(0, "id")
+        return selected
+
+    if view is None or view == "full":
+        return None
+    if view == "card":
+        return list(CARD_COLUMNS)
+    raise HTTPException(status_code=400, detail=f"지원하지 않는 view입니다: {view}")
+
+def _project_products(db: Session, selected: List[str], *criteria) -> JSONResponse:
+    """선택한 컬럼만 조회해서 바로 JSON으로 응답 (ORM 객체/관계 로딩 없음)"""
+    query = db.query(*[CARD_COLUMNS[f] for f in selected]).select_from(models.Product)
+    if "seller_name" in selected:
+        query = query.join(models.Seller, models.Product.seller_id == models.Seller.id)
+    rows = query.filter(*criteria).all()
+    return JSONResponse(content=[
+        schemas.ProductCardResponse(**row._mapping).model_dump(exclude_unset=True)
+        for row in rows
+    ])
+
+def _list_products(db: Session, selected: Optional[List[str]], *criteria) -> JSONResponse:
+    """목록 응답 - 선택 컬럼(view=card / fields=)이 있으면 카드 projection, 없으면 전체 상품 (ProductResponse로 직렬화)"""
+    if selected:
+        return _project_products(db, selected, *criteria)
+
+    products = db.query(models.Product).filter(*criteria).all()
+    return JSONResponse(content=[
+        schemas.ProductResponse.model_validate(product).model_dump(mode="json")
+        for product in products
+    ])
+
 @router.get("/categories", response_model=dict)
 async def get_categories():
     """카테고리 목록 조회"""
@@ -20,33 +86,43 @@ async def get_categories():
     }
     return categories
 
-@router.get("/my/products", response_model=List[schemas.ProductResponse])
+@router.get("/home", response_model=schemas.HomeFeedResponse)
+async def get_home_feed(request: Request):
+    """
+    홈 화면 피드 - 카테고리별 최신 상품 / 전체 최신 상품 / 대표 판매자
+    - 메모리에 미리 만든 JSON(압축본 포함)으로 응답, DB 조회 없음
+    """
+    return await home_feed.response(request)
+
+@router.get("/my/products", response_model=None, responses=PRODUCT_LIST_RESPONSES)
 async def get_my_products(
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    view: Optional[str] = Query(None, description="card: 목록 카드용 경량 응답"),
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 응답 필드 (예: id,name,price)"),
+    current_user: TokenUser = Depends(get_token_user),
+    db: Session = Depends(get_read_db)
 ):
     """내가 등록한 상품 목록"""
-    seller = db.query(models.Seller).filter(
-        models.Seller.user_id == current_user.id
-    ).first()
+    selected = _selected_fields(view, fields)
+
+    seller_id = get_seller_id(current_user, db)
     
-    if not seller:
+    if not seller_id:
         raise HTTPException(status_code=403, detail="판매자가 아닙니다")
     
-    products = db.query(models.Product).filter(
-        models.Product.seller_id == seller.id,
-    ).all()
-    
-    return products
+    return _list_products(db, selected, models.Product.seller_id == seller_id)
 
-@router.get("/", response_model=List[schemas.ProductResponse])
-async def get_products(db: Session = Depends(get_db)):
+@router.get("/", response_model=None, responses=PRODUCT_LIST_RESPONSES)
+async def get_products(
+    view: Optional[str] = Query(None, description="card: 목록 카드용 경량 응답"),
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 응답 필드 (예: id,name,price)"),
+    db: Session = Depends(get_read_db)
+):
     """전체 상품 조회"""
-    products = db.query(models.Product).filter(models.Product.is_active == 1).all()
-    return products
+    selected = _selected_fields(view, fields)
+    return _list_products(db, selected, models.Product.is_active == 1)
 
 @router.get("/{product_id}", response_model=schemas.ProductResponse)
-async def get_product(product_id: int, db: Session = Depends(get_db)):
+async def get_product(product_id: int, db: Session = Depends(get_read_db)):
     product = db.query(models.Product).filter(models.Product.id == product_id).first()
     if not product:
         raise HTTPException(status_code=404, detail="Product not found")
@@ -60,11 +136,17 @@ async def create_product(
     category_main: str = Form("미분류"),
     category_sub: Optional[str] = Form(None),
     external_store_url: str = Form(...),
+    stock: Optional[str] = Form(None, description="전체 재고 (비우면 재고 관리 안 함)"),
+    size_stock: Optional[str] = Form(None, description='사이즈별 재고 JSON (예: {"S": 10, "M": 5})'),
     images: List[UploadFile] = File(...),
     current_user: models.User = Depends(get_current_user),
+    idempotency: IdempotencyClaim = Depends(product_idempotency),
     db: Session = Depends(get_db)
 ):
-    """상품 등록 (판매자만 가능) - Cloudinary"""
+    """
+    상품 등록 (판매자만 가능) - Cloudinary
+    - Idempotency-Key 헤더로 재시도하면 이미지를 다시 올리지 않고 처음 응답 반환
+    """
     seller = db.query(models.Seller).filter(
         models.Seller.user_id == current_user.id
     ).first()
@@ -78,32 +160,23 @@ async def create_product(
     if len(images) == 0:
         raise HTTPException(status_code=400, detail="최소 1개의 이미지가 필요합니다")
     
-    # 타임스탬프 한 번만 생성
-    timestamp = int(datetime.utcnow().timestamp())
+    # 가격 / 재고 값은 업로드 전에 검증
+    parse_price(price)
+    product_stock = parse_stock(stock)
+    sizes = parse_size_stock(size_stock) if size_stock else {}
     
-    # Cloudinary에 이미지 업로드
-    saved_image_urls = []
+    # Cloudinary에 이미지 업로드 (이미 올라간 적 있는 같은 이미지는 재사용)
+    saved_assets = []
     try:
-        for idx, image in enumerate(images):
-            # 파일 포인터를 처음으로 되돌림
-            await image.seek(0)
-            
-            # Cloudinary에 업로드
-            result = cloudinary.uploader.upload(
-                image.file,
-                folder=f"tshirts/products/seller_{seller.id}",
-                public_id=f"product_{timestamp}_{idx}",
-                resource_type="auto"
-            )
-            
-            # Cloudinary URL 저장
-            saved_image_urls.append(result['secure_url'])
+        for image in images:
+            asset = image_assets.get_or_upload(db, image.file)
+            saved_assets.append(asset)
             
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"이미지 업로드 실패: {str(e)}")
     
     # 첫 번째 이미지를 메인 이미지로
-    main_image_url = saved_image_urls[0]
+    main_image_url = saved_assets[0].image_url
     
     # 상품 생성
     new_product = models.Product(
@@ -115,21 +188,33 @@ async def create_product(
         category_main=category_main,
         category_sub=category_sub,
         external_store_url=external_store_url,
-        is_active=1
+        is_active=1,
+        stock=product_stock,
+        options=[models.ProductOption(size=size, stock=size_stock) for size, size_stock in sizes.items()]
     )
     db.add(new_product)
     db.flush()
     
-    # ProductImage 테이블에 저장
-    for idx, image_url in enumerate(saved_image_urls):
+    # ProductImage 테이블에 저장 (썸네일/카드/상세 변형 포함)
+    for idx, asset in enumerate(saved_assets):
         product_image = models.ProductImage(
             product_id=new_product.id,
-            image_url=image_url,
-            display_order=idx
+            image_url=asset.image_url,
+            display_order=idx,
+            asset_id=asset.id,
+            variants=[
+                models.ProductImageVariant(**v)
+                for v in build_variants(asset.image_url, asset.width, asset.height)
+            ]
         )
         db.add(product_image)
+        image_assets.acquire(db, asset.id)
     
+    idempotency.store(db, schemas.ProductResponse, new_product)
+    # 다른 워커의 홈 피드에 새 상품 반영
+    cache_versions.bump(db, cache_versions.PRODUCTS_ADDED)
     db.commit()
+    home_feed.product_changed(db, new_product.id)
     db.refresh(new_product)
     return new_product
 
@@ -142,6 +227,8 @@ async def update_product(
     category_main: str = Form("미분류"),
     category_sub: Optional[str] = Form(None),
     external_store_url: str = Form(...),
+    stock: Optional[str] = Form(None, description="전체 재고 (보내지 않으면 유지, 빈 값이면 재고 관리 안 함)"),
+    size_stock: Optional[str] = Form(None, description="사이즈별 재고 JSON (보내지 않으면 유지)"),
     images: Optional[List[UploadFile]] = File(None),
     slot_info: Optional[str] = Form(None),
     current_user: models.User = Depends(get_current_user),
@@ -163,6 +250,11 @@ async def update_product(
     if not existing_product:
         raise HTTPException(status_code=404, detail="상품을 찾을 수 없거나 권한이 없습니다")
     
+    # 가격 / 재고 값은 업로드 전에 검증
+    parse_price(price)
+    product_stock = parse_stock(stock) if stock is not None else None
+    sizes = parse_size_stock(size_stock) if size_stock is not None else None
+    
 # 슬롯 정보가 있는 경우 (수정 모드)
     if slot_info:
         try:
@@ -170,60 +262,88 @@ async def update_product(
         except:
             slots = []
         
-        # 기존 이미지 삭제
-        db.query(models.ProductImage).filter(
-            models.ProductImage.product_id == product_id
-        ).delete()
+        # 기존 이미지 (URL → 행 목록) - 유지되는 슬롯은 기존 행(id)을 그대로 사용
+        existing_images = {}
+        for image in existing_product.images:
+            existing_images.setdefault(image.image_url, []).append(image)
         
-        # 타임스탬프 생성
-        timestamp = int(datetime.utcnow().timestamp())
-        
-        # 새 파일들을 Cloudinary에 업로드
-        new_image_urls = []
+        # 새 파일들만 Cloudinary에 업로드 (같은 이미지는 재사용)
+        new_assets = []
         if images and len(images) > 0 and images[0].filename:
             try:
-                for idx, image in enumerate(images):
-                    await image.seek(0)
-                    
-                    result = cloudinary.uploader.upload(
-                        image.file,
-                        folder=f"tshirts/products/seller_{seller.id}",
-                        public_id=f"product_{product_id}_{timestamp}_{idx}",
-                        resource_type="auto"
-                    )
-                    
-                    new_image_urls.append(result['secure_url'])
+                for image in images:
+                    asset = image_assets.get_or_upload(db, image.file)
+                    new_assets.append(asset)
                     
             except Exception as e:
                 raise HTTPException(status_code=500, detail=f"이미지 업로드 실패: {str(e)}")
         
         # 슬롯 순서대로 최종 이미지 리스트 구성
-        final_image_urls = []
+        # - ("keep", 기존 행) / ("new", 새 asset) / ("url", 행이 없는 기존 URL)
+        final_images = []
         new_file_counter = 0
         
         for slot in slots:
             if slot['isNew']:
                 # 새 파일
-                if new_file_counter < len(new_image_urls):
-                    final_image_urls.append(new_image_urls[new_file_counter])
+                if new_file_counter < len(new_assets):
+                    final_images.append(("new", new_assets[new_file_counter]))
                     new_file_counter += 1
             else:
                 # 기존 이미지 유지
                 if slot['url']:
-                    final_image_urls.append(slot['url'])
+                    rows = existing_images.get(slot['url'])
+                    if rows:
+                        final_images.append(("keep", rows.pop(0)))
+                    else:
+                        final_images.append(("url", slot['url']))
         
-        if len(final_image_urls) > 0:
-            # 첫 번째 이미지를 메인으로
-            existing_product.image_url = final_image_urls[0]
-            
-            # ProductImage 테이블에 저장
-            for idx, image_url in enumerate(final_image_urls):
-                product_image = models.ProductImage(
+        # 슬롯에서 빠진 기존 이미지만 삭제 (변형 → 이미지 순서로 한 번에)
+        kept_ids = {item.id for kind, item in final_images if kind == "keep"}
+        removed = [image for image in existing_product.images if image.id not in kept_ids]
+        if removed:
+            removed_ids = [image.id for image in removed]
+            for image in removed:
+                if image.asset_id:
+                    image_assets.release(db, image.asset_id)
+            db.query(models.ProductImageVariant).filter(
+                models.ProductImageVariant.image_id.in_(removed_ids)
+            ).delete()
+            db.query(models.ProductImage).filter(
+                models.ProductImage.id.in_(removed_ids)
+            ).delete()
+        
+        # 유지: 순서가 바뀐 행만 UPDATE / 추가: 새 행 INSERT
+        for idx, (kind, item) in enumerate(final_images):
+            if kind == "keep":
+                if item.display_order != idx:
+                    item.display_order = idx
+                image_url = item.image_url
+            elif kind == "new":
+                image_url = item.image_url
+                db.add(models.ProductImage(
                     product_id=product_id,
                     image_url=image_url,
-                    display_order=idx
-                )
-                db.add(product_image)
+                    display_order=idx,
+                    asset_id=item.id,
+                    variants=[
+                        models.ProductImageVariant(**v)
+                        for v in build_variants(item.image_url, item.width, item.height)
+                    ]
+                ))
+                image_assets.acquire(db, item.id)
+            else:
+                image_url = item
+                db.add(models.ProductImage(
+                    product_id=product_id,
+                    image_url=image_url,
+                    display_order=idx,
+                    variants=[models.ProductImageVariant(**v) for v in build_variants(image_url)]
+                ))
+            
+            # 첫 번째 이미지를 메인으로
+            if idx == 0:
+                existing_product.image_url = image_url
     
     # 다른 필드 업데이트
     existing_product.name = name
@@ -233,8 +353,15 @@ async def update_product(
     existing_product.category_sub = category_sub
     existing_product.external_store_url = external_store_url
     existing_product.is_active = 1
+    if stock is not None:
+        existing_product.stock = product_stock
+    if sizes is not None:
+        set_product_options(db, existing_product, sizes)
     
+    # 가격/이름이 바뀌었을 수 있으므로 장바구니 요약 캐시 무효화 (모든 워커)
+    invalidate_cart_summary(db)
     db.commit()
+    home_feed.product_changed(db, existing_product.id)
     db.refresh(existing_product)
     return existing_product
 
@@ -262,5 +389,7 @@ async def delete_product(
     
     # DB에서 유지, 대신 비활성화 처리
     product.is_active = 0
+    invalidate_cart_summary(db)
     db.commit()
+    home_feed.product_changed(db, product.id)
     return {"message": "상품이 삭제되었습니다"}
\ No newline at end of file
@@ -2,23 +2,27 @@ from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
-import cloudinary.uploader
 from .. import models, schemas
 from ..database import get_db
-from ..auth import get_current_user
+from ..db_routing import get_read_db
+from ..home_feed import home_feed
+from ..cart_summary import invalidate_cart_summary
+from ..auth import get_current_user, get_token_user, get_seller_id, TokenUser
+from ..storage import get_storage
+from ..inventory import release_stock, reserve_stock
 
 router = APIRouter(prefix="/api/sellers", tags=["sellers"])
 
 @router.get("/", response_model=List[schemas.SellerResponse])
-async def get_sellers(db: Session = Depends(get_db)):
+async def get_sellers(db: Session = Depends(get_read_db)):
     """판매자 목록 조회"""
     sellers = db.query(models.Seller).all()
     return sellers
 
 @router.get("/me", response_model=schemas.SellerResponse)
 async def get_my_seller(
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Session = Depends(get_read_db)
 ):
     """내 판매자 정보 조회"""
     seller = db.query(models.Seller).filter(
@@ -38,7 +42,7 @@ async def create_seller(
     current_user: models.User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """판매자 등록 - Cloudinary 사용"""
+    """판매자 등록 - 미디어 저장소(Cloudinary/로컬) 사용"""
     existing_seller = db.query(models.Seller).filter(
         models.Seller.user_id == current_user.id
     ).first()
@@ -46,15 +50,14 @@ async def create_seller(
     if existing_seller:
         raise HTTPException(status_code=400, detail="이미 판매자로 등록되어 있습니다")
     
-    # QR 이미지 Cloudinary에 업로드
+    # QR 이미지 업로드
     qr_url = None
     if qr_image and qr_image.filename:
         try:
-            result = cloudinary.uploader.upload(
+            result = get_storage().upload(
                 qr_image.file,
                 folder="tshirts/qr_codes",
-                public_id=f"seller_{current_user.id}_qr_{int(datetime.utcnow().timestamp())}",
-                resource_type="auto"
+                public_id=f"seller_{current_user.id}_qr_{int(datetime.utcnow().timestamp())}"
             )
             qr_url = result['secure_url']
         except Exception as e:
@@ -84,7 +87,7 @@ async def update_my_seller(
     current_user: models.User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """내 판매자 정보 수정 - Cloudinary 사용"""
+    """내 판매자 정보 수정 - 미디어 저장소(Cloudinary/로컬) 사용"""
     seller = db.query(models.Seller).filter(
         models.Seller.user_id == current_user.id
     ).first()
@@ -92,16 +95,15 @@ async def update_my_seller(
     if not seller:
         raise HTTPException(status_code=404, detail="판매자 정보가 없습니다")
     
-    # QR 이미지 Cloudinary에 업로드
+    # QR 이미지 업로드
     if qr_image and qr_image.filename:
         try:
             await qr_image.seek(0)  # 파일 포인터 초기화
             
-            result = cloudinary.uploader.upload(
+            result = get_storage().upload(
                 qr_image.file,
                 folder="tshirts/qr_codes",
-                public_id=f"seller_{current_user.id}_qr_{int(datetime.utcnow().timestamp())}",
-                resource_type="auto"
+                public_id=f"seller_{current_user.id}_qr_{int(datetime.utcnow().timestamp())}"
             )
             
             seller.kakaopay_qr_url = result['secure_url']
@@ -112,27 +114,29 @@ async def update_my_seller(
     # 정보 업데이트
     seller.name = name
     seller.kakaopay_link = kakaopay_link
+    # 장바구니 요약의 판매자 이름 (모든 워커)
+    invalidate_cart_summary(db)
     
     db.commit()
+    # 홈 피드의 판매자 이름은 다음 재계산 때 반영
+    home_feed.invalidate()
     db.refresh(seller)
     
     return seller
 
 @router.get("/orders", response_model=List[schemas.OrderResponse])
 async def get_seller_orders(
-    current_user: models.User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: TokenUser = Depends(get_token_user),
+    db: Session = Depends(get_read_db)
 ):
     """판매자의 주문 목록 조회"""
-    seller = db.query(models.Seller).filter(
-        models.Seller.user_id == current_user.id
-    ).first()
+    seller_id = get_seller_id(current_user, db)
     
-    if not seller:
+    if not seller_id:
         raise HTTPException(status_code=403, detail="판매자가 아닙니다")
     
     orders = db.query(models.Order).filter(
-        models.Order.seller_id == seller.id
+        models.Order.seller_id == seller_id
     ).order_by(models.Order.created_at.desc()).all()
     
     return orders
@@ -164,13 +168,34 @@ async def update_order_status(
     if not new_status:
         raise HTTPException(status_code=400, detail="상태 값이 필요합니다")
     
+    try:
+        new_status = models.OrderStatus(new_status)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="올바르지 않은 상태 값입니다")
+    
+    # 취소하면 재고 복구, 취소를 되돌리면 다시 차감 (재고 부족 시 409)
+    cancelled = models.OrderStatus.CANCELLED
+    if (new_status == cancelled) != (order.status == cancelled):
+        # 조건부 UPDATE로 상태 전환 - 같은 요청이 동시에 와도 재고는 한 번만 복구/차감
+        switched = db.query(models.Order).filter(
+            models.Order.id == order.id,
+            models.Order.status == order.status
+        ).update({"status": new_status}, synchronize_session=False)
+        if not switched:
+            raise HTTPException(status_code=409, detail="주문 상태가 이미 변경되었습니다")
+        
+        if new_status == cancelled:
+            release_stock(db, order)
+        else:
+            reserve_stock(db, [(item.product_id, item.size, item.quantity) for item in order.order_items])
+    
     order.status = new_status
     db.commit()
     
     return {"message": "주문 상태가 변경되었습니다"}
 
 @router.get("/{seller_id}", response_model=schemas.SellerResponse)
-async def get_seller(seller_id: int, db: Session = Depends(get_db)):
+async def get_seller(seller_id: int, db: Session = Depends(get_read_db)):
     """판매자 상세 조회"""
     seller = db.query(models.Seller).filter(models.Seller.id == seller_id).first()
     if not seller:
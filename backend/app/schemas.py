@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional
+from pydantic import BaseModel, EmailStr, RootModel
+from typing import Dict, List, Optional, Union
 from datetime import datetime
 
 # 회원가입 요청
@@ -31,6 +31,11 @@ class Token(BaseModel):
     access_token: str
     token_type: str
     user: UserResponse
+    refresh_token: Optional[str] = None
+
+# 리프레시 토큰 요청 (토큰 갱신 / 로그아웃)
+class RefreshTokenRequest(BaseModel):
+    refresh_token: str
 
 # 판매자 생성 요청
 class SellerCreate(BaseModel):
@@ -49,11 +54,23 @@ class SellerResponse(BaseModel):
         from_attributes = True
 
 
+# 반응형 이미지 변형 (썸네일/카드/상세)
+class ProductImageVariantResponse(BaseModel):
+    name: str
+    width: int
+    height: Optional[int] = None
+    image_url: str
+
+    class Config:
+        from_attributes = True
+
 # ProductImage 스키마 추가
 class ProductImageResponse(BaseModel):
     id: int
     image_url: str
     display_order: int
+    variants: List[ProductImageVariantResponse] = []
+    srcset: Optional[str] = None
     
     class Config:
         from_attributes = True
@@ -70,6 +87,14 @@ class ProductCreate(BaseModel):
     external_store_url: str
     #seller_id: int
 
+# 사이즈 옵션 응답
+class ProductOptionResponse(BaseModel):
+    size: str
+    stock: Optional[int] = None  # None: 재고 관리 안 함
+
+    class Config:
+        from_attributes = True
+
 # 상품 응답
 class ProductResponse(BaseModel):
     id: int
@@ -84,10 +109,43 @@ class ProductResponse(BaseModel):
     is_active: int
     images: List[ProductImageResponse] = []  # 추가
     seller: Optional[SellerResponse] = None
+    stock: Optional[int] = None  # None: 재고 관리 안 함
+    options: List[ProductOptionResponse] = []
 
     class Config:
         from_attributes = True
 
+# 상품 카드 응답 (목록 그리드용 경량 스키마)
+# - fields= 로 일부 필드만 요청할 수 있으므로 id 외에는 모두 선택 항목
+class ProductCardResponse(BaseModel):
+    id: int
+    name: Optional[str] = None
+    price: Optional[str] = None
+    image_url: Optional[str] = None
+    category_main: Optional[str] = None
+    category_sub: Optional[str] = None
+    seller_name: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+# 상품 목록 응답 (OpenAPI 문서 전용) - view=full 이면 ProductResponse, view=card / fields= 면 ProductCardResponse
+# - 엔드포인트는 response_model=None으로 view에 맞는 형식을 직접 직렬화
+class ProductListResponse(RootModel[Union[List[ProductResponse], List[ProductCardResponse]]]):
+    pass
+
+# 홈 피드의 대표 판매자
+class FeaturedSellerResponse(BaseModel):
+    id: int
+    name: str
+
+# 홈 피드 응답 (GET /api/products/home - 미리 만든 JSON으로 응답, 문서용 스키마)
+class HomeFeedResponse(BaseModel):
+    updated_at: datetime
+    newest: List[ProductCardResponse]
+    categories: Dict[str, List[ProductCardResponse]]
+    featured_sellers: List[FeaturedSellerResponse]
+
 # 장바구니 추가 요청
 class CartItemCreate(BaseModel):
     product_id: int
@@ -103,10 +161,44 @@ class CartItemResponse(BaseModel):
     class Config:
         from_attributes = True
 
+# 장바구니 요약 - 상품별 합계
+class CartSummaryItem(BaseModel):
+    cart_item_id: int
+    product_id: int
+    name: str
+    price: str  # 표시용 원본 문자열 (예: "25,000원")
+    image_url: str
+    unit_price: int
+    quantity: int
+    line_total: int
+
+# 장바구니 요약 - 판매자별 소계 (주문은 판매자별로 생성)
+class CartSellerSummary(BaseModel):
+    seller_id: int
+    seller_name: str
+    item_count: int
+    quantity: int
+    subtotal: int
+    items: List[CartSummaryItem]
+
+# 장바구니 요약 응답
+class CartSummaryResponse(BaseModel):
+    sellers: List[CartSellerSummary]
+    item_count: int
+    quantity: int
+    total: int
+
+# 게스트(비로그인) 장바구니 아이템 응답 - 로그인 전이라 행 ID 없음
+class GuestCartItemResponse(BaseModel):
+    product_id: int
+    quantity: int
+    product: ProductResponse
+
 # 주문 아이템 생성
 class OrderItemCreate(BaseModel):
     product_id: int
     quantity: int
+    size: Optional[str] = None
 
 # 주문 생성 요청
 class OrderCreate(BaseModel):
@@ -123,6 +215,7 @@ class OrderItemResponse(BaseModel):
     id: int
     product_id: int
     quantity: int
+    size: Optional[str] = None
     price_at_order: str
     product: ProductResponse
 
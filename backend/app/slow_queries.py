@@ -0,0 +1,267 @@
+import argparse
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# ✅ 환경변수로 느린 쿼리 기록 설정
+# - SLOW_QUERY_MS: 이 시간(밀리초) 이상 걸린 SQL만 기록 (0이면 기록 안 함)
+# - SLOW_QUERY_EXPLAIN=1 이면 실행 계획도 저장 (기본 꺼짐 - 느린 쿼리를 실행한 요청의 연결에서 EXPLAIN을
+#   한 번 더 실행하므로 운영에서는 그 요청이 느려짐, fingerprint마다 EXPLAIN_REFRESH_SECONDS에 한 번)
+# - SLOW_QUERY_EXPLAIN_ANALYZE=1 이면 PostgreSQL에서 EXPLAIN ANALYZE (쿼리를 한 번 더 실행하므로 주의)
+# - SLOW_QUERY_LOG: 기록을 JSON Lines로 덧붙일 파일 (워커 여러 개 / 재시작 후에도 CLI로 집계)
+SLOW_QUERY_MS = float(os.getenv("SLOW_QUERY_MS", "200"))
+SLOW_QUERY_EXPLAIN = os.getenv("SLOW_QUERY_EXPLAIN", "0") == "1"
+SLOW_QUERY_EXPLAIN_ANALYZE = os.getenv("SLOW_QUERY_EXPLAIN_ANALYZE", "0") == "1"
+SLOW_QUERY_LOG = os.getenv("SLOW_QUERY_LOG")
+SLOW_QUERY_MAX_FINGERPRINTS = int(os.getenv("SLOW_QUERY_MAX_FINGERPRINTS", "500"))
+
+# 같은 fingerprint의 실행 계획은 이 시간(초)마다 한 번만 다시 확인
+EXPLAIN_REFRESH_SECONDS = 3600
+# fingerprint마다 기억하는 파라미터 형태 수
+MAX_SHAPES = 5
+
+# SQL 정규화 - 값이 달라도 같은 쿼리는 같은 fingerprint
+_NORMALIZE = [
+    (re.compile(r"'(?:[^']|'')*'"), "?"),                     # 문자열 리터럴
+    (re.compile(r"%\(\w+\)s|%s|(?<!:):\w+|\$\d+"), "?"),       # 바인드 파라미터 (psycopg2 / named / numeric)
+    (re.compile(r"\b\d+(?:\.\d+)?\b"), "?"),                   # 숫자 리터럴
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),      # IN (?, ?, ?) → 개수와 무관하게 하나로
+    (re.compile(r"\s+"), " "),
+]
+
+
+def normalize(statement: str) -> str:
+    for pattern, replacement in _NORMALIZE:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
+
+
+def fingerprint(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+
+def parameter_shape(parameters, executemany: bool = False) -> str:
+    """
+    바인드 파라미터의 형태만 기록 (값은 저장하지 않음)
+    예) (int, str, NoneType) / {name: str, id: int} / 20 x (int, str)
+    """
+    if executemany:
+        rows = list(parameters or [])
+        return f"{len(rows)} x {parameter_shape(rows[0])}" if rows else "0 x ()"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: {type(value).__name__}" for key, value in parameters.items()) + "}"
+    return "(" + ", ".join(type(value).__name__ for value in parameters or ()) + ")"
+
+
+class SlowQuery:
+    """fingerprint 하나의 누적 기록"""
+
+    __slots__ = ("fingerprint", "statement", "count", "total_ms", "max_ms", "shapes", "explain", "explained_at", "last_seen")
+
+    def __init__(self, key: str, statement: str):
+        self.fingerprint = key
+        self.statement = statement
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.shapes: List[str] = []
+        self.explain: Optional[str] = None
+        self.explained_at = 0.0
+        self.last_seen: Optional[datetime] = None
+
+    def to_dict(self) -> Dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "statement": self.statement,
+            "count": self.count,
+            "total_ms": round(self.total_ms, 2),
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else 0,
+            "max_ms": round(self.max_ms, 2),
+            "shapes": self.shapes,
+            "explain": self.explain,
+            "last_seen": self.last_seen.isoformat() if self.last_seen else None,
+        }
+
+
+class SlowQueryLog:
+    """
+    느린 쿼리 기록 (워커 프로세스별 메모리 + 선택적으로 JSON Lines 파일)
+    - 엔진 이벤트 훅은 스레드풀에서도 호출되므로 lock으로 보호
+    """
+
+    def __init__(self, threshold_ms: float = SLOW_QUERY_MS, log_path: Optional[str] = SLOW_QUERY_LOG,
+                 max_fingerprints: int = SLOW_QUERY_MAX_FINGERPRINTS):
+        self.threshold_ms = threshold_ms
+        self.log_path = log_path
+        self.max_fingerprints = max_fingerprints
+        self.queries: Dict[str, SlowQuery] = {}
+        self._lock = threading.Lock()
+
+    def needs_explain(self, key: str) -> bool:
+        query = self.queries.get(key)
+        return query is None or time.monotonic() - query.explained_at > EXPLAIN_REFRESH_SECONDS
+
+    def record(self, statement: str, elapsed_ms: float, shape: str, explain: Optional[str] = None) -> str:
+        """기록 후 fingerprint 반환"""
+        normalized = normalize(statement)
+        key = fingerprint(normalized)
+        now = datetime.utcnow()
+        with self._lock:
+            query = self.queries.get(key)
+            if query is None:
+                if len(self.queries) >= self.max_fingerprints:
+                    # 가장 덜 중요한(총 시간이 가장 짧은) fingerprint를 밀어냄
+                    del self.queries[min(self.queries.values(), key=lambda q: q.total_ms).fingerprint]
+                query = self.queries[key] = SlowQuery(key, normalized)
+            query.count += 1
+            query.total_ms += elapsed_ms
+            query.max_ms = max(query.max_ms, elapsed_ms)
+            query.last_seen = now
+            if shape not in query.shapes and len(query.shapes) < MAX_SHAPES:
+                query.shapes.append(shape)
+            if explain is not None:
+                query.explain = explain
+                query.explained_at = time.monotonic()
+
+        if self.log_path:
+            entry = {
+                "ts": now.isoformat(),
+                "fingerprint": key,
+                "statement": normalized,
+                "ms": round(elapsed_ms, 2),
+                "shape": shape,
+            }
+            if explain is not None:
+                entry["explain"] = explain
+            # 한 줄씩 append - 여러 워커가 같은 파일에 써도 줄 단위로 섞이지 않음
+            with open(self.log_path, "a", encoding="utf-8") as file:
+                file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return key
+
+    def report(self, limit: int = 20) -> List[Dict]:
+        """총 실행 시간 순위"""
+        with self._lock:
+            queries = sorted(self.queries.values(), key=lambda q: q.total_ms, reverse=True)[:limit]
+            return [query.to_dict() for query in queries]
+
+    def reset(self):
+        with self._lock:
+            self.queries.clear()
+
+
+slow_query_log = SlowQueryLog()
+
+
+def explain(conn, statement: str, parameters) -> Optional[str]:
+    """
+    같은 연결에서 실행 계획 조회 (SELECT만 - EXPLAIN ANALYZE는 쿼리를 실제로 실행하므로)
+    - DBAPI 커서를 직접 사용해서 엔진 이벤트가 다시 호출되지 않음
+    - PostgreSQL은 EXPLAIN이 실패해도 진행 중인 트랜잭션이 깨지지 않도록 savepoint 안에서 실행
+    """
+    if not statement.lstrip().lower().startswith("select"):
+        return None
+
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        prefix = "EXPLAIN (ANALYZE, BUFFERS) " if SLOW_QUERY_EXPLAIN_ANALYZE else "EXPLAIN "
+    elif dialect == "sqlite":
+        prefix = "EXPLAIN QUERY PLAN "
+    else:
+        prefix = "EXPLAIN "
+
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        if dialect == "postgresql":
+            cursor.execute("SAVEPOINT slow_query_explain")
+        try:
+            cursor.execute(prefix + statement, parameters)
+            rows = cursor.fetchall()
+        except Exception as e:
+            if dialect == "postgresql":
+                cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+            return f"EXPLAIN failed: {e}"
+        if dialect == "postgresql":
+            cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+    finally:
+        cursor.close()
+
+    if dialect == "sqlite":
+        # (id, parent, notused, detail) → 부모 기준 들여쓰기
+        depth = {0: -1}
+        lines = []
+        for row_id, parent, _, detail in rows:
+            depth[row_id] = depth.get(parent, -1) + 1
+            lines.append("  " * depth[row_id] + detail)
+        return "\n".join(lines)
+    return "\n".join(str(row[0]) for row in rows)
+
+
+def install_slow_query_log(engine: Engine, log: SlowQueryLog = slow_query_log):
+    """엔진 이벤트로 느린 쿼리 기록 (SLOW_QUERY_MS가 0이면 훅을 등록하지 않음)"""
+    if log.threshold_ms <= 0:
+        return
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["slow_query_start"].pop()) * 1000
+        if elapsed_ms < log.threshold_ms:
+            return
+        plan = None
+        if SLOW_QUERY_EXPLAIN and not executemany and log.needs_explain(fingerprint(normalize(statement))):
+            plan = explain(conn, statement, parameters)
+        log.record(statement, elapsed_ms, parameter_shape(parameters, executemany), plan)
+
+    @event.listens_for(engine, "handle_error")
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get("slow_query_start"):
+            connection.info["slow_query_start"].pop()
+
+
+def report_from_file(path: str, limit: int = 20) -> List[Dict]:
+    """SLOW_QUERY_LOG 파일을 fingerprint별로 집계해서 총 실행 시간 순위 반환"""
+    log = SlowQueryLog(threshold_ms=0, log_path=None, max_fingerprints=1_000_000)
+    with open(path, encoding="utf-8") as file:
+        for line in file:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            key = log.record(entry["statement"], entry["ms"], entry["shape"], entry.get("explain"))
+            log.queries[key].last_seen = datetime.fromisoformat(entry["ts"])
+    return log.report(limit)
+
+
+if __name__ == "__main__":
+    # 사용법: python -m app.slow_queries [로그 파일] [--top 20] [--json]
+    parser = argparse.ArgumentParser(description="느린 쿼리 로그를 fingerprint별 총 실행 시간 순으로 집계")
+    parser.add_argument("path", nargs="?", default=SLOW_QUERY_LOG, help="SLOW_QUERY_LOG 파일 (기본: 환경변수)")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="JSON으로 출력")
+    args = parser.parse_args()
+    if not args.path:
+        parser.error("로그 파일 경로 또는 SLOW_QUERY_LOG 환경변수가 필요합니다")
+
+    rows = report_from_file(args.path, args.top)
+    if args.json:
+        print(json.dumps(rows, indent=2, ensure_ascii=False))
+    else:
+        for rank, row in enumerate(rows, 1):
+            print(f"#{rank} [{row['fingerprint']}] total {row['total_ms']}ms / {row['count']}회 "
+                  f"(평균 {row['mean_ms']}ms, 최대 {row['max_ms']}ms)")
+            print(f"  {row['statement']}")
+            print(f"  파라미터: {', '.join(row['shapes'])}")
+            if row["explain"]:
+                print("  실행 계획:")
+                print("\n".join("    " + line for line in row["explain"].splitlines()))
+            print()
@@ -0,0 +1,155 @@
+import gzip
+import hashlib
+import mimetypes
+import os
+import re
+import sys
+from pathlib import Path
+from typing import Dict, Tuple
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+from .compression import brotli, parse_accept_encoding
+
+# app/static (QR 코드 등 정적 자산)
+STATIC_DIR = Path(__file__).parent / "static"
+
+# 1년 - 파일명에 컨텐츠 해시가 들어간 URL은 내용이 절대 바뀌지 않음
+IMMUTABLE_MAX_AGE = 31536000
+
+# seller1qr.3f2a9c1b7d4e.png → stem=seller1qr, hash=3f2a9c1b7d4e, suffix=.png
+HASHED_NAME = re.compile(r"^(?P<stem>.+)\.(?P<hash>[0-9a-f]{12})(?P<suffix>\.[^.]+)$")
+HASH_LENGTH = 12
+
+# 미리 압축본(.br / .gz)을 만들 가치가 있는 확장자 (이미지는 이미 압축됨)
+PRECOMPRESS_SUFFIXES = {".svg", ".css", ".js", ".json", ".txt", ".html", ".xml"}
+
+# (경로, mtime, 크기) → 컨텐츠 해시 캐시
+_hash_cache: Dict[Tuple[str, int, int], str] = {}
+
+
+def content_hash(full_path: str) -> str:
+    """파일 내용의 SHA-256 앞 12자리 (mtime/크기가 같으면 캐시 사용)"""
+    stat_result = os.stat(full_path)
+    key = (full_path, stat_result.st_mtime_ns, stat_result.st_size)
+    cached = _hash_cache.get(key)
+    if cached:
+        return cached
+
+    digest = hashlib.sha256()
+    with open(full_path, "rb") as f:
+        for chunk in iter(lambda: f.read(64 * 1024), b""):
+            digest.update(chunk)
+    _hash_cache[key] = digest.hexdigest()[:HASH_LENGTH]
+    return _hash_cache[key]
+
+
+def hashed_name(relative_path: str, directory: Path = STATIC_DIR) -> str:
+    """qr/seller1qr.png → qr/seller1qr.<hash>.png"""
+    full_path = os.path.join(directory, relative_path)
+    stem, suffix = os.path.splitext(relative_path)
+    return f"{stem}.{content_hash(full_path)}{suffix}"
+
+
+def static_url(relative_path: str) -> str:
+    """app/static 파일의 캐시 가능한 URL (예: /static/qr/seller1qr.<hash>.png)"""
+    return f"/static/{hashed_name(relative_path)}"
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    캐시 헤더를 붙이는 StaticFiles
+    - 해시 파일명(name.<hash>.ext)으로 요청하면 원본 파일을 찾아
+      내용이 일치할 때 Cache-Control: immutable 로 응답
+    - 해시가 없거나 일치하지 않으면 ETag로 매번 재검증 (304)
+    - immutable_prefixes 아래 파일은 경로 자체가 내용 해시이므로 항상 immutable
+    - precompressed=True 이면 옆에 있는 .br / .gz 파일을 우선 전송
+    - ETag / Range 처리는 Starlette FileResponse 사용
+    """
+
+    def __init__(self, *args, precompressed: bool = True, immutable_prefixes: Tuple[str, ...] = (), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.precompressed = precompressed
+        self.immutable_prefixes = immutable_prefixes
+
+    def lookup_path(self, path: str):
+        full_path, stat_result = super().lookup_path(path)
+        if stat_result is None:
+            # 해시 파일명은 실제로 존재하지 않으므로 해시를 뗀 원본 파일을 찾음
+            match = HASHED_NAME.match(os.path.basename(path))
+            if match:
+                original = os.path.join(os.path.dirname(path), match["stem"] + match["suffix"])
+                full_path, stat_result = super().lookup_path(original)
+        return full_path, stat_result
+
+    def file_response(
+        self,
+        full_path,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        headers = {"Cache-Control": self.cache_control(full_path, scope)}
+        media_type = mimetypes.guess_type(str(full_path))[0] or "text/plain"
+
+        if self.precompressed:
+            variant = self.precompressed_variant(str(full_path), request_headers)
+            headers["Vary"] = "Accept-Encoding"
+            if variant:
+                full_path, encoding = variant
+                stat_result = os.stat(full_path)
+                headers["Content-Encoding"] = encoding
+
+        response = FileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            headers=headers,
+            media_type=media_type,
+        )
+        if self.is_not_modified(response.headers, request_headers):
+            return NotModifiedResponse(response.headers)
+        return response
+
+    def cache_control(self, full_path, scope: Scope) -> str:
+        path = self.get_path(scope)
+        match = HASHED_NAME.match(os.path.basename(path))
+        content_addressed = Path(path).as_posix().startswith(self.immutable_prefixes)
+        if content_addressed or match and content_hash(str(full_path)) == match["hash"]:
+            return f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"
+        return "public, max-age=0, must-revalidate"
+
+    def precompressed_variant(self, full_path: str, request_headers: Headers):
+        """클라이언트가 받을 수 있는 미리 압축된 파일 (경로, 인코딩) 또는 None"""
+        accepted = parse_accept_encoding(request_headers.get("accept-encoding", ""))
+        for suffix, encoding in ((".br", "br"), (".gz", "gzip")):
+            if accepted.get(encoding, 0) > 0 and os.path.isfile(full_path + suffix):
+                return full_path + suffix, encoding
+        return None
+
+
+def precompress(directory: Path) -> int:
+    """디렉토리 아래 텍스트 자산의 .gz / .br 압축본 생성, 생성한 파일 수 반환"""
+    created = 0
+    for path in Path(directory).rglob("*"):
+        if not path.is_file() or path.suffix not in PRECOMPRESS_SUFFIXES:
+            continue
+        data = path.read_bytes()
+        variants = [(".gz", gzip.compress(data, compresslevel=9))]
+        if brotli is not None:
+            variants.append((".br", brotli.compress(data, quality=11)))
+        for suffix, compressed in variants:
+            # 압축해도 작아지지 않으면 만들지 않음
+            if len(compressed) < len(data):
+                Path(str(path) + suffix).write_bytes(compressed)
+                created += 1
+    return created
+
+
+if __name__ == "__main__":
+    # 배포 전 실행: python -m app.static_files [디렉토리...]
+    targets = sys.argv[1:] or [str(STATIC_DIR)]
+    for target in targets:
+        print(f"✅ {target}: {precompress(Path(target))}개 압축본 생성")
@@ -0,0 +1,205 @@
+import hashlib
+import os
+import tempfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterable, Optional
+
+from .config import configure_cloudinary
+
+# ✅ 환경변수로 미디어 저장소 설정
+# - cloudinary: 운영 (기본값)
+# - local: 개발/테스트/벤치마크용, 네트워크 없이 디스크에 저장하고 /uploads 로 서빙
+MEDIA_STORAGE = os.getenv("MEDIA_STORAGE", "cloudinary")
+LOCAL_MEDIA_ROOT = Path(os.getenv("LOCAL_MEDIA_ROOT", "uploads"))
+LOCAL_MEDIA_BASE_URL = os.getenv("LOCAL_MEDIA_BASE_URL", "/uploads")
+
+# 로컬 저장소에서 내용 해시로 저장하는 하위 디렉토리 (파일 내용이 바뀌지 않으므로 영구 캐시 가능)
+LOCAL_MEDIA_DIR = "media"
+
+# 확장자 판별용 파일 시그니처
+_SIGNATURES = (
+    (b"\xff\xd8\xff", ".jpg"),
+    (b"\x89PNG\r\n\x1a\n", ".png"),
+    (b"GIF87a", ".gif"),
+    (b"GIF89a", ".gif"),
+)
+
+
+def _sniff_extension(head: bytes) -> str:
+    for signature, extension in _SIGNATURES:
+        if head.startswith(signature):
+            return extension
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return ".webp"
+    return ".bin"
+
+
+class MediaStorage(ABC):
+    """
+    미디어 저장소 인터페이스
+    - upload() 결과는 Cloudinary 업로드 결과와 같은 키를 사용
+      {"secure_url", "public_id", "width", "height", "bytes"}
+    """
+
+    name = ""
+
+    @abstractmethod
+    def upload(self, file: BinaryIO, folder: str, public_id: str, widths: Iterable[int] = ()) -> Dict:
+        ...
+
+    @abstractmethod
+    def delete(self, public_id: str):
+        ...
+
+
+class CloudinaryStorage(MediaStorage):
+    """Cloudinary 저장소 - 리사이즈는 URL 변환으로 처리하므로 widths는 사용하지 않음"""
+
+    name = "cloudinary"
+
+    def upload(self, file: BinaryIO, folder: str, public_id: str, widths: Iterable[int] = ()) -> Dict:
+        configure_cloudinary()
+        import cloudinary.uploader
+
+        return cloudinary.uploader.upload(
+            file,
+            folder=folder,
+            public_id=public_id,
+            resource_type="auto"
+        )
+
+    def delete(self, public_id: str):
+        configure_cloudinary()
+        import cloudinary.uploader
+
+        cloudinary.uploader.destroy(public_id)
+
+
+class LocalStorage(MediaStorage):
+    """
+    로컬 디스크 저장소 (네트워크 없음)
+    - 경로: <root>/media/<sha256 앞 2자리>/<sha256><확장자> (같은 내용은 같은 파일)
+    - widths가 주어지면 Pillow로 너비별 리사이즈 파일도 생성 (<sha256>_w<너비><확장자>)
+    """
+
+    name = "local"
+
+    def __init__(self, root: Path = LOCAL_MEDIA_ROOT, base_url: str = LOCAL_MEDIA_BASE_URL):
+        self.root = Path(root)
+        self.base_url = base_url.rstrip("/")
+
+    def url_for(self, relative_path: str) -> str:
+        return f"{self.base_url}/{relative_path}"
+
+    def path_for_url(self, url: str) -> Optional[Path]:
+        """이 저장소의 URL이면 디스크 경로, 아니면 None"""
+        prefix = f"{self.base_url}/"
+        if not url.startswith(prefix):
+            return None
+        return self.root / url[len(prefix):]
+
+    def upload(self, file: BinaryIO, folder: str, public_id: str, widths: Iterable[int] = ()) -> Dict:
+        # folder/public_id는 Cloudinary 호환용 - 로컬은 내용 해시로만 경로를 정함
+        media_dir = self.root / LOCAL_MEDIA_DIR
+        media_dir.mkdir(parents=True, exist_ok=True)
+
+        # 임시 파일에 복사하면서 해시 계산 (한 번만 읽음)
+        digest = hashlib.sha256()
+        size = 0
+        file.seek(0)
+        head = file.read(16)
+        with tempfile.NamedTemporaryFile(dir=media_dir, delete=False) as tmp:
+            chunk = head
+            while chunk:
+                digest.update(chunk)
+                tmp.write(chunk)
+                size += len(chunk)
+                chunk = file.read(64 * 1024)
+        file.seek(0)
+
+        sha256 = digest.hexdigest()
+        extension = _sniff_extension(head)
+        relative_path = f"{LOCAL_MEDIA_DIR}/{sha256[:2]}/{sha256}{extension}"
+        target = self.root / relative_path
+        if target.exists():
+            os.remove(tmp.name)
+        else:
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp.name, target)
+
+        width, height = self._resize(target, widths)
+        return {
+            "secure_url": self.url_for(relative_path),
+            "public_id": relative_path,
+            "width": width,
+            "height": height,
+            "bytes": size,
+        }
+
+    def _resize(self, path: Path, widths: Iterable[int]):
+        """원본 크기 반환, 원본보다 작은 너비의 리사이즈 파일 생성"""
+        # Pillow는 처음 리사이즈할 때 import (서버 시작 시간 단축)
+        try:
+            from PIL import Image
+        except ImportError:  # Pillow 미설치 시 크기 정보/리사이즈 없이 저장만
+            return None, None
+        try:
+            with Image.open(path) as image:
+                width, height = image.size
+                for target_width in widths:
+                    resized_path = self.resized_path(path, target_width)
+                    if target_width >= width or resized_path.exists():
+                        continue
+                    resized = image.copy()
+                    resized.thumbnail((target_width, height))
+                    resized.save(resized_path, format=image.format)
+                return width, height
+        except OSError:
+            # 이미지가 아닌 파일
+            return None, None
+
+    @staticmethod
+    def resized_path(path: Path, width: int) -> Path:
+        return path.with_name(f"{path.stem}_w{width}{path.suffix}")
+
+    def variant_url(self, url: str, width: int) -> Optional[str]:
+        """리사이즈 파일 URL (원본이 해당 너비보다 작으면 원본 URL), 이 저장소 URL이 아니면 None"""
+        path = self.path_for_url(url)
+        if path is None:
+            return None
+        resized = self.resized_path(path, width)
+        if resized.exists():
+            return self.url_for(resized.relative_to(self.root).as_posix())
+        return url
+
+    def delete(self, public_id: str):
+        path = self.root / public_id
+        for candidate in [path, *path.parent.glob(f"{path.stem}_w*{path.suffix}")]:
+            if candidate.exists():
+                candidate.unlink()
+
+
+_storages = {
+    "cloudinary": CloudinaryStorage(),
+    "local": LocalStorage(),
+}
+
+
+def get_storage() -> MediaStorage:
+    """현재 배포에서 사용하는 저장소 (MEDIA_STORAGE)"""
+    try:
+        return _storages[MEDIA_STORAGE]
+    except KeyError:
+        raise RuntimeError(f"지원하지 않는 MEDIA_STORAGE 입니다: {MEDIA_STORAGE}")
+
+
+def local_storage() -> LocalStorage:
+    return _storages["local"]
+
+
+def storage_for_url(url: str) -> MediaStorage:
+    """URL을 저장한 저장소 (저장소를 바꾼 뒤에도 기존 파일 삭제가 가능하도록)"""
+    if local_storage().path_for_url(url) is not None:
+        return local_storage()
+    return _storages["cloudinary"]
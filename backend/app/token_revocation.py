@@ -0,0 +1,115 @@
+import hashlib
+import math
+import os
+import threading
+from datetime import datetime
+from typing import Set
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from . import models
+
+# ✅ 환경변수로 Bloom 필터 크기 설정
+# - 폐기 토큰 수가 용량을 넘으면 두 배 크기로 다시 만듦
+REVOCATION_BLOOM_CAPACITY = int(os.getenv("REVOCATION_BLOOM_CAPACITY", "100000"))
+REVOCATION_BLOOM_ERROR_RATE = float(os.getenv("REVOCATION_BLOOM_ERROR_RATE", "0.01"))
+
+
+class BloomFilter:
+    """
+    Bloom 필터 - "없음"은 확실, "있음"은 오탐 가능
+    - 비트 수 / 해시 수는 용량과 오탐률로 계산
+    - 해시는 blake2b 한 번으로 만든 두 값을 조합 (double hashing)
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class RevocationStore:
+    """
+    폐기된 리프레시 토큰(jti) 저장소
+    - revoked_tokens 테이블: 영구 저장 + 워커 간 공유 (jti unique 제약으로 한 번만 사용 보장)
+    - 메모리: Bloom 필터 → set 순서로 확인, 대부분의 토큰(폐기 안 됨)은 필터에서 바로 통과
+    """
+
+    def __init__(self, capacity: int = REVOCATION_BLOOM_CAPACITY, error_rate: float = REVOCATION_BLOOM_ERROR_RATE):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.revoked: Set[str] = set()
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def _remember(self, jti: str):
+        with self._lock:
+            if jti in self.revoked:
+                return
+            self.revoked.add(jti)
+            if len(self.revoked) > self.bloom.capacity:
+                # 용량 초과 - 오탐률 유지를 위해 더 큰 필터로 다시 만듦
+                self.bloom = BloomFilter(self.bloom.capacity * 2, self.error_rate)
+                for key in self.revoked:
+                    self.bloom.add(key)
+            else:
+                self.bloom.add(jti)
+
+    def load(self, db: Session):
+        """만료된 행을 정리하고 남은 jti를 메모리에 적재 (워커당 한 번)"""
+        db.query(models.RevokedToken).filter(
+            models.RevokedToken.expires_at < datetime.utcnow()
+        ).delete(synchronize_session=False)
+        db.commit()
+
+        jtis = [jti for (jti,) in db.query(models.RevokedToken.jti).all()]
+        with self._lock:
+            self.revoked = set(jtis)
+            self.bloom = BloomFilter(max(self.capacity, len(jtis) * 2), self.error_rate)
+            for jti in jtis:
+                self.bloom.add(jti)
+            self.loaded = True
+
+    def is_revoked(self, db: Session, jti: str) -> bool:
+        """이 워커가 아는 폐기 목록 확인 - 다른 워커에서 폐기된 토큰은 revoke()의 unique 제약으로 걸러짐"""
+        if not self.loaded:
+            self.load(db)
+        if jti not in self.bloom:
+            return False
+        return jti in self.revoked
+
+    def revoke(self, db: Session, jti: str, user_id: int, expires_at: datetime) -> bool:
+        """
+        jti 폐기 (commit 포함)
+        - 이미 폐기된 jti면 False (다른 요청/워커가 먼저 사용 → 재사용 공격 의심)
+        """
+        db.add(models.RevokedToken(jti=jti, user_id=user_id, expires_at=expires_at))
+        try:
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            self._remember(jti)
+            return False
+        self._remember(jti)
+        return True
+
+
+revocation_store = RevocationStore()
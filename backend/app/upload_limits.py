@@ -0,0 +1,115 @@
+import os
+from typing import Sequence
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.formparsers import MultiPartParser
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import python_multipart as multipart
+    from python_multipart.multipart import parse_options_header
+except ImportError:  # python-multipart 0.0.12 이전 버전
+    import multipart
+    from multipart.multipart import parse_options_header
+
+# ✅ 환경변수로 업로드 제한 값 가져오기 (바이트)
+MAX_UPLOAD_FILE_SIZE = int(os.getenv("MAX_UPLOAD_FILE_SIZE", str(10 * 1024 * 1024)))  # 파일 1개당 10MB
+MAX_UPLOAD_REQUEST_SIZE = int(os.getenv("MAX_UPLOAD_REQUEST_SIZE", str(30 * 1024 * 1024)))  # 요청 전체 30MB
+# 이 크기를 넘는 업로드 파일은 메모리 대신 임시 파일(디스크)에 저장
+UPLOAD_SPOOL_MAX_SIZE = int(os.getenv("UPLOAD_SPOOL_MAX_SIZE", str(1024 * 1024)))
+
+
+def configure_spooling(max_size: int = UPLOAD_SPOOL_MAX_SIZE):
+    """Starlette multipart 파서의 메모리 → 디스크 전환 기준 설정"""
+    MultiPartParser.spool_max_size = max_size
+
+
+class _PartSizeTracker:
+    """multipart 본문을 흘려보내며 파트(파일)별 크기를 계산 - 데이터는 저장하지 않음"""
+
+    def __init__(self, boundary: bytes, max_part_size: int):
+        self.max_part_size = max_part_size
+        self.part_size = 0
+        self.parser = multipart.MultipartParser(boundary, {
+            "on_part_begin": self.on_part_begin,
+            "on_part_data": self.on_part_data,
+        })
+
+    def on_part_begin(self):
+        self.part_size = 0
+
+    def on_part_data(self, data: bytes, start: int, end: int):
+        self.part_size += end - start
+        if self.part_size > self.max_part_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"파일 1개당 최대 {self.max_part_size // (1024 * 1024)}MB까지 업로드 가능합니다"
+            )
+
+    def write(self, chunk: bytes):
+        self.parser.write(chunk)
+
+
+class UploadLimitMiddleware:
+    """
+    multipart 업로드 크기 제한 미들웨어
+    - Content-Length가 요청 제한을 넘으면 본문을 읽지 않고 바로 413
+    - 본문을 읽는 도중 파일별 / 요청 전체 제한을 넘으면 그 시점에 413
+      (Starlette가 파일을 끝까지 받아 임시 파일에 쓰기 전에 중단)
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_file_size: int = MAX_UPLOAD_FILE_SIZE,
+        max_request_size: int = MAX_UPLOAD_REQUEST_SIZE,
+        paths: Sequence[str] = ("/api/",),
+    ):
+        self.app = app
+        self.max_file_size = max_file_size
+        self.max_request_size = max_request_size
+        self.paths = tuple(paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("POST", "PUT", "PATCH")
+            or not scope["path"].startswith(self.paths)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        content_type, params = parse_options_header(headers.get("content-type", ""))
+        if content_type != b"multipart/form-data" or b"boundary" not in params:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = headers.get("content-length")
+        if content_length and content_length.isdigit() and int(content_length) > self.max_request_size:
+            response = JSONResponse(
+                {"detail": f"요청 크기는 최대 {self.max_request_size // (1024 * 1024)}MB입니다"},
+                status_code=413
+            )
+            await response(scope, receive, send)
+            return
+
+        tracker = _PartSizeTracker(params[b"boundary"], self.max_file_size)
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                body = message.get("body", b"")
+                received += len(body)
+                if received > self.max_request_size:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"요청 크기는 최대 {self.max_request_size // (1024 * 1024)}MB입니다"
+                    )
+                tracker.write(body)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,2 @@
+# benchmarks/__init__.py
+# backend 디렉토리에서 `python -m benchmarks.<이름>` 으로 실행
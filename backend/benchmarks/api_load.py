@@ -0,0 +1,228 @@
+"""
+API 부하 테스트 - 데이터를 채운 DB에 실제 라우터를 ASGI 클라이언트로 호출해서
+엔드포인트별 처리량과 p50/p95/p99 지연 시간을 JSON으로 출력
+
+- 같은 --seed / 데이터 양 / 동시성이면 같은 요청 순서 → 실행 결과끼리 비교 가능 (--output으로 저장)
+- DATABASE_URL이 없으면 임시 디렉토리의 SQLite, 있으면 그 DB 사용 (--reset-db 필요: 테이블을 지우고 다시 만듦)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.api_load
+    python -m benchmarks.api_load --products 5000 --concurrency 32 --requests 500 --output before.json
+    python -m benchmarks.api_load --endpoints product_detail,cart_summary
+    DATABASE_URL=postgresql://... python -m benchmarks.api_load --reset-db
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def seed_database(args):
+    """
+    seed_data.py로 사용자 / 판매자 / 상품 / 이미지 / 장바구니 / 주문 생성 (테이블을 지우고 ID 1부터)
+    - 측정 중 재고 부족(409)이 섞이지 않도록 재고 / 사이즈 옵션 없는 상품만 생성
+    """
+    from sqlalchemy import text
+    from app.database import engine
+    import seed_data
+
+    stats = seed_data.seed(argparse.Namespace(
+        users=args.users, sellers=args.sellers, products=args.products,
+        images_per_product=args.images_per_product, stock_ratio=0.0, option_ratio=0.0,
+        cart_items=args.cart_items, orders=args.orders, seed=args.seed, base_date="2025-01-01",
+        password="password123", batch_size=10000, reset=True,
+    ))
+    with engine.connect() as conn:
+        product_sellers = [seller_id for (seller_id,) in conn.execute(text("SELECT seller_id FROM products ORDER BY id"))]
+    return {table: table_stats["rows"] for table, table_stats in stats.items()}, product_sellers
+
+
+def make_scenarios(args, product_sellers):
+    """
+    엔드포인트 이름 → 요청 생성 함수 (rng → (method, path, 사용자 ID 또는 None, JSON 본문))
+    - 판매자 엔드포인트는 판매자 사용자(1 ~ sellers)로 호출
+    """
+    def buyer(rng):
+        return rng.randint(1, args.users)
+
+    def product(rng):
+        return rng.randint(1, args.products)
+
+    def order_body(rng):
+        product_id = product(rng)
+        return {
+            "seller_id": product_sellers[product_id - 1],
+            "recipient_name": "bench", "postal_code": "06236", "address": "서울시 강남구", "phone": "010-0000-0000",
+            "items": [{"product_id": product_id, "quantity": 1}],
+        }
+
+    return {
+        "categories": lambda rng: ("GET", "/api/products/categories", None, None),
+        "products_list": lambda rng: ("GET", "/api/products/", None, None),
+        "products_card": lambda rng: ("GET", "/api/products/?view=card", None, None),
+        "home_feed": lambda rng: ("GET", "/api/products/home", None, None),
+        "product_detail": lambda rng: ("GET", f"/api/products/{product(rng)}", None, None),
+        "sellers_list": lambda rng: ("GET", "/api/sellers/", None, None),
+        "cart": lambda rng: ("GET", "/api/cart/", buyer(rng), None),
+        "cart_summary": lambda rng: ("GET", "/api/cart/summary", buyer(rng), None),
+        "cart_add": lambda rng: ("POST", "/api/cart/", buyer(rng), {"product_id": product(rng), "quantity": 1}),
+        "my_orders": lambda rng: ("GET", "/api/orders/", buyer(rng), None),
+        "create_order": lambda rng: ("POST", "/api/orders/", buyer(rng), order_body(rng)),
+        "seller_products": lambda rng: ("GET", "/api/products/my/products", rng.randint(1, args.sellers), None),
+        "seller_orders": lambda rng: ("GET", "/api/sellers/orders", rng.randint(1, args.sellers), None),
+    }
+
+
+async def run_endpoint(client, scenario, requests, concurrency, warmup, rng, tokens):
+    """요청 목록을 미리 만들고 concurrency개 작업이 나눠서 실행"""
+    plan = [scenario(rng) for _ in range(warmup + requests)]
+    latencies = []
+    statuses = {}
+
+    async def call(method, path, user_id, body):
+        headers = {"Authorization": f"Bearer {tokens[user_id]}"} if user_id else {}
+        return await client.request(method, path, headers=headers, json=body)
+
+    for request in plan[:warmup]:
+        await call(*request)
+
+    queue = iter(plan[warmup:])
+
+    async def worker():
+        for request in queue:
+            start = time.perf_counter()
+            response = await call(*request)
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "errors": sum(count for status, count in statuses.items() if status >= 400),
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 2),
+    }
+
+
+async def run(args, endpoints, scenarios):
+    import httpx
+    from app.main import app
+    from app.auth import create_access_token
+
+    tokens = {
+        user_id: create_access_token({
+            "sub": f"user{user_id}@seed.local",
+            "uid": user_id,
+            "sid": user_id if user_id <= args.sellers else None,
+            "ver": 0,
+        })
+        for user_id in range(1, args.users + 1)
+    }
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name in endpoints:
+            # 엔드포인트마다 고정된 난수열 → 실행마다 같은 요청
+            rng = random.Random(f"{args.seed}:{name}")
+            results[name] = await run_endpoint(
+                client, scenarios[name], args.requests, args.concurrency, args.warmup, rng, tokens
+            )
+            print(f"{name}: p50 {results[name]['p50_ms']}ms, p99 {results[name]['p99_ms']}ms", file=sys.stderr)
+    return results
+
+
+def git_revision(path: str):
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=path, capture_output=True, text=True, timeout=5
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 엔드포인트별 처리량 / 지연 시간 부하 테스트")
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--sellers", type=int, default=20)
+    parser.add_argument("--products", type=int, default=500)
+    parser.add_argument("--images-per-product", type=int, default=3)
+    parser.add_argument("--cart-items", type=int, default=5, help="사용자당 장바구니 상품 수")
+    parser.add_argument("--orders", type=int, default=2, help="사용자당 주문 수")
+    parser.add_argument("--requests", type=int, default=200, help="엔드포인트당 측정 요청 수")
+    parser.add_argument("--warmup", type=int, default=10, help="엔드포인트당 측정 전 요청 수")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--endpoints", default="all", help="쉼표로 구분한 엔드포인트 이름 (기본: 전체)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON을 저장할 파일")
+    parser.add_argument("--reset-db", action="store_true", help="DATABASE_URL의 테이블을 지우고 다시 만듦")
+    args = parser.parse_args()
+    if args.sellers < 1 or args.users < args.sellers or args.products < 1:
+        parser.error("--users >= --sellers >= 1, --products >= 1 이어야 합니다")
+
+    backend_dir = os.getcwd()
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    # 느린 쿼리 기록은 끔 (측정값에 EXPLAIN 시간이 섞이지 않게)
+    os.environ.setdefault("SLOW_QUERY_MS", "0")
+    sys.path.insert(0, backend_dir)
+    if os.getenv("DATABASE_URL"):
+        if not args.reset_db:
+            parser.error("DATABASE_URL의 테이블을 모두 지우고 다시 만듭니다 - 계속하려면 --reset-db")
+    else:
+        # app은 ./tshirts.db 사용
+        os.chdir(tempfile.mkdtemp(prefix="bench_api_load_"))
+
+    started = time.perf_counter()
+    volumes, product_sellers = seed_database(args)
+    seed_seconds = time.perf_counter() - started
+
+    scenarios = make_scenarios(args, product_sellers)
+    endpoints = list(scenarios) if args.endpoints == "all" else [name.strip() for name in args.endpoints.split(",")]
+    unknown = [name for name in endpoints if name not in scenarios]
+    if unknown:
+        parser.error(f"알 수 없는 엔드포인트: {', '.join(unknown)} (가능: {', '.join(scenarios)})")
+
+    from app.database import engine
+
+    result = {
+        "meta": {
+            "git_revision": git_revision(backend_dir),
+            "python": platform.python_version(),
+            "database": engine.dialect.name,
+            "seed": args.seed,
+            "concurrency": args.concurrency,
+            "requests_per_endpoint": args.requests,
+            "seed_seconds": round(seed_seconds, 2),
+        },
+        "volumes": volumes,
+        "endpoints": asyncio.run(run(args, endpoints, scenarios)),
+    }
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(os.path.join(backend_dir, args.output), "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+응답 압축 벤치마크 - 압축 CPU 비용 vs 절약되는 바이트
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.compression
+    python -m benchmarks.compression --products 50 200 1000 --repeat 20
+"""
+import argparse
+import json
+import time
+
+from app.compression import Encoder, brotli
+
+# (인코딩, 레벨) 조합
+SETTINGS = [("gzip", 1), ("gzip", 6), ("gzip", 9)]
+if brotli is not None:
+    SETTINGS += [("br", 1), ("br", 4), ("br", 11)]
+
+
+def make_product_list(count: int) -> bytes:
+    """GET /api/products 전체 응답과 비슷한 모양의 JSON 생성"""
+    products = []
+    for i in range(count):
+        products.append({
+            "id": i + 1,
+            "name": f"클래식 코튼 크루넥 티셔츠 {i}",
+            "price": f"{25000 + (i % 10) * 1000:,}원",
+            "description": "부드러운 100% 프리미엄 코튼으로 제작되어 매일 입기에 완벽한 편안함을 제공합니다. " * 3,
+            "image_url": f"https://res.cloudinary.com/demo/image/upload/tshirts/products/seller_1/product_{i}_0.jpg",
+            "seller_id": 1 + i % 5,
+            "category_main": "상의",
+            "category_sub": "반팔",
+            "external_store_url": "https://smartstore.naver.com/example",
+            "is_active": 1,
+            "images": [
+                {"id": i * 5 + j, "image_url": f"https://res.cloudinary.com/demo/image/upload/p_{i}_{j}.jpg", "display_order": j}
+                for j in range(3)
+            ],
+            "seller": {
+                "id": 1 + i % 5,
+                "user_id": 1 + i % 5,
+                "name": "T-Style 공식스토어",
+                "kakaopay_link": "https://qr.kakaopay.com/FUM39B8EO",
+                "kakaopay_qr_url": None,
+            },
+        })
+    return json.dumps(products, ensure_ascii=False).encode("utf-8")
+
+
+def bench(payload: bytes, encoding: str, level: int, repeat: int) -> dict:
+    elapsed = []
+    size = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if encoding == "br":
+            encoder = Encoder(encoding, brotli_quality=level)
+        else:
+            encoder = Encoder(encoding, gzip_level=level)
+        compressed = encoder.compress(payload) + encoder.flush()
+        elapsed.append(time.perf_counter() - start)
+        size = len(compressed)
+
+    elapsed.sort()
+    median = elapsed[len(elapsed) // 2]
+    saved = len(payload) - size
+    return {
+        "encoding": encoding,
+        "level": level,
+        "original_bytes": len(payload),
+        "compressed_bytes": size,
+        "ratio": round(size / len(payload), 4),
+        "median_ms": round(median * 1000, 3),
+        # 1ms CPU로 절약하는 KB - 높을수록 효율적
+        "kb_saved_per_cpu_ms": round(saved / 1024 / (median * 1000), 1) if median else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="응답 압축 벤치마크")
+    parser.add_argument("--products", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    results = []
+    for count in args.products:
+        payload = make_product_list(count)
+        for encoding, level in SETTINGS:
+            result = bench(payload, encoding, level, args.repeat)
+            result["products"] = count
+            results.append(result)
+
+    print(json.dumps(results, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+구글 로그인 벤치마크 - 로컬 공개키 대체 서버 사용 (네트워크 없음)
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.google_login --users 200 --concurrency 50
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from benchmarks.google_stub import GoogleStub
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+async def run(args, stub):
+    import httpx
+    from app.main import app
+    from app.database import create_tables
+
+    # ASGITransport는 lifespan을 실행하지 않으므로 테이블을 직접 생성
+    create_tables()
+
+    tokens = [stub.mint_id_token(f"user{i}@example.com", sub=f"sub-{i}") for i in range(args.users)]
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = []
+    failures = 0
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def login(token):
+            nonlocal failures
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.post("/api/auth/google", json={"token": token})
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    failures += 1
+
+        started = time.perf_counter()
+        # 첫 라운드: 회원가입, 두 번째 라운드: 기존 사용자 로그인
+        for _ in range(args.rounds):
+            await asyncio.gather(*(login(token) for token in tokens))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": len(latencies),
+        "failures": failures,
+        "concurrency": args.concurrency,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 2),
+        # 캐시가 동작하면 1회 (요청마다 조회하면 요청 수만큼)
+        "cert_fetches": stub.fetch_count,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="구글 로그인 동시성 벤치마크")
+    parser.add_argument("--users", type=int, default=40)
+    parser.add_argument("--rounds", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    stub = GoogleStub(client_id="bench-client").start()
+
+    # app 모듈이 import 시점에 읽는 설정 - 임시 디렉토리의 SQLite 사용
+    os.environ["GOOGLE_CLIENT_ID"] = stub.client_id
+    os.environ["GOOGLE_CERTS_URL"] = stub.certs_url
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ.pop("DATABASE_URL", None)
+    sys.path.insert(0, os.getcwd())
+    os.chdir(tempfile.mkdtemp(prefix="bench_google_"))
+
+    try:
+        result = asyncio.run(run(args, stub))
+    finally:
+        stub.stop()
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
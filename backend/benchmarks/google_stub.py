@@ -0,0 +1,98 @@
+"""
+구글 OAuth 공개키 대체 서버 (오프라인 테스트/벤치마크용)
+- RSA 키와 자체 서명 인증서를 만들어 구글과 같은 형식({kid: 인증서 PEM})으로 제공
+- mint_id_token()으로 그 키로 서명한 구글 형식 ID 토큰 발급
+
+사용:
+    stub = GoogleStub(client_id="test-client")
+    stub.start()
+    os.environ["GOOGLE_CERTS_URL"] = stub.certs_url  # app 모듈 import 전에 설정
+"""
+import json
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from google.auth import crypt
+from google.auth import jwt as google_jwt
+
+
+def _make_key_and_cert():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "google-stub")])
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(datetime.utcnow() - timedelta(days=1))
+        .not_valid_after(datetime.utcnow() + timedelta(days=1))
+        .sign(key, hashes.SHA256())
+    )
+    key_pem = key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ).decode()
+    cert_pem = cert.public_bytes(serialization.Encoding.PEM).decode()
+    return key_pem, cert_pem
+
+
+class GoogleStub:
+    def __init__(self, client_id: str = "stub-client-id", max_age: int = 3600, kid: str = "stub-key-1"):
+        self.client_id = client_id
+        self.max_age = max_age
+        self.kid = kid
+        key_pem, self.cert_pem = _make_key_and_cert()
+        self.signer = crypt.RSASigner.from_string(key_pem, key_id=kid)
+        self.fetch_count = 0  # 공개키 조회 횟수 (캐시 동작 확인용)
+        self.server = None
+
+    @property
+    def certs_url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/oauth2/v1/certs"
+
+    def start(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.fetch_count += 1
+                body = json.dumps({stub.kid: stub.cert_pem}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Cache-Control", f"public, max-age={stub.max_age}, must-revalidate")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+
+    def mint_id_token(self, email: str, sub: str, name: str = "Stub User") -> str:
+        now = int(time.time())
+        payload = {
+            "iss": "https://accounts.google.com",
+            "aud": self.client_id,
+            "sub": sub,
+            "email": email,
+            "email_verified": True,
+            "name": name,
+            "iat": now,
+            "exp": now + 3600,
+        }
+        return google_jwt.encode(self.signer, payload).decode()
@@ -0,0 +1,128 @@
+"""
+로그인 제한(토큰 버킷) 벤치마크
+- store: MemoryRateLimitStore.take() 1회 비용
+- request: 제한 의존성이 있는/없는 엔드포인트의 요청당 지연 차이
+- flood: 한 IP에서 로그인 폭주 시 비밀번호 해싱까지 간 요청 수와 처리 시간
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.rate_limit
+    python -m benchmarks.rate_limit --requests 5000 --flood 100
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+
+async def bench_store(calls: int, keys: int):
+    from app.rate_limit import MemoryRateLimitStore
+
+    store = MemoryRateLimitStore()
+    names = [f"login:ip:10.0.{i // 256}.{i % 256}" for i in range(keys)]
+    started = time.perf_counter()
+    for i in range(calls):
+        await store.take(names[i % keys], 1_000_000, 1_000_000.0)
+    elapsed = time.perf_counter() - started
+    return {"calls": calls, "keys": keys, "ns_per_take": round(elapsed / calls * 1e9)}
+
+
+async def bench_request(requests: int):
+    import httpx
+    from fastapi import Depends, FastAPI
+    from app.rate_limit import RateLimit
+
+    limit = RateLimit("bench", ip_rate="1000000/1", email_rate="1000000/1")
+    app = FastAPI()
+
+    @app.post("/plain")
+    async def plain(body: dict):
+        return {"ok": True}
+
+    @app.post("/limited", dependencies=[Depends(limit)])
+    async def limited(body: dict):
+        return {"ok": True}
+
+    result = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for path in ("/plain", "/limited", "/plain", "/limited"):
+            latencies = []
+            for i in range(requests):
+                start = time.perf_counter()
+                await client.post(path, json={"email": f"user{i % 100}@example.com", "password": "x"})
+                latencies.append(time.perf_counter() - start)
+            # 두 번째 측정값 사용 (첫 번째는 워밍업)
+            result[path] = round(statistics.median(latencies) * 1e6, 1)
+
+    return {
+        "requests": requests,
+        "plain_p50_us": result["/plain"],
+        "limited_p50_us": result["/limited"],
+        "overhead_us": round(result["/limited"] - result["/plain"], 1),
+    }
+
+
+async def bench_flood(attempts: int):
+    import httpx
+    from app.main import app
+    from app.database import create_tables
+    from app import auth
+
+    # ASGITransport는 lifespan을 실행하지 않으므로 테이블을 직접 생성
+    create_tables()
+
+    hashed = 0
+    original_verify = auth.pwd_context.verify
+
+    def counting_verify(*args, **kwargs):
+        nonlocal hashed
+        hashed += 1
+        return original_verify(*args, **kwargs)
+
+    auth.pwd_context.verify = counting_verify
+    statuses = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/api/auth/signup", json={"name": "victim", "email": "victim@example.com", "password": "correct"})
+        started = time.perf_counter()
+        for i in range(attempts):
+            response = await client.post("/api/auth/login", json={"email": "victim@example.com", "password": f"guess{i}"})
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+        elapsed = time.perf_counter() - started
+
+    return {
+        "attempts": attempts,
+        "statuses": statuses,
+        "password_hashes": hashed,
+        "elapsed_s": round(elapsed, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로그인 제한 오버헤드 벤치마크")
+    parser.add_argument("--calls", type=int, default=200000)
+    parser.add_argument("--keys", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--flood", type=int, default=50)
+    args = parser.parse_args()
+
+    # app 모듈이 import 시점에 읽는 설정 - 임시 디렉토리의 SQLite 사용
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ.pop("DATABASE_URL", None)
+    sys.path.insert(0, os.getcwd())
+    os.chdir(tempfile.mkdtemp(prefix="bench_rate_limit_"))
+
+    result = {
+        "store": asyncio.run(bench_store(args.calls, args.keys)),
+        "request": asyncio.run(bench_request(args.requests)),
+        "flood": asyncio.run(bench_flood(args.flood)),
+    }
+    print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""
+복제본(read replica) 라우팅 확인 - SQLite 파일 두 개로 기본 DB / 복제본을 만들고 실제 라우터로 요청
+
+- "복제"는 SQLite 백업 API로 기본 DB를 복제본 파일에 복사 (복사 전까지는 복제 지연 상태)
+- 확인 항목: 조회는 복제본 / 쓰기 직후 같은 클라이언트는 기본 DB / 다른 클라이언트와 만료 후에는 복제본 /
+  다른 워커는 쿠키로 기본 DB / 로그인 직후 조회는 기본 DB (사용자 ID 키) / 복제본 장애 시 기본 DB / 복제본 세션 쓰기 거부
+- 결과와 조회 지연 시간을 JSON으로 출력, 실패한 항목이 있으면 종료 코드 1
+
+PostgreSQL 두 대(스트리밍 복제)로 확인할 때는 서버를 직접 띄워서
+    DATABASE_URL=postgresql://.../primary DATABASE_REPLICA_URLS=postgresql://.../replica uvicorn app.main:app
+SQLite 두 파일로 서버를 띄워서 확인할 때는 --sync로 주기적으로 복사
+    python -m benchmarks.replica_routing --sync ./primary.db ./replica.db --interval 2
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.replica_routing
+"""
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+
+STICKY_SECONDS = 1.0
+
+
+def replicate(primary_path: str, replica_path: str):
+    """기본 DB 전체를 복제본 파일로 복사"""
+    source = sqlite3.connect(primary_path)
+    target = sqlite3.connect(replica_path)
+    try:
+        source.backup(target)
+    finally:
+        target.close()
+        source.close()
+
+
+def seed(users: int, products: int):
+    import seed_data
+
+    seed_data.seed(argparse.Namespace(
+        users=users, sellers=2, products=products, images_per_product=1, stock_ratio=0.0, option_ratio=0.0,
+        cart_items=0, orders=1, seed=42, base_date="2025-01-01", password="password123", batch_size=10000, reset=True,
+    ))
+
+
+async def run(primary_path: str, replica_path: str, requests: int):
+    import httpx
+    from app.main import app
+    from app.auth import create_access_token
+    from app.database import ReplicaSessionLocal, replica_engines
+    from app.db_routing import READ_PRIMARY_COOKIE, recent_writers
+    from app.readiness import readiness
+    from app import models
+
+    def token(user_id):
+        return create_access_token({"sub": f"user{user_id}@seed.local", "uid": user_id, "sid": None, "ver": 0})
+
+    buyer_a = {"Authorization": f"Bearer {token(3)}"}
+    buyer_b = {"Authorization": f"Bearer {token(4)}"}
+    checks = {}
+
+    def mark_replica():
+        # 복제본에만 있는 표시 - 응답에 보이면 복제본에서 읽은 것
+        replica = sqlite3.connect(replica_path)
+        replica.execute("UPDATE products SET name = '[replica] ' || name WHERE id = 1")
+        replica.commit()
+        replica.close()
+
+    mark_replica()
+
+    def from_replica(response):
+        return response.json()["name"].startswith("[replica]")
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            product = (await client.get("/api/products/1")).json()
+            checks["reads_use_replica"] = product["name"].startswith("[replica]")
+
+            order = {
+                "seller_id": product["seller_id"], "recipient_name": "bench", "postal_code": "06236",
+                "address": "서울시 강남구", "phone": "010-0000-0000",
+                "items": [{"product_id": 1, "quantity": 1}],
+            }
+            created = await client.post("/api/orders/", json=order, headers=buyer_a)
+            order_id = created.json()["id"]
+            cookie = created.cookies.get(READ_PRIMARY_COOKIE)
+
+            async def order_ids(headers, cookies=None):
+                client.cookies.clear()
+                response = await client.get("/api/orders/", headers=headers, cookies=cookies)
+                return [item["id"] for item in response.json()]
+
+            checks["read_your_writes"] = order_id in await order_ids(buyer_a)
+            b_response = await client.get("/api/products/1", headers=buyer_b)
+            checks["other_clients_stay_on_replica"] = from_replica(b_response)
+
+            # 다른 워커: 메모리 기록이 없어도 쿠키로 기본 DB
+            recent_writers.until.clear()
+            checks["cookie_routes_to_primary"] = (
+                cookie is not None and order_id in await order_ids(buyer_a, {READ_PRIMARY_COOKIE: cookie})
+            )
+
+            # 만료 후에는 복제본 (아직 복제 전이므로 새 주문이 안 보임) → 복제 후 보임
+            await asyncio.sleep(STICKY_SECONDS + 0.1)
+            recent_writers.until.clear()
+            checks["replica_after_sticky_window"] = order_id not in await order_ids(buyer_a)
+            replicate(primary_path, replica_path)
+            mark_replica()
+            checks["visible_after_replication"] = order_id in await order_ids(buyer_a)
+
+            # 로그인 직후 - 로그인 요청(토큰 없음)과 이후 조회(토큰)가 같은 사용자 키 (복제 전 주문이 보임)
+            account = {"email": "replica-check@example.com", "password": "password123"}
+            signup = await client.post("/api/auth/signup", json={**account, "name": "bench"})
+            signed_up = {"Authorization": f"Bearer {signup.json()['access_token']}"}
+            pending_id = (await client.post("/api/orders/", json=order, headers=signed_up)).json()["id"]
+            recent_writers.until.clear()
+            client.cookies.clear()
+            login = await client.post("/api/auth/login", json=account)
+            logged_in = {"Authorization": f"Bearer {login.json()['access_token']}"}
+            checks["login_then_reads_primary"] = pending_id in await order_ids(logged_in)
+            recent_writers.until.clear()
+            replicate(primary_path, replica_path)
+            mark_replica()
+
+            # 지연 시간 (복제본 / 기본 DB)
+            latencies = {"replica": [], "primary": []}
+            for target, cookies in (("replica", None), ("primary", {READ_PRIMARY_COOKIE: str(int(time.time()) + 3600)})):
+                for _ in range(requests):
+                    client.cookies.clear()
+                    started = time.perf_counter()
+                    await client.get("/api/products/1", cookies=cookies)
+                    latencies[target].append(time.perf_counter() - started)
+
+            # 복제본 장애 - 검사에서 실패한 복제본은 제외하고 기본 DB 사용
+            os.rename(replica_path, replica_path + ".down")
+            os.mkdir(replica_path)
+            await readiness.run_once()
+            client.cookies.clear()
+            response = await client.get("/api/products/1")
+            checks["replica_failure_falls_back"] = response.status_code == 200 and not from_replica(response)
+            checks["replica_failure_keeps_ready"] = (await client.get("/ready")).status_code == 200
+            os.rmdir(replica_path)
+            os.rename(replica_path + ".down", replica_path)
+            await readiness.run_once()
+
+    db = ReplicaSessionLocal(bind=replica_engines[0])
+    try:
+        db.add(models.Seller(user_id=1, name="x", kakaopay_link="x"))
+        db.flush()
+        checks["replica_session_rejects_writes"] = False
+    except RuntimeError:
+        checks["replica_session_rejects_writes"] = True
+    finally:
+        db.close()
+
+    return {
+        "checks": checks,
+        "passed": all(checks.values()),
+        "product_detail_p50_ms": {
+            target: round(statistics.median(values) * 1000, 2) for target, values in latencies.items()
+        },
+    }
+
+
+def sync_loop(primary_path: str, replica_path: str, interval: float):
+    print(f"{primary_path} → {replica_path} 복사 ({interval}초마다, Ctrl+C로 종료)", file=sys.stderr)
+    while True:
+        replicate(primary_path, replica_path)
+        time.sleep(interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="복제본 라우팅 확인 (SQLite 두 파일)")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--products", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=100, help="지연 시간 측정 요청 수")
+    parser.add_argument("--sync", nargs=2, metavar=("PRIMARY", "REPLICA"), help="기본 DB 파일을 복제본 파일로 주기적으로 복사")
+    parser.add_argument("--interval", type=float, default=2.0, help="--sync 복사 간격 (초)")
+    args = parser.parse_args()
+
+    if args.sync:
+        sync_loop(*args.sync, args.interval)
+        return
+
+    backend_dir = os.getcwd()
+    sys.path.insert(0, backend_dir)
+    workdir = tempfile.mkdtemp(prefix="bench_replica_")
+    primary_path = os.path.join(workdir, "primary.db")
+    replica_path = os.path.join(workdir, "replica.db")
+    os.environ["DATABASE_URL"] = f"sqlite:///{primary_path}"
+    os.environ["DATABASE_REPLICA_URLS"] = f"sqlite:///{replica_path}"
+    os.environ["REPLICA_STICKY_SECONDS"] = str(STICKY_SECONDS)
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    os.environ.setdefault("SLOW_QUERY_MS", "0")
+    os.chdir(workdir)
+
+    seed(args.users, args.products)
+    replicate(primary_path, replica_path)
+
+    result = asyncio.run(run(primary_path, replica_path, args.requests))
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+    sys.exit(0 if result["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""
+서버 시작 시간 측정 (콜드 스타트) - 새 파이썬 프로세스에서 단계별 시간을 재서 JSON으로 출력
+
+- import: `import app.main` (모듈 import + 앱 / 라우터 구성)
+- lifespan: 서버 시작 훅 (CREATE_TABLES_ON_STARTUP=1 이면 테이블 확인)
+- first_request: 첫 GET /health 처리
+- process: 인터프리터 시작부터 종료까지 전체
+- imports_by_package: -X importtime 기준 패키지별 import 시간 (self 합계, 큰 순서)
+- lazy_modules_loaded: 첫 요청까지 불러오면 안 되는 모듈 (cloudinary, google-auth, Pillow) 중 로드된 것
+
+DATABASE_URL이 없으면 임시 디렉토리의 SQLite 사용 (측정 전에 한 번 실행해서 테이블을 만들어 둠 - 운영처럼 테이블이 있는 상태)
+환경변수는 그대로 전달되므로 CREATE_TABLES_ON_STARTUP=0 등으로 비교 가능
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --top 20
+    CREATE_TABLES_ON_STARTUP=0 python -m benchmarks.startup
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+LAZY_MODULES = ["cloudinary", "google.auth", "PIL"]
+
+# 새 프로세스에서 실행할 측정 코드 (결과는 stdout 마지막 줄 JSON)
+CHILD = """
+import asyncio, json, sys, time
+
+LAZY_MODULES = %r
+
+started = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+
+async def first_request():
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/health", "raw_path": b"/health", "query_string": b"",
+        "root_path": "", "headers": [], "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    await app(scope, receive, send)
+    return messages[0]["status"]
+
+
+async def main():
+    lifespan_started = time.perf_counter()
+    async with app.router.lifespan_context(app):
+        lifespan_done = time.perf_counter()
+        status = await first_request()
+        request_done = time.perf_counter()
+    return {
+        "import_ms": (imported - started) * 1000,
+        "lifespan_ms": (lifespan_done - lifespan_started) * 1000,
+        "first_request_ms": (request_done - lifespan_done) * 1000,
+        "status": status,
+        "lazy_modules_loaded": [name for name in LAZY_MODULES if name in sys.modules],
+    }
+
+
+print(json.dumps(asyncio.run(main())))
+"""
+
+
+def parse_importtime(stderr: str):
+    """-X importtime 출력 → 최상위 패키지별 self 시간 합계 (밀리초)"""
+    packages = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us) / 1000
+    return packages
+
+
+def run_once(cwd: str, env: dict):
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD % LAZY_MODULES],
+        cwd=cwd, env=env, capture_output=True, text=True,
+    )
+    process_ms = (time.perf_counter() - started) * 1000
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr[-2000:])
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["process_ms"] = process_ms
+    result["imports"] = parse_importtime(completed.stderr)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="서버 콜드 스타트 시간 측정")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (각각 새 프로세스)")
+    parser.add_argument("--top", type=int, default=15, help="import 시간 상위 패키지 수")
+    parser.add_argument("--output", help="결과 JSON을 저장할 파일")
+    args = parser.parse_args()
+
+    backend_dir = os.getcwd()
+    env = dict(os.environ)
+    env.setdefault("SECRET_KEY", "benchmark-secret")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [backend_dir, env.get("PYTHONPATH")]))
+    # app은 ./tshirts.db 사용
+    cwd = backend_dir if env.get("DATABASE_URL") else tempfile.mkdtemp(prefix="bench_startup_")
+
+    # 준비 실행 (테이블 생성, .pyc 생성) - 측정에서 제외
+    run_once(cwd, env)
+    runs = [run_once(cwd, env) for _ in range(args.runs)]
+
+    def median(key):
+        return round(statistics.median(run[key] for run in runs), 1)
+
+    packages = {name for run in runs for name in run["imports"]}
+    imports = {
+        name: round(statistics.median(run["imports"].get(name, 0) for run in runs), 1)
+        for name in packages
+    }
+    result = {
+        "runs": args.runs,
+        "python": sys.version.split()[0],
+        "create_tables_on_startup": env.get("CREATE_TABLES_ON_STARTUP", "1") == "1",
+        "import_ms": median("import_ms"),
+        "lifespan_ms": median("lifespan_ms"),
+        "first_request_ms": median("first_request_ms"),
+        "process_ms": median("process_ms"),
+        "first_request_status": runs[-1]["status"],
+        "lazy_modules_loaded": runs[-1]["lazy_modules_loaded"],
+        "imports_by_package": dict(sorted(imports.items(), key=lambda item: item[1], reverse=True)[:args.top]),
+    }
+    output = json.dumps(result, indent=2, ensure_ascii=False)
+    if args.output:
+        with open(os.path.join(backend_dir, args.output), "w", encoding="utf-8") as file:
+            file.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
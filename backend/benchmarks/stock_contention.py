@@ -0,0 +1,179 @@
+"""
+재고 동시성 부하 테스트 - 한정 수량 상품에 구매자가 동시에 주문
+
+uvicorn 워커 여러 개를 띄워 실제로 동시에 처리되도록 하고,
+성공한 주문 수량이 재고를 넘지 않는지(overselling 없음)와 지연 시간을 확인
+
+실행 (backend 디렉토리에서):
+    python -m benchmarks.stock_contention
+    python -m benchmarks.stock_contention --buyers 500 --stock 50 --workers 4
+    DATABASE_URL=postgresql://... python -m benchmarks.stock_contention   # Postgres로 테스트
+"""
+import argparse
+import asyncio
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p / 100))]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def seed(buyers: int, stock: int, size_stock: int):
+    """판매자 1명, 한정 상품 1개, 구매자 N명 생성 후 구매자 토큰 반환 (비밀번호 해싱 없이)"""
+    from app.database import Base, SessionLocal, engine
+    from app import models
+    from app.auth import create_user_token
+
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        seller_user = models.User(name="seller", email="seller@bench.local", is_seller=1)
+        db.add(seller_user)
+        db.flush()
+        seller = models.Seller(user_id=seller_user.id, name="bench seller", kakaopay_link="https://qr.kakaopay.com/bench")
+        db.add(seller)
+        db.flush()
+        product = models.Product(
+            name="한정판 티셔츠", price="39,000원", description="drop", image_url="https://example.com/drop.jpg",
+            seller_id=seller.id, category_main="상의", is_active=1, stock=stock,
+            options=[models.ProductOption(size="M", stock=size_stock)],
+        )
+        db.add(product)
+        users = [models.User(name=f"buyer{i}", email=f"buyer{i}@bench.local") for i in range(buyers)]
+        db.add_all(users)
+        db.commit()
+        return seller.id, product.id, [create_user_token(user) for user in users]
+    finally:
+        db.close()
+
+
+def read_result(product_id: int):
+    from app.database import SessionLocal
+    from app import models
+    from sqlalchemy import func
+
+    db = SessionLocal()
+    try:
+        product = db.get(models.Product, product_id)
+        sold = db.query(func.coalesce(func.sum(models.OrderItem.quantity), 0)).filter(
+            models.OrderItem.product_id == product_id
+        ).scalar()
+        return product.stock, product.options[0].stock, sold
+    finally:
+        db.close()
+
+
+async def run_buyers(base_url, seller_id, product_id, tokens, quantity, size):
+    import httpx
+
+    latencies = []
+    statuses = {}
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        async def buy(token):
+            body = {
+                "seller_id": seller_id,
+                "recipient_name": "buyer", "postal_code": "00000", "address": "seoul", "phone": "010",
+                "items": [{"product_id": product_id, "quantity": quantity, "size": size}],
+            }
+            start = time.perf_counter()
+            response = await client.post("/api/orders/", json=body, headers={"Authorization": f"Bearer {token}"})
+            latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(buy(token) for token in tokens))
+        elapsed = time.perf_counter() - started
+    return latencies, statuses, elapsed
+
+
+def wait_ready(base_url: str, process, timeout: float = 30):
+    import httpx
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("uvicorn 시작 실패")
+        try:
+            if httpx.get(f"{base_url}/health", timeout=1).status_code == 200:
+                return
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    raise RuntimeError("uvicorn 시작 시간 초과")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="재고 차감 동시성 부하 테스트")
+    parser.add_argument("--buyers", type=int, default=300)
+    parser.add_argument("--stock", type=int, default=50, help="상품 전체 재고")
+    parser.add_argument("--size-stock", type=int, default=40, help="M 사이즈 재고")
+    parser.add_argument("--quantity", type=int, default=1, help="구매자당 주문 수량")
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    backend_dir = os.getcwd()
+    os.environ.setdefault("SECRET_KEY", "benchmark-secret")
+    sys.path.insert(0, backend_dir)
+    # DATABASE_URL이 없으면 임시 디렉토리의 SQLite (app은 ./tshirts.db 사용)
+    os.chdir(tempfile.mkdtemp(prefix="bench_stock_"))
+
+    seller_id, product_id, tokens = seed(args.buyers, args.stock, args.size_stock)
+
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    env = dict(os.environ, PYTHONPATH=backend_dir)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+         "--workers", str(args.workers), "--log-level", "warning"],
+        env=env,
+    )
+    try:
+        wait_ready(base_url, server)
+        latencies, statuses, elapsed = asyncio.run(
+            run_buyers(base_url, seller_id, product_id, tokens, args.quantity, "M")
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    stock_left, size_left, sold = read_result(product_id)
+    limit = min(args.stock, args.size_stock)
+    result = {
+        "buyers": args.buyers,
+        "workers": args.workers,
+        "initial_stock": args.stock,
+        "initial_size_stock": args.size_stock,
+        "statuses": statuses,
+        "sold_quantity": sold,
+        "stock_left": stock_left,
+        "size_stock_left": size_left,
+        "oversold": sold > limit or stock_left < 0 or size_left < 0,
+        "consistent": sold + size_left == args.size_stock and sold + stock_left == args.stock,
+        "throughput_rps": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "max_ms": round(max(latencies) * 1000, 2),
+        "mean_ms": round(statistics.mean(latencies) * 1000, 2),
+    }
+    print(json.dumps(result, indent=2))
+    if result["oversold"] or not result["consistent"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,13 @@
 from app.database import SessionLocal, engine
 from app.models import Base, Seller, Product
+from app.static_files import static_url
 
 # 데이터베이스 테이블 생성
 Base.metadata.create_all(bind=engine)
 
+# 해시 파일명 URL (내용이 바뀌면 URL도 바뀌므로 브라우저가 영구 캐시 가능)
+QR_URL = f"http://127.0.0.1:8000{static_url('qr/seller1qr.png')}"
+
 def init_sellers():
     db = SessionLocal()
     try:
@@ -21,7 +25,7 @@ def init_sellers():
             id=1,
             name="T-Style 공식스토어",
             kakaopay_link="https://qr.kakaopay.com/FUM39B8EO",
-            kakaopay_qr_url="http://127.0.0.1:8000/static/qr/seller1qr.png"
+            kakaopay_qr_url=QR_URL
         )
         db.add(seller)
         db.commit()
@@ -31,7 +35,7 @@ def init_sellers():
             id=3,
             name="T-Style 공식스토어3",
             kakaopay_link="https://qr.kakaopay.com/FUM39B8EO",
-            kakaopay_qr_url="http://127.0.0.1:8000/static/qr/seller1qr.png"
+            kakaopay_qr_url=QR_URL
         )
         db.add(seller)
         db.commit()
@@ -0,0 +1,373 @@
+"""
+대량 테스트 데이터 생성 (부하 테스트 / 스테이징용)
+
+- 같은 --seed면 항상 같은 데이터 (날짜도 --base-date 기준으로 생성)
+- ORM 객체를 만들지 않고 배치 단위로 바로 저장
+  (PostgreSQL: COPY, SQLite: executemany + 한 트랜잭션)
+- 기존 데이터가 있으면 각 테이블의 마지막 ID 다음부터 추가 (--reset이면 테이블을 지우고 다시 만듦)
+- 생성한 사용자는 모두 같은 비밀번호(--password)로 로그인 가능 (해싱은 한 번만)
+
+실행 (backend 디렉토리에서, SECRET_KEY 필요 - app.auth를 import할 때 확인함 / .env에 있으면 생략 가능):
+    SECRET_KEY=... python seed_data.py --products 100000
+    SECRET_KEY=... python seed_data.py --users 5000 --sellers 200 --products 100000 --seed 7 --reset
+"""
+import argparse
+import asyncio
+import csv
+import io
+import math
+import random
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Sequence
+
+from app.database import Base, engine
+from app.images import build_variants
+from app.routers.products import get_categories
+
+# 카테고리(소분류)별 상품 종류 - 카테고리는 get_categories 기준
+ITEM_TYPES = {
+    "반팔": ["반팔 티셔츠", "크루넥 티셔츠", "포켓 티셔츠", "그래픽 티셔츠", "헨리넥 티셔츠"],
+    "후드": ["후드티", "후드 집업", "오버핏 후드", "기모 후드"],
+    "맨투맨/스웨트": ["맨투맨", "스웨트셔츠", "오버핏 맨투맨", "기모 맨투맨"],
+    "데님팬츠": ["와이드 데님 팬츠", "스트레이트 데님 팬츠", "슬림 데님 팬츠", "카펜터 데님 팬츠"],
+    "숏팬츠": ["하프 팬츠", "스웨트 숏팬츠", "데님 숏팬츠", "나일론 숏팬츠"],
+    None: ["에코백", "버킷햇", "볼캡", "양말 세트", "키링"],
+}
+ADJECTIVES = ["클래식", "베이직", "빈티지", "오버사이즈", "슬림핏", "프리미엄", "데일리", "유니섹스", "시그니처", "미니멀"]
+MATERIALS = ["코튼", "린넨 혼방", "헤비 코튼", "기능성", "피그먼트", "워싱", "오가닉 코튼", "쭈리", "기모"]
+COLORS = ["블랙", "화이트", "그레이", "네이비", "베이지", "차콜", "카키", "아이보리", "스카이블루", "버건디"]
+DESCRIPTIONS = [
+    "부드러운 원단으로 제작되어 매일 입기에 편안합니다.",
+    "어떤 옷과도 잘 어울리는 기본 디자인입니다.",
+    "세탁 후에도 형태가 잘 유지되도록 가공했습니다.",
+    "여유 있는 핏으로 활동하기 편합니다.",
+    "땀을 빠르게 흡수하고 건조시키는 원단을 사용했습니다.",
+    "자연스러운 워싱으로 빈티지한 느낌을 더했습니다.",
+    "사계절 내내 활용하기 좋은 두께입니다.",
+    "국내 공장에서 한 장씩 제작합니다.",
+]
+STORE_WORDS = ["스튜디오", "랩", "웍스", "클로젯", "하우스", "마켓", "프로젝트", "아틀리에"]
+STORE_NAMES = ["오늘", "무드", "코지", "언더", "모노", "블루", "그린", "데이", "노마드", "서울"]
+FAMILY_NAMES = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임"]
+GIVEN_NAMES = ["민준", "서연", "도윤", "지우", "하준", "서윤", "예준", "하은", "시우", "지민", "주원", "수아"]
+ADDRESSES = ["서울시 강남구 테헤란로", "서울시 마포구 양화로", "부산시 해운대구 센텀로", "대구시 중구 동성로",
+             "인천시 연수구 송도과학로", "대전시 유성구 대학로", "광주시 서구 상무대로", "경기도 성남시 분당구 판교역로"]
+SIZES = ["S", "M", "L", "XL"]
+ORDER_STATUSES = ["PENDING", "PAID", "PREPARING", "READY_TO_SHIP", "SHIPPING", "DELIVERED", "CANCELLED"]
+ORDER_STATUS_WEIGHTS = [15, 10, 10, 5, 10, 45, 5]
+
+# 가격 분포 (원) - 로그정규분포, 중앙값 약 35,000원
+PRICE_MEDIAN = 35000
+PRICE_SIGMA = 0.45
+PRICE_MIN, PRICE_MAX = 9900, 199000
+
+
+def format_price(amount: int) -> str:
+    """25000 → "25,000원" (기존 상품 가격 형식)"""
+    return f"{amount:,}원"
+
+
+def random_price(rng: random.Random) -> int:
+    """대부분 1,000원 단위, 일부는 9,900원처럼 900원으로 끝나는 가격"""
+    amount = rng.lognormvariate(math.log(PRICE_MEDIAN), PRICE_SIGMA)
+    amount = min(max(amount, PRICE_MIN), PRICE_MAX)
+    if rng.random() < 0.3:
+        return int(amount // 1000) * 1000 + 900
+    return int(round(amount / 1000)) * 1000
+
+
+def timestamp(base: datetime, rng: random.Random, days: int = 180) -> str:
+    """base 이전 days일 안의 시각 (SQLAlchemy DateTime 저장 형식)"""
+    moment = base - timedelta(seconds=rng.randrange(days * 24 * 3600))
+    return moment.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+class BulkWriter:
+    """
+    테이블에 행을 배치로 저장
+    - PostgreSQL: COPY ... FROM STDIN (CSV)
+    - 그 외(SQLite): executemany, 동기화를 끄고 한 트랜잭션으로 저장
+    """
+
+    def __init__(self, batch_size: int):
+        self.batch_size = batch_size
+        self.dialect = engine.dialect.name
+        self.connection = engine.raw_connection()
+        if self.dialect == "sqlite":
+            cursor = self.connection.cursor()
+            cursor.execute("PRAGMA synchronous = OFF")
+            cursor.close()
+
+    def next_id(self, table: str) -> int:
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}")
+            return cursor.fetchone()[0] + 1
+        finally:
+            cursor.close()
+
+    def write(self, table: str, columns: Sequence[str], rows: Iterable[Sequence]) -> int:
+        count = 0
+        batch: List[Sequence] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self.batch_size:
+                self._flush(table, columns, batch)
+                count += len(batch)
+                batch = []
+        if batch:
+            self._flush(table, columns, batch)
+            count += len(batch)
+        self.connection.commit()
+        return count
+
+    def _flush(self, table: str, columns: Sequence[str], batch: List[Sequence]):
+        cursor = self.connection.cursor()
+        try:
+            if self.dialect == "postgresql":
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(batch)  # None → 빈 칸 → NULL
+                buffer.seek(0)
+                cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buffer)
+            else:
+                placeholders = ", ".join("?" for _ in columns)
+                cursor.executemany(f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", batch)
+        finally:
+            cursor.close()
+
+    def reset_sequences(self, tables: Iterable[str]):
+        """PostgreSQL: ID를 직접 넣었으므로 시퀀스를 마지막 ID로 맞춤"""
+        if self.dialect != "postgresql":
+            return
+        cursor = self.connection.cursor()
+        try:
+            for table in tables:
+                cursor.execute(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), COALESCE(MAX(id), 1)) FROM {table}"
+                )
+            self.connection.commit()
+        finally:
+            cursor.close()
+
+    def close(self):
+        self.connection.close()
+
+
+class DataGenerator:
+    """
+    테이블별 행 생성 - 테이블마다 별도 난수열 (seed, 테이블 이름)을 사용하므로
+    한 테이블의 양을 바꿔도 다른 테이블 데이터는 그대로
+    """
+
+    def __init__(self, args, hashed_password: str, start_ids: Dict[str, int]):
+        self.args = args
+        self.seed = args.seed
+        self.base = datetime.fromisoformat(args.base_date)
+        self.hashed_password = hashed_password
+        self.ids = start_ids
+        categories = asyncio.run(get_categories())
+        self.category_pairs = [(main, sub) for main, subs in categories.items() for sub in (subs or [None])]
+        # 주문 생성 시 필요한 상품 정보 (판매자 ID, 가격)
+        self.product_sellers: List[int] = []
+        self.product_prices: List[int] = []
+
+    def rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table}")
+
+    def users(self) -> Iterator[tuple]:
+        rng = self.rng("users")
+        first = self.ids["users"]
+        for offset in range(self.args.users):
+            user_id = first + offset
+            name = rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES)
+            yield (user_id, name, f"user{user_id}@seed.local", self.hashed_password,
+                   int(offset < self.args.sellers), 0, 0, timestamp(self.base, rng, 365))
+
+    def sellers(self) -> Iterator[tuple]:
+        rng = self.rng("sellers")
+        for offset in range(self.args.sellers):
+            seller_id = self.ids["sellers"] + offset
+            name = f"{rng.choice(STORE_NAMES)} {rng.choice(STORE_WORDS)} {seller_id}"
+            yield (seller_id, self.ids["users"] + offset, name, f"https://qr.kakaopay.com/seed{seller_id}",
+                   timestamp(self.base, rng, 365))
+
+    def products(self) -> Iterator[tuple]:
+        rng = self.rng("products")
+        first_seller = self.ids["sellers"]
+        for offset in range(self.args.products):
+            product_id = self.ids["products"] + offset
+            main, sub = rng.choice(self.category_pairs)
+            seller_id = first_seller + rng.randrange(self.args.sellers)
+            price = random_price(rng)
+            self.product_sellers.append(seller_id)
+            self.product_prices.append(price)
+            name = f"{rng.choice(ADJECTIVES)} {rng.choice(MATERIALS)} {rng.choice(ITEM_TYPES.get(sub, ITEM_TYPES[None]))} ({rng.choice(COLORS)})"
+            description = " ".join(rng.sample(DESCRIPTIONS, 3))
+            yield (product_id, name, format_price(price), description, self.image_url(seller_id, product_id, 0),
+                   seller_id, main, sub, f"https://smartstore.naver.com/seed/products/{product_id}", 1,
+                   rng.randrange(0, 500) if rng.random() < self.args.stock_ratio else None, timestamp(self.base, rng))
+
+    def image_url(self, seller_id: int, product_id: int, index: int) -> str:
+        return f"https://res.cloudinary.com/demo/image/upload/tshirts/products/seller_{seller_id}/product_{product_id}_{index}.jpg"
+
+    def product_options(self) -> Iterator[tuple]:
+        rng = self.rng("product_options")
+        option_id = self.ids["product_options"]
+        for offset in range(self.args.products):
+            if rng.random() >= self.args.option_ratio:
+                continue
+            for size in SIZES:
+                yield (option_id, self.ids["products"] + offset, size, rng.randrange(0, 100))
+                option_id += 1
+
+    def product_images(self) -> Iterator[tuple]:
+        rng = self.rng("product_images")
+        image_id = self.ids["product_images"]
+        for offset, seller_id in enumerate(self.product_sellers):
+            product_id = self.ids["products"] + offset
+            for index in range(self.args.images_per_product):
+                yield (image_id, product_id, self.image_url(seller_id, product_id, index), index,
+                       timestamp(self.base, rng))
+                image_id += 1
+
+    def product_image_variants(self) -> Iterator[tuple]:
+        variant_id = self.ids["product_image_variants"]
+        image_id = self.ids["product_images"]
+        for offset, seller_id in enumerate(self.product_sellers):
+            product_id = self.ids["products"] + offset
+            for index in range(self.args.images_per_product):
+                for variant in build_variants(self.image_url(seller_id, product_id, index), 1200, 1200):
+                    yield (variant_id, image_id, variant["name"], variant["width"], variant["height"], variant["image_url"])
+                    variant_id += 1
+                image_id += 1
+
+    def cart_items(self) -> Iterator[tuple]:
+        rng = self.rng("cart_items")
+        item_id = self.ids["cart_items"]
+        count = min(self.args.cart_items, self.args.products)
+        for offset in range(self.args.users):
+            user_id = self.ids["users"] + offset
+            for product_offset in rng.sample(range(self.args.products), count):
+                yield (item_id, user_id, self.ids["products"] + product_offset, rng.randint(1, 3),
+                       timestamp(self.base, rng, 30))
+                item_id += 1
+
+    def orders_and_items(self) -> Iterator[tuple]:
+        """(orders 행, order_items 행 목록) - 주문마다 같은 판매자의 상품 1~3개"""
+        rng = self.rng("orders")
+        by_seller: Dict[int, List[int]] = {}
+        for offset, seller_id in enumerate(self.product_sellers):
+            by_seller.setdefault(seller_id, []).append(offset)
+        sellers = sorted(by_seller)
+
+        order_id = self.ids["orders"]
+        item_id = self.ids["order_items"]
+        for offset in range(self.args.users):
+            user_id = self.ids["users"] + offset
+            for _ in range(self.args.orders):
+                seller_id = rng.choice(sellers)
+                created = timestamp(self.base, rng)
+                status = rng.choices(ORDER_STATUSES, ORDER_STATUS_WEIGHTS)[0]
+                order = (order_id, user_id, seller_id, rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES),
+                         f"{rng.randrange(1000, 63000):05d}", f"{rng.choice(ADDRESSES)} {rng.randrange(1, 500)}",
+                         f"010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}", None, status, created, created)
+                items = []
+                candidates = by_seller[seller_id]
+                for product_offset in rng.sample(candidates, min(len(candidates), rng.randint(1, 3))):
+                    items.append((item_id, order_id, self.ids["products"] + product_offset, rng.randint(1, 2),
+                                  None, format_price(self.product_prices[product_offset])))
+                    item_id += 1
+                yield order, items
+                order_id += 1
+
+
+COLUMNS = {
+    "users": ("id", "name", "email", "hashed_password", "is_seller", "is_admin", "token_version", "created_at"),
+    "sellers": ("id", "user_id", "name", "kakaopay_link", "created_at"),
+    "products": ("id", "name", "price", "description", "image_url", "seller_id", "category_main", "category_sub",
+                 "external_store_url", "is_active", "stock", "created_at"),
+    "product_options": ("id", "product_id", "size", "stock"),
+    "product_images": ("id", "product_id", "image_url", "display_order", "created_at"),
+    "product_image_variants": ("id", "image_id", "name", "width", "height", "image_url"),
+    "cart_items": ("id", "user_id", "product_id", "quantity", "created_at"),
+    "orders": ("id", "user_id", "seller_id", "recipient_name", "postal_code", "address", "phone",
+               "delivery_request", "status", "created_at", "updated_at"),
+    "order_items": ("id", "order_id", "product_id", "quantity", "size", "price_at_order"),
+}
+
+
+def seed(args) -> Dict[str, Dict]:
+    """데이터 생성 후 테이블별 (행 수, 초, 초당 행 수) 반환"""
+    from app.auth import hash_password
+
+    if args.reset:
+        Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    writer = BulkWriter(args.batch_size)
+    try:
+        start_ids = {table: writer.next_id(table) for table in COLUMNS}
+        generator = DataGenerator(args, hash_password(args.password), start_ids)
+        stats = {}
+
+        def timed(table: str, rows: Callable[[], Iterable[Sequence]]):
+            started = time.perf_counter()
+            count = writer.write(table, COLUMNS[table], rows())
+            elapsed = time.perf_counter() - started
+            stats[table] = {"rows": count, "seconds": round(elapsed, 3), "rows_per_second": round(count / elapsed) if elapsed else count}
+            print(f"✅ {table}: {count:,}행 ({stats[table]['rows_per_second']:,}행/초)")
+
+        timed("users", generator.users)
+        timed("sellers", generator.sellers)
+        timed("products", generator.products)
+        timed("product_options", generator.product_options)
+        timed("product_images", generator.product_images)
+        timed("product_image_variants", generator.product_image_variants)
+        timed("cart_items", generator.cart_items)
+
+        # 주문과 주문 상품은 함께 생성 - 주문을 먼저 저장하고 상품 행은 모아서 저장
+        order_items: List[tuple] = []
+
+        def orders():
+            for order, items in generator.orders_and_items():
+                order_items.extend(items)
+                yield order
+
+        timed("orders", orders)
+        timed("order_items", lambda: order_items)
+
+        writer.reset_sequences(COLUMNS)
+        return stats
+    finally:
+        writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대량 테스트 데이터 생성")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--sellers", type=int, default=50)
+    parser.add_argument("--products", type=int, default=10000)
+    parser.add_argument("--images-per-product", type=int, default=3)
+    parser.add_argument("--stock-ratio", type=float, default=0.5, help="재고를 관리하는 상품 비율 (나머지는 무제한)")
+    parser.add_argument("--option-ratio", type=float, default=0.5, help="사이즈 옵션(S/M/L/XL)이 있는 상품 비율")
+    parser.add_argument("--cart-items", type=int, default=3, help="사용자당 장바구니 상품 수")
+    parser.add_argument("--orders", type=int, default=2, help="사용자당 주문 수")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--base-date", default="2025-01-01", help="생성 시각 기준일 (이전 날짜들로 분포)")
+    parser.add_argument("--password", default="password123", help="생성한 사용자 공통 비밀번호")
+    parser.add_argument("--batch-size", type=int, default=10000)
+    parser.add_argument("--reset", action="store_true", help="모든 테이블을 지우고 다시 만든 뒤 생성")
+    args = parser.parse_args()
+    if args.sellers < 1 or args.users < args.sellers or args.products < 1:
+        parser.error("--users >= --sellers >= 1, --products >= 1 이어야 합니다")
+
+    started = time.perf_counter()
+    stats = seed(args)
+    elapsed = time.perf_counter() - started
+    total = sum(table["rows"] for table in stats.values())
+    print(f"✅ 총 {total:,}행을 {elapsed:.1f}초에 생성했습니다 ({round(total / elapsed):,}행/초)")
+
+
+if __name__ == "__main__":
+    main()
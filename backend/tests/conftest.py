@@ -0,0 +1,103 @@
+"""
+테스트 공통 설정 - 임시 SQLite 파일 DB / 로컬 미디어 저장소로 앱을 띄워 TestClient로 요청
+
+실행 (backend 디렉토리에서):
+    python -m pytest tests
+"""
+import os
+import tempfile
+
+# app import 전에 설정 (엔진 / 저장소는 import 시점에 만들어짐) - 개발용 tshirts.db는 건드리지 않음
+_TMP_DIR = tempfile.mkdtemp(prefix="tshirts-test-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP_DIR}/test.db"
+os.environ["DATABASE_REPLICA_URLS"] = ""
+os.environ["MEDIA_STORAGE"] = "local"
+os.environ["LOCAL_MEDIA_ROOT"] = os.path.join(_TMP_DIR, "uploads")
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+
+import pytest
+from fastapi.testclient import TestClient
+from app import auth, cart_summary, models
+from app.database import Base, SessionLocal, engine
+from app.db_routing import recent_writers
+from app.main import app
+from app.rate_limit import MemoryRateLimitStore, set_store
+from app.token_revocation import revocation_store
+
+
+@pytest.fixture(autouse=True)
+def fresh_state():
+    """테스트마다 빈 DB와 빈 워커 메모리 (캐시 / 버킷 / 폐기 목록)"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    cart_summary._cache.clear()
+    auth._token_versions.clear()
+    recent_writers.until.clear()
+    revocation_store.loaded = False
+    set_store(MemoryRateLimitStore())
+    yield
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def make_user(db):
+    """사용자 생성 (seller=True면 판매자 등록까지) - 비밀번호는 모두 password123"""
+    hashed_password = auth.hash_password("password123")
+
+    def _make_user(email: str, seller: bool = False) -> models.User:
+        user = models.User(name=email.split("@")[0], email=email, hashed_password=hashed_password, is_seller=int(seller))
+        db.add(user)
+        db.flush()
+        if seller:
+            db.add(models.Seller(user_id=user.id, name=f"{user.name} 상점", kakaopay_link="https://qr.kakaopay.com/test"))
+        db.commit()
+        return user
+
+    return _make_user
+
+
+@pytest.fixture
+def make_product(db):
+    """상품 생성 - stock=None이면 재고 관리 안 함, sizes는 {사이즈: 재고}"""
+
+    def _make_product(seller_id: int, stock=None, sizes=None, is_active: int = 1, price: str = "25,000원") -> models.Product:
+        product = models.Product(
+            name="테스트 티셔츠",
+            price=price,
+            description="테스트 상품",
+            image_url="/uploads/test.png",
+            seller_id=seller_id,
+            is_active=is_active,
+            stock=stock,
+            options=[models.ProductOption(size=size, stock=size_stock) for size, size_stock in (sizes or {}).items()],
+        )
+        db.add(product)
+        db.commit()
+        return product
+
+    return _make_product
+
+
+@pytest.fixture
+def auth_headers(db):
+    """사용자의 access token Authorization 헤더"""
+
+    def _auth_headers(user: models.User) -> dict:
+        db.refresh(user)
+        return {"Authorization": f"Bearer {auth.create_user_token(user)}"}
+
+    return _auth_headers
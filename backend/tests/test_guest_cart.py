@@ -0,0 +1,85 @@
+"""비로그인 장바구니 병합 - 로그인/회원가입 시 내 장바구니로 합치고 게스트 장바구니와 쿠키 삭제"""
+from app import models
+from app.guest_cart import GUEST_CART_COOKIE, decode_items, encode_items
+
+
+def cart_quantities(client, token):
+    response = client.get("/api/cart/", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    return {item["product_id"]: item["quantity"] for item in response.json()}
+
+
+def add_as_guest(client, product_id, quantity):
+    response = client.post("/api/cart/guest", json={"product_id": product_id, "quantity": quantity})
+    assert response.status_code == 200, response.text
+
+
+def test_encode_decode_round_trip():
+    assert decode_items("3:1,7:2") == {3: 1, 7: 2}
+    assert encode_items({3: 1, 7: 0, 9: 4}) == "3:1,9:4"
+    assert decode_items("") == {}
+
+
+def test_login_merges_guest_cart(client, db, make_user, make_product):
+    seller = make_user("seller@example.com", seller=True)
+    buyer = make_user("buyer@example.com")
+    shirt, hoodie, removed = (make_product(seller.seller.id) for _ in range(3))
+    db.add(models.CartItem(user_id=buyer.id, product_id=shirt.id, quantity=1))
+    db.commit()
+
+    add_as_guest(client, shirt.id, 2)
+    add_as_guest(client, hoodie.id, 1)
+    add_as_guest(client, removed.id, 1)
+    # 담은 뒤 판매 중지된 상품은 병합하지 않음
+    removed.is_active = 0
+    db.commit()
+
+    response = client.post("/api/auth/login", json={"email": "buyer@example.com", "password": "password123"})
+    assert response.status_code == 200
+
+    # 이미 담긴 상품은 수량 합산
+    assert cart_quantities(client, response.json()["access_token"]) == {shirt.id: 3, hoodie.id: 1}
+    assert db.query(models.GuestCart).count() == 0
+    assert GUEST_CART_COOKIE not in client.cookies
+    assert client.get("/api/cart/guest").json() == []
+
+
+def test_signup_merges_guest_cart(client, db, make_user, make_product):
+    seller = make_user("seller@example.com", seller=True)
+    shirt = make_product(seller.seller.id)
+    add_as_guest(client, shirt.id, 2)
+
+    response = client.post(
+        "/api/auth/signup",
+        json={"name": "new", "email": "new@example.com", "password": "password123"},
+    )
+    assert response.status_code == 200
+
+    assert cart_quantities(client, response.json()["access_token"]) == {shirt.id: 2}
+    assert db.query(models.GuestCart).count() == 0
+
+
+def test_login_without_guest_cart_keeps_cart(client, db, make_user, make_product):
+    seller = make_user("seller@example.com", seller=True)
+    buyer = make_user("buyer@example.com")
+    shirt = make_product(seller.seller.id)
+    db.add(models.CartItem(user_id=buyer.id, product_id=shirt.id, quantity=2))
+    db.commit()
+
+    response = client.post("/api/auth/login", json={"email": "buyer@example.com", "password": "password123"})
+    assert response.status_code == 200
+    assert cart_quantities(client, response.json()["access_token"]) == {shirt.id: 2}
+
+
+def test_merge_refreshes_cart_summary(client, db, make_user, make_product, auth_headers):
+    seller = make_user("seller@example.com", seller=True)
+    buyer = make_user("buyer@example.com")
+    shirt = make_product(seller.seller.id, price="10,000원")
+    headers = auth_headers(buyer)
+    # 병합 전 요약을 캐시에 올려둠
+    assert client.get("/api/cart/summary", headers=headers).json()["total"] == 0
+
+    add_as_guest(client, shirt.id, 3)
+    client.post("/api/auth/login", json={"email": "buyer@example.com", "password": "password123"})
+
+    assert client.get("/api/cart/summary", headers=headers).json()["total"] == 30000
@@ -0,0 +1,127 @@
+"""Idempotency-Key - 같은 키로 다시 보내면 저장된 응답, 처리 중이면 409, 다른 요청이면 422"""
+import hashlib
+import json
+from datetime import datetime, timedelta
+import pytest
+from fastapi import HTTPException
+from app import models
+from app.idempotency import IdempotentReplay, claim_key
+
+
+@pytest.fixture
+def shop(db, make_user, make_product, auth_headers):
+    seller = make_user("seller@example.com", seller=True)
+    buyer = make_user("buyer@example.com")
+    product = make_product(seller.seller.id, stock=5)
+    body = {
+        "seller_id": seller.seller.id, "recipient_name": "테스트", "postal_code": "06236",
+        "address": "서울시 강남구", "phone": "010-0000-0000",
+        "items": [{"product_id": product.id, "quantity": 1}],
+    }
+    return buyer, product, body, auth_headers(buyer)
+
+
+def post_order(client, headers, body, key):
+    return client.post("/api/orders/", json=body, headers={**headers, "Idempotency-Key": key})
+
+
+def test_retry_replays_first_response(client, db, shop):
+    buyer, product, body, headers = shop
+
+    first = post_order(client, headers, body, "order-1")
+    second = post_order(client, headers, body, "order-1")
+
+    assert first.status_code == second.status_code == 200
+    assert second.json() == first.json()
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert db.query(models.Order).count() == 1
+    db.expire_all()
+    assert db.get(models.Product, product.id).stock == 4
+
+
+def test_same_key_with_different_body_is_rejected(client, shop):
+    buyer, product, body, headers = shop
+    post_order(client, headers, body, "order-1")
+
+    response = post_order(client, headers, {**body, "recipient_name": "다른 사람"}, "order-1")
+    assert response.status_code == 422
+
+
+def test_duplicate_while_first_is_in_flight(client, db, shop):
+    buyer, product, body, headers = shop
+    content = json.dumps(body).encode()
+    # 첫 요청이 키를 잡고 아직 응답을 저장하지 않은 상태
+    claim_key(db, buyer.id, "orders", "order-1", hashlib.sha256(content).hexdigest())
+
+    response = client.post(
+        "/api/orders/",
+        content=content,
+        headers={**headers, "Content-Type": "application/json", "Idempotency-Key": "order-1"},
+    )
+
+    assert response.status_code == 409
+    assert response.headers["Retry-After"] == "1"
+    assert db.query(models.Order).count() == 0
+
+
+def test_claim_states(db, make_user):
+    user = make_user("buyer@example.com")
+    record = claim_key(db, user.id, "orders", "k", "hash")
+
+    with pytest.raises(HTTPException) as in_flight:
+        claim_key(db, user.id, "orders", "k", "hash")
+    assert in_flight.value.status_code == 409
+
+    with pytest.raises(HTTPException) as mismatch:
+        claim_key(db, user.id, "orders", "k", "other-hash")
+    assert mismatch.value.status_code == 422
+
+    record.status_code = 200
+    record.response_body = '{"id": 1}'
+    record.expires_at = datetime.utcnow() + timedelta(hours=1)
+    db.commit()
+    with pytest.raises(IdempotentReplay) as replay:
+        claim_key(db, user.id, "orders", "k", "hash")
+    assert replay.value.response.body == b'{"id": 1}'
+
+    # 다른 엔드포인트(scope)는 별도 키
+    assert claim_key(db, user.id, "products", "k", "hash").status_code is None
+
+
+def test_stale_in_flight_key_is_reclaimed(db, make_user):
+    user = make_user("buyer@example.com")
+    record = claim_key(db, user.id, "orders", "k", "hash")
+    # 처리 중에 워커가 죽어 잠금 시간이 지난 키
+    record.expires_at = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+    db.expunge(record)  # 다른 워커가 잡았던 키 - 이 세션은 모름
+
+    reclaimed = claim_key(db, user.id, "orders", "k", "hash")
+    assert reclaimed.status_code is None
+    assert db.query(models.IdempotencyKey).count() == 1
+
+
+def test_failed_request_releases_key(client, db, shop):
+    buyer, product, body, headers = shop
+    oversized = {**body, "items": [{"product_id": product.id, "quantity": 10}]}
+
+    assert post_order(client, headers, oversized, "order-1").status_code == 409
+    assert db.query(models.IdempotencyKey).count() == 0
+
+    # 재고를 채운 뒤 같은 키로 재시도하면 처리됨
+    db.get(models.Product, product.id).stock = 10
+    db.commit()
+    assert post_order(client, headers, oversized, "order-1").status_code == 200
+
+
+def test_keys_are_per_user(client, db, shop, make_user, auth_headers):
+    buyer, product, body, headers = shop
+    other_headers = auth_headers(make_user("other@example.com"))
+
+    first = post_order(client, headers, body, "order-1")
+    other = post_order(client, other_headers, body, "order-1")
+
+    assert other.status_code == 200
+    assert other.json()["id"] != first.json()["id"]
+    assert "Idempotent-Replayed" not in other.headers
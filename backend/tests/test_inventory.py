@@ -0,0 +1,153 @@
+"""재고 차감 - 조건부 UPDATE (stock >= 수량일 때만), 부족하면 409로 주문 전체 취소"""
+import threading
+import pytest
+from fastapi import HTTPException
+from app import models
+from app.database import SessionLocal
+from app.inventory import reserve_stock
+
+
+def order_body(seller_id, product_id, quantity=1, size=None):
+    return {
+        "seller_id": seller_id, "recipient_name": "테스트", "postal_code": "06236",
+        "address": "서울시 강남구", "phone": "010-0000-0000",
+        "items": [{"product_id": product_id, "quantity": quantity, "size": size}],
+    }
+
+
+def stock_of(db, product):
+    db.expire_all()
+    return db.get(models.Product, product.id).stock
+
+
+@pytest.fixture
+def shop(db, make_user, auth_headers):
+    seller = make_user("seller@example.com", seller=True)
+    buyer = make_user("buyer@example.com")
+    return seller.seller.id, auth_headers(buyer)
+
+
+def test_reserve_decrements_product_and_option(db, make_user, make_product):
+    seller = make_user("seller@example.com", seller=True)
+    product = make_product(seller.seller.id, stock=10, sizes={"M": 3, "L": None})
+
+    reserve_stock(db, [(product.id, "M", 2), (product.id, "L", 4)])
+    db.commit()
+
+    db.expire_all()
+    assert product.stock == 4
+    assert {option.size: option.stock for option in product.options} == {"M": 1, "L": None}
+
+
+def test_unlimited_stock_stays_unlimited(db, make_user, make_product):
+    seller = make_user("seller@example.com", seller=True)
+    product = make_product(seller.seller.id, stock=None)
+
+    reserve_stock(db, [(product.id, None, 1000)])
+    db.commit()
+
+    assert stock_of(db, product) is None
+
+
+def test_stale_read_cannot_oversell(db, make_user, make_product):
+    seller = make_user("seller@example.com", seller=True)
+    product = make_product(seller.seller.id, stock=1)
+    # 이 세션은 재고 1을 읽어둔 상태
+    assert db.get(models.Product, product.id).stock == 1
+
+    other = SessionLocal()
+    try:
+        reserve_stock(other, [(product.id, None, 1)])
+        other.commit()
+    finally:
+        other.close()
+
+    # 읽어둔 값이 아니라 UPDATE 조건으로 판단
+    with pytest.raises(HTTPException) as error:
+        reserve_stock(db, [(product.id, None, 1)])
+    assert error.value.status_code == 409
+    assert stock_of(db, product) == 0
+
+
+def test_concurrent_reservations_never_oversell(db, make_user, make_product):
+    seller = make_user("seller@example.com", seller=True)
+    product = make_product(seller.seller.id, stock=5)
+    product_id = product.id  # 스레드에서 테스트 세션의 객체를 건드리지 않도록
+    results = []
+    start = threading.Barrier(10)
+
+    def buy():
+        session = SessionLocal()
+        try:
+            start.wait()
+            reserve_stock(session, [(product_id, None, 1)])
+            session.commit()
+            results.append(200)
+        except HTTPException as error:
+            results.append(error.status_code)
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=buy) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [200] * 5 + [409] * 5
+    assert stock_of(db, product) == 0
+
+
+def test_oversell_returns_409_and_creates_no_order(client, db, shop, make_product):
+    seller_id, headers = shop
+    product = make_product(seller_id, stock=1)
+
+    assert client.post("/api/orders/", json=order_body(seller_id, product.id), headers=headers).status_code == 200
+    response = client.post("/api/orders/", json=order_body(seller_id, product.id), headers=headers)
+
+    assert response.status_code == 409
+    assert db.query(models.Order).count() == 1
+    assert stock_of(db, product) == 0
+
+
+def test_failed_item_rolls_back_whole_order(client, db, shop, make_product):
+    seller_id, headers = shop
+    plenty = make_product(seller_id, stock=10)
+    scarce = make_product(seller_id, stock=1)
+    body = order_body(seller_id, plenty.id, quantity=2)
+    body["items"].append({"product_id": scarce.id, "quantity": 2})
+
+    response = client.post("/api/orders/", json=body, headers=headers)
+
+    assert response.status_code == 409
+    assert stock_of(db, plenty) == 10
+    assert stock_of(db, scarce) == 1
+    assert db.query(models.Order).count() == 0
+
+
+def test_size_rules(client, db, shop, make_product):
+    seller_id, headers = shop
+    product = make_product(seller_id, stock=10, sizes={"M": 1})
+
+    assert client.post("/api/orders/", json=order_body(seller_id, product.id), headers=headers).status_code == 400
+    assert client.post("/api/orders/", json=order_body(seller_id, product.id, size="XL"), headers=headers).status_code == 400
+    assert client.post("/api/orders/", json=order_body(seller_id, product.id, size="M"), headers=headers).status_code == 200
+    # 사이즈 재고가 부족하면 전체 재고도 그대로
+    assert client.post("/api/orders/", json=order_body(seller_id, product.id, size="M"), headers=headers).status_code == 409
+    assert stock_of(db, product) == 9
+
+
+def test_cancel_restores_stock(client, db, make_user, make_product, auth_headers):
+    seller = make_user("seller@example.com", seller=True)
+    buyer = make_user("buyer@example.com")
+    product = make_product(seller.seller.id, stock=2)
+    order = client.post("/api/orders/", json=order_body(seller.seller.id, product.id, quantity=2), headers=auth_headers(buyer)).json()
+    assert stock_of(db, product) == 0
+
+    seller_headers = auth_headers(seller)
+    url = f"/api/sellers/orders/{order['id']}/status"
+    assert client.put(url, json={"status": "cancelled"}, headers=seller_headers).status_code == 200
+    assert stock_of(db, product) == 2
+    # 같은 취소를 다시 보내도 한 번만 복구
+    client.put(url, json={"status": "cancelled"}, headers=seller_headers)
+    assert stock_of(db, product) == 2
@@ -0,0 +1,107 @@
+"""상품 수정 시 이미지 슬롯 - 유지한 이미지는 순서가 바뀌어도 같은 행(id), 빠진 이미지만 삭제"""
+import io
+import json
+from PIL import Image
+from app import models
+
+PRODUCT_FORM = {
+    "name": "슬롯 테스트",
+    "price": "25,000원",
+    "description": "이미지 순서 변경",
+    "external_store_url": "https://store.example.com/1",
+}
+
+
+def png(color) -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (40, 40), color).save(buffer, format="PNG")
+    return buffer.getvalue()
+
+
+def upload(name: str, color):
+    return ("images", (f"{name}.png", png(color), "image/png"))
+
+
+def create_product(client, headers, *colors):
+    response = client.post(
+        "/api/products/",
+        data=PRODUCT_FORM,
+        files=[upload(f"image{index}", color) for index, color in enumerate(colors)],
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def update_slots(client, headers, product_id, slots, files=()):
+    response = client.put(
+        f"/api/products/{product_id}",
+        data={**PRODUCT_FORM, "slot_info": json.dumps(slots)},
+        files=list(files) or None,
+        headers=headers,
+    )
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def keep(image):
+    return {"isNew": False, "url": image["image_url"]}
+
+
+def ref_counts(db):
+    db.expire_all()
+    return {asset.image_url: asset.ref_count for asset in db.query(models.ImageAsset)}
+
+
+def test_reorder_keeps_image_ids(client, db, make_user, auth_headers):
+    headers = auth_headers(make_user("seller@example.com", seller=True))
+    product = create_product(client, headers, "red", "blue", "green")
+    red, blue, green = product["images"]
+
+    updated = update_slots(client, headers, product["id"], [keep(green), keep(red), keep(blue)])
+
+    assert [(image["id"], image["display_order"]) for image in updated["images"]] == [
+        (green["id"], 0), (red["id"], 1), (blue["id"], 2),
+    ]
+    assert updated["image_url"] == green["image_url"]
+    # 변형 행도 그대로 (다시 만들지 않음)
+    assert updated["images"][0]["variants"] == green["variants"]
+    # 참조 수는 그대로 - 순서 변경은 asset을 다시 잡거나 놓지 않음
+    assert set(ref_counts(db).values()) == {1}
+
+
+def test_replace_one_slot_keeps_other_ids(client, db, make_user, auth_headers):
+    headers = auth_headers(make_user("seller@example.com", seller=True))
+    product = create_product(client, headers, "red", "blue")
+    red, blue = product["images"]
+
+    updated = update_slots(
+        client, headers, product["id"],
+        [{"isNew": True, "url": None}, keep(blue)],
+        files=[upload("yellow", "yellow")],
+    )
+
+    images = updated["images"]
+    assert len(images) == 2
+    assert images[1]["id"] == blue["id"] and images[1]["display_order"] == 1
+    assert images[0]["id"] not in (red["id"], blue["id"])
+    assert db.query(models.ProductImage).filter(models.ProductImage.id == red["id"]).first() is None
+    assert db.query(models.ProductImageVariant).filter(models.ProductImageVariant.image_id == red["id"]).count() == 0
+
+    counts = ref_counts(db)
+    assert counts[red["image_url"]] == 0
+    assert counts[blue["image_url"]] == 1
+    assert counts[images[0]["image_url"]] == 1
+
+
+def test_duplicate_url_slots_keep_each_row(client, db, make_user, auth_headers):
+    headers = auth_headers(make_user("seller@example.com", seller=True))
+    # 같은 이미지를 두 번 올린 상품 - URL이 같은 행 두 개
+    product = create_product(client, headers, "red", "red", "blue")
+    first, second, blue = product["images"]
+    assert first["image_url"] == second["image_url"]
+
+    updated = update_slots(client, headers, product["id"], [keep(blue), keep(first), keep(second)])
+
+    assert [image["id"] for image in updated["images"]] == [blue["id"], first["id"], second["id"]]
+    assert ref_counts(db)[first["image_url"]] == 2
@@ -0,0 +1,86 @@
+"""토큰 버킷 제한 - 버킷 크기만큼 연속 허용, 이후 충전 속도대로 허용, 초과하면 429 + Retry-After"""
+import asyncio
+import pytest
+from app import rate_limit
+from app.rate_limit import MemoryRateLimitStore, parse_rate
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(rate_limit.time, "monotonic", fake)
+    return fake
+
+
+def take(store, key, rate):
+    return asyncio.run(store.take(key, *rate))
+
+
+def test_parse_rate():
+    assert parse_rate("10/60") == (10, 10 / 60)
+
+
+def test_burst_then_refill(clock):
+    store = MemoryRateLimitStore()
+    rate = parse_rate("3/3")  # 3번 연속, 초당 1개 충전
+
+    assert [take(store, "k", rate)[0] for _ in range(3)] == [True, True, True]
+    allowed, retry_after = take(store, "k", rate)
+    assert not allowed
+    assert retry_after == pytest.approx(1.0)
+
+    clock.now += 0.5
+    allowed, retry_after = take(store, "k", rate)
+    assert not allowed
+    assert retry_after == pytest.approx(0.5)
+
+    clock.now += 0.5
+    assert take(store, "k", rate)[0]
+    assert not take(store, "k", rate)[0]
+
+    # 오래 쉬어도 버킷 크기 이상은 쌓이지 않음
+    clock.now += 100
+    assert [take(store, "k", rate)[0] for _ in range(4)] == [True, True, True, False]
+
+
+def test_keys_are_independent(clock):
+    store = MemoryRateLimitStore()
+    rate = parse_rate("1/60")
+
+    assert take(store, "a", rate)[0]
+    assert not take(store, "a", rate)[0]
+    assert take(store, "b", rate)[0]
+
+
+def test_evicts_least_recently_used_keys(clock):
+    store = MemoryRateLimitStore(max_keys=2)
+    rate = parse_rate("1/60")
+    take(store, "a", rate)
+    take(store, "b", rate)
+    take(store, "a", rate)
+    take(store, "c", rate)
+
+    assert list(store.buckets) == ["a", "c"]
+
+
+def test_login_limited_per_email(client, monkeypatch):
+    monkeypatch.setattr(rate_limit.login_rate_limit, "email_rate", parse_rate("2/60"))
+    credentials = {"email": "nobody@example.com", "password": "wrong"}
+
+    statuses = [client.post("/api/auth/login", json=credentials).status_code for _ in range(3)]
+    assert statuses == [401, 401, 429]
+
+    limited = client.post("/api/auth/login", json={**credentials, "email": "NOBODY@example.com "})
+    assert limited.status_code == 429
+    assert limited.headers["Retry-After"] == "30"
+
+    # 다른 이메일은 별도 버킷
+    assert client.post("/api/auth/login", json={**credentials, "email": "other@example.com"}).status_code == 401
@@ -0,0 +1,73 @@
+"""리프레시 토큰 폐기 확인 - Bloom 필터(오탐만 가능) + set + revoked_tokens 테이블"""
+from datetime import datetime, timedelta
+from app import auth
+from app.token_revocation import BloomFilter, RevocationStore
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    keys = [f"jti-{i}" for i in range(1000)]
+    for key in keys:
+        bloom.add(key)
+
+    assert all(key in bloom for key in keys)
+
+
+def test_bloom_filter_false_positive_rate_near_target():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"jti-{i}")
+
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives / 10000 < 0.03
+
+
+def test_revoke_once_then_detect_reuse(db, make_user):
+    user = make_user("buyer@example.com")
+    store = RevocationStore(capacity=10)
+    expires_at = datetime.utcnow() + timedelta(days=1)
+
+    assert not store.is_revoked(db, "a")
+    assert store.revoke(db, "a", user.id, expires_at)
+    assert store.is_revoked(db, "a")
+    # 같은 jti를 다시 폐기 = 이미 사용된 토큰
+    assert not store.revoke(db, "a", user.id, expires_at)
+    assert not store.is_revoked(db, "b")
+
+
+def test_other_worker_loads_revoked_tokens(db, make_user):
+    user = make_user("buyer@example.com")
+    expires_at = datetime.utcnow() + timedelta(days=1)
+    RevocationStore(capacity=10).revoke(db, "revoked-elsewhere", user.id, expires_at)
+    RevocationStore(capacity=10).revoke(db, "expired", user.id, datetime.utcnow() - timedelta(seconds=1))
+
+    # 새로 뜬 워커 - 처음 확인할 때 테이블에서 적재 (만료된 행은 정리)
+    worker = RevocationStore(capacity=10)
+    assert worker.is_revoked(db, "revoked-elsewhere")
+    assert not worker.is_revoked(db, "expired")
+
+
+def test_filter_grows_past_capacity(db, make_user):
+    user = make_user("buyer@example.com")
+    store = RevocationStore(capacity=4)
+    store.load(db)
+    expires_at = datetime.utcnow() + timedelta(days=1)
+    for i in range(20):
+        store.revoke(db, f"jti-{i}", user.id, expires_at)
+
+    assert store.bloom.capacity >= 20
+    assert all(store.is_revoked(db, f"jti-{i}") for i in range(20))
+
+
+def test_refresh_token_reuse_revokes_all_tokens(client, make_user):
+    user = make_user("buyer@example.com")
+    refresh_token = auth.create_refresh_token(user)
+
+    first = client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+    assert first.status_code == 200
+    rotated = first.json()["refresh_token"]
+
+    # 이미 사용한 토큰을 다시 보내면 탈취로 보고 발급한 토큰 모두 무효화
+    reused = client.post("/api/auth/refresh", json={"refresh_token": refresh_token})
+    assert reused.status_code == 401
+    assert client.post("/api/auth/refresh", json={"refresh_token": rotated}).status_code == 401
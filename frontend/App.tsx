@@ -33,6 +33,7 @@ const App: React.FC = () => {
 
         try {
             const response = await fetch(`${API_BASE_URL}/api/auth/me`, {
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 }
@@ -78,6 +79,7 @@ const App: React.FC = () => {
             if (!token) return;
 
             const response = await fetch(`${API_BASE_URL}/api/cart`, {
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 }
@@ -95,6 +97,7 @@ const App: React.FC = () => {
     const fetchCurrentUser = async (token: string) => {
         try {
             const response = await fetch(`${API_BASE_URL}/api/auth/me`, {
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 }
@@ -117,6 +120,7 @@ const App: React.FC = () => {
         try {
             const response = await fetch(`${API_BASE_URL}/api/auth/login`, {
                 method: 'POST',
+                credentials: 'include',  // 게스트 장바구니 쿠키 전송 (로그인 시 병합)
                 headers: {
                     'Content-Type': 'application/json',
                 },
@@ -150,6 +154,7 @@ const App: React.FC = () => {
         try {
             const response = await fetch(`${API_BASE_URL}/api/auth/signup`, {
                 method: 'POST',
+                credentials: 'include',  // 게스트 장바구니 쿠키 전송 (로그인 시 병합)
                 headers: {
                     'Content-Type': 'application/json',
                 },
@@ -184,6 +189,7 @@ const App: React.FC = () => {
         try {
             const response = await fetch(`${API_BASE_URL}/api/auth/google`, {
                 method: 'POST',
+                credentials: 'include',  // 게스트 장바구니 쿠키 전송 (로그인 시 병합)
                 headers: {
                     'Content-Type': 'application/json',
                 },
@@ -24,6 +24,9 @@ const resources = {
         title: 'POV SEOUL',
         subtitle: 'Find Your Seoul.',
         cta: '지금 쇼핑하기',
+        newest: '신상품',
+        featuredSellers: '추천 판매자',
+        viewAll: '전체 보기',
       },
       products: {
         title: '우리의 컬렉션',
@@ -77,6 +80,9 @@ const resources = {
         title: 'POV SEOUL',
         subtitle: 'Find Your Seoul.',
         cta: 'Shop Now',
+        newest: 'New Arrivals',
+        featuredSellers: 'Featured Sellers',
+        viewAll: 'View All',
       },
       products: {
         title: 'Our Collection',
@@ -39,6 +39,7 @@ const CartPage: React.FC<CartPageProps> = ({ setRoute, onCartUpdate }) => {
             }
 
             const response = await fetch(`${API_BASE_URL}/api/cart`, {
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 }
@@ -62,6 +63,7 @@ const CartPage: React.FC<CartPageProps> = ({ setRoute, onCartUpdate }) => {
             const token = sessionStorage.getItem('access_token');
             const response = await fetch(`${API_BASE_URL}/api/cart/${itemId}`, {
                 method: 'DELETE',
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 }
@@ -90,6 +92,7 @@ const CartPage: React.FC<CartPageProps> = ({ setRoute, onCartUpdate }) => {
             const token = sessionStorage.getItem('access_token');
             const response = await fetch(`${API_BASE_URL}/api/cart/${itemId}?quantity=${newQuantity}`, {
                 method: 'PUT',
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 }
@@ -1,34 +1,135 @@
-import React from 'react';
+import React, { useState, useEffect } from 'react';
 import { useTranslation } from 'react-i18next';
 
+// 홈 피드 카드 (GET /api/products/home - 목록 카드와 같은 형식)
+interface ProductCard {
+    id: number;
+    name: string;
+    price: string;
+    image_url: string;
+    category_main: string;
+    category_sub?: string;
+    seller_name?: string;
+}
+
+interface FeaturedSeller {
+    id: number;
+    name: string;
+}
+
+interface HomeFeed {
+    newest: ProductCard[];
+    categories: { [key: string]: ProductCard[] };
+    featured_sellers: FeaturedSeller[];
+}
+
 interface HomePageProps {
     setRoute: (route: string) => void;
 }
 
+const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://127.0.0.1:8000';
+
 const HomePage: React.FC<HomePageProps> = ({ setRoute }) => {
+    const [feed, setFeed] = useState<HomeFeed | null>(null);
     const { t } = useTranslation();
 
+    useEffect(() => {
+        fetchFeed();
+    }, []);
+
+    const fetchFeed = async () => {
+        try {
+            // 서버가 ETag를 보내므로 브라우저 캐시가 재검증 (바뀌지 않았으면 304)
+            const response = await fetch(`${API_BASE_URL}/api/products/home`, { credentials: 'include' });
+            if (response.ok) {
+                setFeed(await response.json());
+            }
+        } catch (err) {
+            // 피드를 못 불러와도 메인 화면은 그대로 표시
+            console.error('홈 피드 조회 실패:', err);
+        }
+    };
+
     return (
-        <div className="relative h-[calc(100vh-4rem)] bg-cover bg-center" style={{ backgroundImage: "url('/mainbackground.png')" }}>
-            <div className="absolute inset-0 bg-black bg-opacity-10"></div>
-            <div className="relative z-10 flex flex-col justify-center items-center h-full text-center text-white px-4">
-                <h1 className="text-4xl md:text-6xl font-extrabold tracking-tight mb-4">
-                    {t('home.title')}
-                </h1>
-                <p className="max-w-2xl text-lg md:text-xl text-gray-200 mb-8">
-                    {t('home.subtitle')}
-                </p>
-                <a
-                    href="#products"
-                    onClick={(e) => {
-                        e.preventDefault();
-                        setRoute('products');
-                    }}
-                    className="bg-indigo-600 hover:bg-indigo-700 text-white font-bold py-3 px-8 rounded-full text-lg transition duration-300 ease-in-out transform hover:scale-105"
-                >
-                    {t('home.cta')}
-                </a>
+        <div>
+            <div className="relative h-[calc(100vh-4rem)] bg-cover bg-center" style={{ backgroundImage: "url('/mainbackground.png')" }}>
+                <div className="absolute inset-0 bg-black bg-opacity-10"></div>
+                <div className="relative z-10 flex flex-col justify-center items-center h-full text-center text-white px-4">
+                    <h1 className="text-4xl md:text-6xl font-extrabold tracking-tight mb-4">
+                        {t('home.title')}
+                    </h1>
+                    <p className="max-w-2xl text-lg md:text-xl text-gray-200 mb-8">
+                        {t('home.subtitle')}
+                    </p>
+                    <a
+                        href="#products"
+                        onClick={(e) => {
+                            e.preventDefault();
+                            setRoute('products');
+                        }}
+                        className="bg-indigo-600 hover:bg-indigo-700 text-white font-bold py-3 px-8 rounded-full text-lg transition duration-300 ease-in-out transform hover:scale-105"
+                    >
+                        {t('home.cta')}
+                    </a>
+                </div>
             </div>
+
+            {feed && feed.newest.length > 0 && (
+                <div className="max-w-7xl mx-auto py-12 px-4 sm:px-6 lg:px-8">
+                    <div className="flex justify-between items-center mb-8">
+                        <h2 className="text-2xl font-extrabold tracking-tight text-gray-900">
+                            {t('home.newest')}
+                        </h2>
+                        <button
+                            onClick={() => setRoute('products')}
+                            className="text-indigo-600 hover:text-indigo-700 font-medium"
+                        >
+                            {t('home.viewAll')}
+                        </button>
+                    </div>
+                    <div className="grid grid-cols-2 gap-y-10 sm:grid-cols-3 lg:grid-cols-4 gap-x-6 xl:gap-x-8">
+                        {feed.newest.map((product) => (
+                            <div
+                                key={product.id}
+                                onClick={() => setRoute(`product/${product.id}`)}
+                                className="group cursor-pointer"
+                            >
+                                <div className="w-full bg-gray-200 rounded-lg overflow-hidden" style={{ aspectRatio: '3/4' }}>
+                                    <img
+                                        src={product.image_url.startsWith('http') ? product.image_url : `${API_BASE_URL}${product.image_url}`}
+                                        alt={product.name}
+                                        loading="lazy"
+                                        className="w-full h-full object-cover group-hover:opacity-75 transition-opacity duration-300"
+                                    />
+                                </div>
+                                <h3 className="mt-2 text-sm text-gray-700">{product.name}</h3>
+                                <p className="mt-1 text-lg font-medium text-gray-900">{product.price}</p>
+                                {product.seller_name && (
+                                    <p className="mt-1 text-xs text-gray-500">판매자: {product.seller_name}</p>
+                                )}
+                            </div>
+                        ))}
+                    </div>
+
+                    {feed.featured_sellers.length > 0 && (
+                        <div className="mt-12">
+                            <h2 className="text-2xl font-extrabold tracking-tight text-gray-900 mb-4">
+                                {t('home.featuredSellers')}
+                            </h2>
+                            <div className="flex flex-wrap gap-2">
+                                {feed.featured_sellers.map((seller) => (
+                                    <span
+                                        key={seller.id}
+                                        className="px-4 py-2 rounded-full bg-gray-100 text-gray-700 font-medium"
+                                    >
+                                        {seller.name}
+                                    </span>
+                                ))}
+                            </div>
+                        </div>
+                    )}
+                </div>
+            )}
         </div>
     );
 };
@@ -88,6 +88,7 @@ const MyPage: React.FC<MyPageProps> = ({ setRoute, currentUser }) => {
         try {
             const token = sessionStorage.getItem('access_token');
             const response = await fetch(`${API_BASE_URL}/api/sellers/me`, {
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 }
@@ -106,6 +107,7 @@ const MyPage: React.FC<MyPageProps> = ({ setRoute, currentUser }) => {
         try {
             const token = sessionStorage.getItem('access_token');
             const response = await fetch(`${API_BASE_URL}/api/orders`, {
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 }
@@ -126,6 +128,7 @@ const MyPage: React.FC<MyPageProps> = ({ setRoute, currentUser }) => {
         try {
             const token = sessionStorage.getItem('access_token');
             const response = await fetch(`${API_BASE_URL}/api/products/my/products`, {
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 }
@@ -362,6 +365,7 @@ const SellerEditModal: React.FC<{
 
             const response = await fetch(`${API_BASE_URL}/api/sellers/me`, {
                 method: 'PUT',
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 },
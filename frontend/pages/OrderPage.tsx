@@ -83,6 +83,7 @@ const OrderPage: React.FC<OrderPageProps> = ({ setRoute, onCartUpdate}) => {
 
             const response = await fetch(`${API_BASE_URL}/api/orders`, {
                 method: 'POST',
+                credentials: 'include',
                 headers: {
                     'Content-Type': 'application/json',
                     'Authorization': `Bearer ${token}`
@@ -109,6 +110,7 @@ const OrderPage: React.FC<OrderPageProps> = ({ setRoute, onCartUpdate}) => {
             for (const item of sellerItems) {
                 await fetch(`${API_BASE_URL}/api/cart/${item.id}`, {
                     method: 'DELETE',
+                    credentials: 'include',
                     headers: {
                         'Authorization': `Bearer ${token}`
                     }
@@ -50,7 +50,7 @@ const ProductDetailPage: React.FC<ProductDetailPageProps> = ({ productId, setRou
 
     const fetchProduct = async () => {
         try {
-            const response = await fetch(`${API_BASE_URL}/api/products/${productId}`);
+            const response = await fetch(`${API_BASE_URL}/api/products/${productId}`, { credentials: 'include' });
             if (!response.ok) {
                 if (response.status === 404) {
                     setError('제품을 찾을 수 없습니다.');
@@ -70,7 +70,7 @@ const ProductDetailPage: React.FC<ProductDetailPageProps> = ({ productId, setRou
 
     const fetchCategories = async () => {
         try {
-            const response = await fetch(`${API_BASE_URL}/api/products/categories`);
+            const response = await fetch(`${API_BASE_URL}/api/products/categories`, { credentials: 'include' });
             if (response.ok) {
                 const data = await response.json();
                 setCategories(data);
@@ -82,18 +82,16 @@ const ProductDetailPage: React.FC<ProductDetailPageProps> = ({ productId, setRou
 
     const addToCart = async () => {
         const token = sessionStorage.getItem('access_token');
-        if (!token) {
-            alert('로그인이 필요합니다.');
-            return;
-        }
 
         setIsAddingToCart(true);
         try {
-            const response = await fetch(`${API_BASE_URL}/api/cart`, {
+            // 비로그인 상태면 게스트 장바구니(쿠키)에 담고, 로그인 시 서버에서 합쳐짐
+            const response = await fetch(`${API_BASE_URL}/api/cart${token ? '' : '/guest'}`, {
                 method: 'POST',
+                credentials: 'include',
                 headers: {
                     'Content-Type': 'application/json',
-                    'Authorization': `Bearer ${token}`
+                    ...(token ? { 'Authorization': `Bearer ${token}` } : {})
                 },
                 body: JSON.stringify({
                     product_id: parseInt(productId),
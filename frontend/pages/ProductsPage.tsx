@@ -1,19 +1,15 @@
 import React, { useState, useEffect } from 'react';
 import { useTranslation } from 'react-i18next';
 
+// 목록 그리드용 경량 상품 (GET /api/products?view=card)
 interface Product {
     id: number;
     name: string;
     price: string;
-    description: string;
     image_url: string;
-    seller_id: number;
     category_main: string;
     category_sub?: string;
-    seller?: {
-        id: number;
-        name: string;
-    };
+    seller_name?: string;
 }
 
 interface ProductsPageProps {
@@ -67,7 +63,7 @@ const ProductsPage: React.FC<ProductsPageProps> = ({ setRoute }) => {
 
         if (searchQuery.trim() !== '') {
             filtered = filtered.filter(product => 
-                product.seller?.name.toLowerCase().includes(searchQuery.toLowerCase()) ||
+                product.seller_name?.toLowerCase().includes(searchQuery.toLowerCase()) ||
                 product.name.toLowerCase().includes(searchQuery.toLowerCase())
             );
         }
@@ -78,7 +74,7 @@ const ProductsPage: React.FC<ProductsPageProps> = ({ setRoute }) => {
 
     const fetchProducts = async () => {
         try {
-            const response = await fetch(`${API_BASE_URL}/api/products`);
+            const response = await fetch(`${API_BASE_URL}/api/products?view=card`, { credentials: 'include' });
             if (!response.ok) {
                 throw new Error(t('products.errorLoadFailed', '상품을 불러오는데 실패했습니다.'));
             }
@@ -94,7 +90,7 @@ const ProductsPage: React.FC<ProductsPageProps> = ({ setRoute }) => {
 
     const fetchCategories = async () => {
         try {
-            const response = await fetch(`${API_BASE_URL}/api/products/categories`);
+            const response = await fetch(`${API_BASE_URL}/api/products/categories`, { credentials: 'include' });
             if (response.ok) {
                 const data = await response.json();
                 setCategories(data);
@@ -276,8 +272,8 @@ const ProductsPage: React.FC<ProductsPageProps> = ({ setRoute }) => {
                                     </div>
                                     <h3 className="mt-2 text-sm text-gray-700">{product.name}</h3>
                                     <p className="mt-1 text-lg font-medium text-gray-900">{product.price}</p>
-                                    {product.seller && (
-                                        <p className="mt-1 text-xs text-gray-500">판매자: {product.seller.name}</p>
+                                    {product.seller_name && (
+                                        <p className="mt-1 text-xs text-gray-500">판매자: {product.seller_name}</p>
                                     )}
                                 </div>
                             ))}
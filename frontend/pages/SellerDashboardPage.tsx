@@ -113,7 +113,7 @@ const SellerDashboardPage: React.FC<SellerDashboardPageProps> = ({ setRoute }) =
 
     const fetchCategories = async () => {
         try {
-            const response = await fetch(`${API_BASE_URL}/api/products/categories`);
+            const response = await fetch(`${API_BASE_URL}/api/products/categories`, { credentials: 'include' });
             if (response.ok) {
                 const data = await response.json();
                 setCategories(data);
@@ -127,6 +127,7 @@ const SellerDashboardPage: React.FC<SellerDashboardPageProps> = ({ setRoute }) =
         try {
             const token = sessionStorage.getItem('access_token');
             const response = await fetch(`${API_BASE_URL}/api/products/my/products`, {
+                credentials: 'include',
                 headers: { 'Authorization': `Bearer ${token}` }
             });
             if (response.ok) {
@@ -142,6 +143,7 @@ const SellerDashboardPage: React.FC<SellerDashboardPageProps> = ({ setRoute }) =
         try {
             const token = sessionStorage.getItem('access_token');
             const response = await fetch(`${API_BASE_URL}/api/sellers/orders`, {
+                credentials: 'include',
                 headers: { 'Authorization': `Bearer ${token}` }
             });
             if (response.ok) {
@@ -230,6 +232,7 @@ const SellerDashboardPage: React.FC<SellerDashboardPageProps> = ({ setRoute }) =
 
             const response = await fetch(url, {
                 method: method,
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 },
@@ -340,6 +343,7 @@ const SellerDashboardPage: React.FC<SellerDashboardPageProps> = ({ setRoute }) =
             const token = sessionStorage.getItem('access_token');
             const response = await fetch(`${API_BASE_URL}/api/products/${productId}`, {
                 method: 'DELETE',
+                credentials: 'include',
                 headers: { 'Authorization': `Bearer ${token}` }
             });
 
@@ -356,6 +360,7 @@ const SellerDashboardPage: React.FC<SellerDashboardPageProps> = ({ setRoute }) =
             const token = sessionStorage.getItem('access_token');
             const response = await fetch(`${API_BASE_URL}/api/sellers/orders/${orderId}/status`, {
                 method: 'PUT',
+                credentials: 'include',
                 headers: {
                     'Content-Type': 'application/json',
                     'Authorization': `Bearer ${token}`
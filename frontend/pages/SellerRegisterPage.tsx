@@ -52,6 +52,7 @@ const SellerRegisterPage: React.FC<SellerRegisterPageProps> = ({ setRoute, refre
 
             const response = await fetch(`${API_BASE_URL}/api/sellers`, {
                 method: 'POST',
+                credentials: 'include',
                 headers: {
                     'Authorization': `Bearer ${token}`
                 },